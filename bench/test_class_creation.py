@@ -0,0 +1,253 @@
+"""
+Benchmark the phases of class creation using CodSpeed.
+
+Each benchmark only measures a single phase of what `attrs.define` does, such
+that regressions can be pinned to one of them.  Everything that's necessary to
+reach the phase is prepared outside of the measured function.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+import attr
+import attrs
+
+from attr import _compat
+from attr._make import (
+    _attrs_to_init_script,
+    _ClassBuilder,
+    _compile_and_eval,
+    _transform_attrs,
+)
+
+
+FIELD_COUNTS = [1, 10, 100, 500]
+DEPTHS = [1, 5, 20]
+
+field_counts = pytest.mark.parametrize("n", FIELD_COUNTS)
+
+
+def _raw_class(n, validator=None, converter=None, bases=(object,), prefix=""):
+    """
+    Create a class with *n* `attr.ib`\\ s that hasn't been touched by *attrs*
+    yet.
+    """
+    return type(
+        f"C{prefix}{n}",
+        bases,
+        {
+            f"{prefix}f{i}": attr.ib(
+                default=i, validator=validator, converter=converter
+            )
+            for i in range(n)
+        },
+    )
+
+
+def _annotated_class(n):
+    """
+    Create a class with *n* annotated fields that hasn't been touched by
+    *attrs* yet.
+    """
+    return type(
+        f"A{n}",
+        (object,),
+        {
+            "__annotations__": {f"f{i}": int for i in range(n)},
+            **{f"f{i}": i for i in range(n)},
+        },
+    )
+
+
+def _builder(cls, slots=True, frozen=False):
+    return _ClassBuilder(
+        cls,
+        None,
+        slots,
+        frozen,
+        True,
+        False,
+        False,
+        False,
+        False,
+        False,
+        True,
+        None,
+        False,
+        None,
+    )
+
+
+def _init_script(cls, frozen=False, slots=True):
+    attrs_ = _transform_attrs(cls, None, False, False, True, None).attrs
+
+    return _attrs_to_init_script(
+        attrs_,
+        frozen,
+        slots,
+        False,
+        False,
+        False,
+        False,
+        {},
+        False,
+        False,
+        False,
+        "__init__",
+    )
+
+
+def _init_globs(cls):
+    """
+    The globals that are added to the ones returned by
+    `_attrs_to_init_script` before the script is evaluated.
+    """
+    return {
+        "NOTHING": attr.NOTHING,
+        "attr_dict": {
+            a.name: a
+            for a in _transform_attrs(
+                cls, None, False, False, True, None
+            ).attrs
+        },
+    }
+
+
+@field_counts
+def test_transform_attrs(benchmark, n):
+    """
+    Benchmark collecting `attr.ib`\\ s into `attrs.Attribute`\\ s.
+    """
+    cls = _raw_class(n)
+
+    benchmark(_transform_attrs, cls, None, False, False, True, None)
+
+
+@field_counts
+def test_collect_annotations(benchmark, n):
+    """
+    Benchmark looking up the annotations of a class.
+    """
+    cls = _annotated_class(n)
+
+    benchmark(_compat._get_annotations, cls)
+
+
+@field_counts
+def test_transform_attrs_auto_attribs(benchmark, n):
+    """
+    Benchmark collecting annotated fields into `attrs.Attribute`\\ s.
+    """
+    cls = _annotated_class(n)
+
+    benchmark(_transform_attrs, cls, None, True, False, True, None)
+
+
+@pytest.mark.parametrize("depth", DEPTHS)
+def test_transform_attrs_inheritance(benchmark, depth):
+    """
+    Benchmark collecting fields from a deep class hierarchy with 5 fields per
+    class.
+    """
+    base = object
+    for i in range(depth):
+        base = attr.s(_raw_class(5, bases=(base,), prefix=f"d{i}_"))
+
+    cls = _raw_class(5, bases=(base,), prefix="leaf_")
+
+    benchmark(_transform_attrs, cls, None, False, False, True, None)
+
+
+@field_counts
+@pytest.mark.parametrize("frozen", [True, False])
+@pytest.mark.parametrize("slots", [True, False])
+def test_init_script(benchmark, n, frozen, slots):
+    """
+    Benchmark generating the script of ``__init__``.
+    """
+    cls = _raw_class(n)
+
+    benchmark(_init_script, cls, frozen, slots)
+
+
+@field_counts
+@pytest.mark.parametrize(
+    ("validator", "converter"),
+    [
+        (attrs.validators.instance_of(int), None),
+        (None, int),
+        (attrs.validators.instance_of(int), int),
+    ],
+    ids=["validators", "converters", "both"],
+)
+def test_init_script_validators_converters(benchmark, n, validator, converter):
+    """
+    Benchmark generating the script of ``__init__`` for fields with
+    validators and/or converters.
+    """
+    cls = _raw_class(n, validator=validator, converter=converter)
+
+    benchmark(_init_script, cls)
+
+
+@field_counts
+def test_compile(benchmark, n):
+    """
+    Benchmark compiling the script of ``__init__`` without any caching.
+    """
+    script, _, _ = _init_script(_raw_class(n))
+
+    benchmark(compile, script, f"<bench {n}>", "exec")
+
+
+@field_counts
+def test_compile_and_eval(benchmark, n):
+    """
+    Benchmark compiling and evaluating the script of ``__init__`` the way
+    *attrs* does it -- including its in-process caches.
+    """
+    cls = _raw_class(n)
+    script, globs, _ = _init_script(cls)
+    globs.update(_init_globs(cls))
+
+    benchmark(_compile_and_eval, script, globs, {}, f"<bench {n}>")
+
+
+@field_counts
+@pytest.mark.parametrize("frozen", [True, False])
+def test_create_slots_class(benchmark, n, frozen):
+    """
+    Benchmark creating the new class for slotted classes.
+    """
+    b = _builder(_raw_class(n), frozen=frozen)
+
+    benchmark(b._create_slots_class)
+
+
+@field_counts
+@pytest.mark.parametrize("frozen", [True, False])
+@pytest.mark.parametrize("slots", [True, False])
+def test_define(benchmark, n, frozen, slots):
+    """
+    Benchmark the whole pipeline for a class with *n* fields.
+    """
+
+    def define():
+        attrs.define(_annotated_class(n), frozen=frozen, slots=slots)
+
+    benchmark(define)
+
+
+@field_counts
+def test_define_validators_converters(benchmark, n):
+    """
+    Benchmark the whole pipeline for a class with *n* fields that have both,
+    validators and converters.
+    """
+    v = attrs.validators.instance_of(int)
+
+    def define():
+        attrs.define(_raw_class(n, validator=v, converter=int))
+
+    benchmark(define)
@@ -0,0 +1,418 @@
+"""
+Benchmark asdict, astuple, iter_json, evolve, assoc, and bulk instantiation on
+deep and wide object graphs using CodSpeed.
+
+The ``test_peak_memory_*`` tests also measure peak memory using
+`tracemalloc` and record it as the ``peak_memory`` property, such that it ends
+up in JUnit XML reports (``--junitxml``).
+"""
+
+from __future__ import annotations
+
+import io
+import json
+import tracemalloc
+
+import pytest
+
+import attr
+import attrs
+
+
+pytestmark = pytest.mark.benchmark()
+
+DEPTH = 10
+WIDE = 100_000
+
+
+@attrs.frozen
+class Leaf:
+    a: int = 1
+    b: str = "b"
+    c: float = 3.0
+    d: tuple = (1, 2, 3)
+
+
+@attrs.frozen
+class Node:
+    value: int
+    leaf: Leaf
+    child: Node | None = None
+
+
+@attrs.define
+class Record:
+    id: int
+    name: str
+    tags: list[str]
+    attributes: dict[str, int]
+    leaf: Leaf
+
+
+@attrs.define
+class Container:
+    records: list[Record]
+    by_leaf: dict[Leaf, Record]
+    unique: frozenset[Leaf]
+    pairs: tuple[tuple[int, Leaf], ...]
+
+
+@attrs.define
+class Index:
+    by_id: dict[int, Record]
+    names: frozenset[str]
+    pairs: tuple[tuple[int, Leaf], ...]
+
+
+@attrs.frozen
+class Wide:
+    f00: int = 0
+    f01: int = 1
+    f02: int = 2
+    f03: int = 3
+    f04: int = 4
+    f05: int = 5
+    f06: int = 6
+    f07: int = 7
+    f08: int = 8
+    f09: int = 9
+    f10: str = "10"
+    f11: str = "11"
+    f12: str = "12"
+    f13: str = "13"
+    f14: str = "14"
+    f15: str = "15"
+    f16: str = "16"
+    f17: str = "17"
+    f18: str = "18"
+    f19: str = "19"
+    f20: tuple = ()
+    f21: tuple = ()
+    f22: tuple = ()
+    f23: tuple = ()
+    f24: tuple = ()
+    f25: float = 25.0
+    f26: float = 26.0
+    f27: float = 27.0
+    f28: float = 28.0
+    f29: float = 29.0
+
+
+def _deep(depth=DEPTH):
+    node = None
+    for i in range(depth):
+        node = Node(i, Leaf(a=i), node)
+
+    return node
+
+
+def _records(n):
+    return [
+        Record(i, f"record {i}", ["a", "b"], {"x": i}, Leaf(a=i))
+        for i in range(n)
+    ]
+
+
+@pytest.fixture(name="deep", scope="module")
+def _deep_fixture():
+    return _deep()
+
+
+@pytest.fixture(name="wide", scope="module")
+def _wide():
+    return Container(
+        records=_records(WIDE),
+        by_leaf={},
+        unique=frozenset(),
+        pairs=(),
+    )
+
+
+@pytest.fixture(name="keyed", scope="module")
+def _keyed():
+    records = _records(1_000)
+
+    return Container(
+        records=[],
+        by_leaf={r.leaf: r for r in records},
+        unique=frozenset(r.leaf for r in records),
+        pairs=tuple((r.id, r.leaf) for r in records),
+    )
+
+
+@pytest.fixture(name="indexed", scope="module")
+def _indexed():
+    """
+    Like *keyed*, but without instances as dict keys or set members, because
+    asdict turns them into unhashable dicts.
+    """
+    records = _records(1_000)
+
+    return Index(
+        by_id={r.id: r for r in records},
+        names=frozenset(r.name for r in records),
+        pairs=tuple((r.id, r.leaf) for r in records),
+    )
+
+
+def _only_ints(attribute, value):
+    return not isinstance(value, str)
+
+
+def _serialize(inst, field, value):
+    if isinstance(value, float):
+        return str(value)
+
+    return value
+
+
+def test_asdict_deep(deep):
+    """
+    Benchmark asdict on a tree that's 10 levels deep.
+    """
+    for _ in range(1_000):
+        attrs.asdict(deep)
+
+
+def test_asdict_wide(wide):
+    """
+    Benchmark asdict on a list of 100k instances.
+    """
+    attrs.asdict(wide)
+
+
+def test_asdict_indexed(indexed):
+    """
+    Benchmark asdict on dicts of, sets, and tuples of instances.
+    """
+    for _ in range(10):
+        attrs.asdict(indexed)
+
+
+def test_asdict_retain_collection_types(indexed):
+    """
+    Benchmark asdict with retain_collection_types=True.
+    """
+    for _ in range(10):
+        attr.asdict(indexed, retain_collection_types=True)
+
+
+def test_astuple_keyed(keyed):
+    """
+    Benchmark astuple on dicts keyed by, sets, and tuples of instances.
+    """
+    for _ in range(10):
+        attrs.astuple(keyed)
+
+
+def test_asdict_filter(deep):
+    """
+    Benchmark asdict with a filter.
+    """
+    for _ in range(1_000):
+        attrs.asdict(deep, filter=_only_ints)
+
+
+def test_asdict_value_serializer(deep):
+    """
+    Benchmark asdict with a value serializer.
+    """
+    for _ in range(1_000):
+        attrs.asdict(deep, value_serializer=_serialize)
+
+
+def test_asdict_flat():
+    """
+    Benchmark asdict on a flat instance with 30 fields without recursion.
+    """
+    w = Wide()
+
+    for _ in range(10_000):
+        attrs.asdict(w, recurse=False)
+
+
+def test_astuple_deep(deep):
+    """
+    Benchmark astuple on a tree that's 10 levels deep.
+    """
+    for _ in range(1_000):
+        attrs.astuple(deep)
+
+
+def test_astuple_wide(wide):
+    """
+    Benchmark astuple on a list of 100k instances.
+    """
+    attrs.astuple(wide)
+
+
+def test_astuple_retain_collection_types(keyed):
+    """
+    Benchmark astuple with retain_collection_types=True.
+    """
+    for _ in range(10):
+        attr.astuple(keyed, retain_collection_types=True)
+
+
+def test_astuple_filter(deep):
+    """
+    Benchmark astuple with a filter.
+    """
+    for _ in range(1_000):
+        attrs.astuple(deep, filter=_only_ints)
+
+
+def test_json_via_asdict(wide):
+    """
+    Benchmark encoding 100k instances as JSON using asdict as a baseline.
+    """
+    json.dumps(
+        attrs.asdict(wide),
+        separators=(",", ":"),
+        ensure_ascii=False,
+        default=list,
+    )
+
+
+def test_iter_json_wide(wide):
+    """
+    Benchmark streaming 100k instances as JSON.
+    """
+    for _ in attrs.iter_json(wide):
+        pass
+
+
+def test_iter_json_deep(deep):
+    """
+    Benchmark streaming a tree that's 10 levels deep as JSON.
+    """
+    for _ in range(1_000):
+        for _ in attrs.iter_json(deep):
+            pass
+
+
+def test_evolve_one_field():
+    """
+    Benchmark changing a single field of a frozen instance with 30 fields.
+    """
+    w = Wide()
+
+    for i in range(10_000):
+        attrs.evolve(w, f00=i)
+
+
+def test_evolve_many_fields():
+    """
+    Benchmark changing ten fields of a frozen instance with 30 fields.
+    """
+    w = Wide()
+    changes = {f"f{i:02}": i for i in range(10)}
+
+    for _ in range(10_000):
+        attrs.evolve(w, **changes)
+
+
+def test_evolve_deep(deep):
+    """
+    Benchmark replacing the root of a deep tree.
+    """
+    for i in range(10_000):
+        attrs.evolve(deep, value=i)
+
+
+def test_assoc_one_field():
+    """
+    Benchmark the deprecated assoc on a frozen instance with 30 fields.
+    """
+    w = Wide()
+
+    for i in range(10_000):
+        attr.assoc(w, f00=i)
+
+
+ROWS = [(i, f"record {i}", 1.0 * i) for i in range(WIDE)]
+
+
+@attrs.frozen
+class Row:
+    id: int = attrs.field(validator=attrs.validators.instance_of(int))
+    name: str
+    score: float = attrs.field(converter=float)
+
+
+def test_instantiate_rows():
+    """
+    Benchmark instantiating 100k instances one at a time as a baseline.
+    """
+    [Row(*row) for row in ROWS]
+
+
+def test_from_rows():
+    """
+    Benchmark instantiating 100k instances from rows.
+    """
+    attrs.from_rows(Row, ROWS)
+
+
+def test_from_columns():
+    """
+    Benchmark instantiating 100k instances from columns.
+    """
+    attrs.from_columns(
+        Row,
+        id=range(WIDE),
+        name=[f"record {i}" for i in range(WIDE)],
+        score=range(WIDE),
+    )
+
+
+def _peak_memory(func, *args, **kwargs):
+    tracemalloc.start()
+    try:
+        func(*args, **kwargs)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return peak
+
+
+@pytest.mark.parametrize(
+    "func", [attrs.asdict, attrs.astuple], ids=["asdict", "astuple"]
+)
+def test_peak_memory_wide(record_property, wide, func):
+    """
+    Measure the peak memory of serializing 100k instances.
+    """
+    record_property("peak_memory", _peak_memory(func, wide))
+
+
+@pytest.mark.parametrize(
+    "func", [attrs.asdict, attrs.astuple], ids=["asdict", "astuple"]
+)
+def test_peak_memory_deep(record_property, deep, func):
+    """
+    Measure the peak memory of serializing a tree that's 10 levels deep.
+    """
+    record_property("peak_memory", _peak_memory(func, deep))
+
+
+def _dump_json(inst):
+    attrs.dump_json(inst, io.BytesIO())
+
+
+def _dump_json_via_asdict(inst):
+    # attrs.asdict retains frozensets, which dump_json encodes as arrays.
+    json.dump(attrs.asdict(inst), io.StringIO(), default=list)
+
+
+@pytest.mark.parametrize(
+    "func",
+    [_dump_json, _dump_json_via_asdict],
+    ids=["dump_json", "asdict_json_dump"],
+)
+def test_peak_memory_json(record_property, wide, func):
+    """
+    Measure the peak memory of writing 100k instances as JSON.
+    """
+    record_property("peak_memory", _peak_memory(func, wide))
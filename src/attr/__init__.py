@@ -11,7 +11,16 @@ from . import converters, exceptions, filters, setters, validators
 from ._cmp import cmp_using
 from ._compat import Protocol
 from ._config import get_run_validators, set_run_validators
-from ._funcs import asdict, assoc, astuple, evolve, has, resolve_types
+from ._funcs import (
+    asdict,
+    assoc,
+    astuple,
+    evolve,
+    from_columns,
+    from_rows,
+    has,
+    resolve_types,
+)
 from ._make import (
     NOTHING,
     Attribute,
@@ -21,10 +30,13 @@ from ._make import (
     attrs,
     fields,
     fields_dict,
+    finalize_module,
     make_class,
     validate,
 )
+from ._json import dump_json, iter_json
 from ._next_gen import define, field, frozen, mutable
+from ._repr import ReprLimit, repr_limit
 from ._version_info import VersionInfo
 
 
@@ -43,6 +55,7 @@ __all__ = [
     "Converter",
     "Factory",
     "NOTHING",
+    "ReprLimit",
     "asdict",
     "assoc",
     "astuple",
@@ -53,18 +66,24 @@ __all__ = [
     "cmp_using",
     "converters",
     "define",
+    "dump_json",
     "evolve",
     "exceptions",
     "field",
     "fields",
     "fields_dict",
     "filters",
+    "finalize_module",
+    "from_columns",
+    "from_rows",
     "frozen",
     "get_run_validators",
     "has",
     "ib",
+    "iter_json",
     "make_class",
     "mutable",
+    "repr_limit",
     "resolve_types",
     "s",
     "set_run_validators",
@@ -1,11 +1,17 @@
 import enum
 import sys
 
+from contextlib import AbstractContextManager
+from types import ModuleType
 from typing import (
     Any,
     Callable,
     Generic,
+    IO,
+    Iterable,
+    Iterator,
     Mapping,
+    NamedTuple,
     Protocol,
     Sequence,
     TypeVar,
@@ -278,6 +284,11 @@ def attrs(
     field_transformer: _FieldTransformer | None = ...,
     match_args: bool = ...,
     unsafe_hash: bool | None = ...,
+    lazy_methods: bool = ...,
+    defer: bool = ...,
+    incremental_hash: bool = ...,
+    intern: bool = ...,
+    repr_limit: ReprLimit | bool | None = ...,
 ) -> _C: ...
 @overload
 @dataclass_transform(order_default=True, field_specifiers=(attrib, field))
@@ -306,8 +317,14 @@ def attrs(
     field_transformer: _FieldTransformer | None = ...,
     match_args: bool = ...,
     unsafe_hash: bool | None = ...,
+    lazy_methods: bool = ...,
+    defer: bool = ...,
+    incremental_hash: bool = ...,
+    intern: bool = ...,
+    repr_limit: ReprLimit | bool | None = ...,
 ) -> Callable[[_C], _C]: ...
 def fields(cls: type[AttrsInstance]) -> Any: ...
+def finalize_module(module: ModuleType | str) -> ModuleType: ...
 def fields_dict(cls: type[AttrsInstance]) -> dict[str, Attribute[Any]]: ...
 def validate(inst: AttrsInstance) -> None: ...
 def resolve_types(
@@ -375,6 +392,39 @@ def astuple(
 def has(cls: type) -> TypeGuard[type[AttrsInstance]]: ...
 def assoc(inst: _T, **changes: Any) -> _T: ...
 def evolve(inst: _T, **changes: Any) -> _T: ...
+def from_rows(cls: type[_T], rows: Iterable[Sequence[Any]]) -> list[_T]: ...
+def from_columns(cls: type[_T], **columns: Iterable[Any]) -> list[_T]: ...
+
+# _json --
+
+def iter_json(
+    inst: AttrsInstance,
+    *,
+    filter: _FilterType[Any] | None = ...,
+    value_serializer: Callable[[type, Attribute[Any], Any], Any] | None = ...,
+    default: Callable[[Any], Any] | None = ...,
+    chunk_size: int = ...,
+) -> Iterator[bytes]: ...
+def dump_json(
+    inst: AttrsInstance,
+    fp: IO[bytes] | IO[str],
+    *,
+    filter: _FilterType[Any] | None = ...,
+    value_serializer: Callable[[type, Attribute[Any], Any], Any] | None = ...,
+    default: Callable[[Any], Any] | None = ...,
+    chunk_size: int = ...,
+) -> None: ...
+
+# _repr --
+
+class ReprLimit(NamedTuple):
+    length: int = ...
+    items: int = ...
+    depth: int = ...
+
+def repr_limit(
+    *, length: int = ..., items: int = ..., depth: int = ...
+) -> AbstractContextManager[ReprLimit]: ...
 
 # _config --
 
@@ -0,0 +1,286 @@
+# SPDX-License-Identifier: MIT
+
+"""
+Caches for the code objects of generated methods.
+
+Structurally identical classes (same field names, same kinds of defaults,
+converters, and flags) lead to identical scripts, therefore compiled code
+objects are memoized in-process by their script and only their filename is
+replaced for the class at hand.
+
+Additionally, there's a persistent on-disk cache.  It's opt-in by setting the
+``ATTRS_CODE_CACHE`` environment variable before *attrs* is imported.  Code
+objects are stored marshalled in one file per defining module in the
+``__pycache__`` directory next to it -- just like Python does it for bytecode.
+
+Entries are keyed by a hash of the generated script and its filename, so
+changes to the generated code (for example, by upgrading *attrs*)
+automatically lead to cache misses.  The files themselves are tagged with the
+interpreter's cache tag and guarded by its bytecode magic number such that
+changing the Python version never loads incompatible code objects.
+"""
+
+import atexit
+import contextlib
+import hashlib
+import importlib.util
+import marshal
+import os
+import sys
+import threading
+import types
+
+from pathlib import Path
+from typing import NamedTuple
+
+
+_MAGIC = importlib.util.MAGIC_NUMBER
+_TAG = sys.implementation.cache_tag
+
+# Cache file path -> _ModuleCodeCache
+_caches = {}
+
+
+class _ModuleCodeCache:
+    """
+    Code objects of all generated methods of a single module.
+
+    Only entries that have been used by the current process are written back,
+    therefore stale entries from previous *attrs* versions are pruned
+    automatically.
+    """
+
+    __slots__ = ("_codes", "_dirty", "_used", "path")
+
+    def __init__(self, path):
+        self.path = path
+        self._codes = self._load()
+        self._used = {}
+        self._dirty = False
+
+    def _load(self):
+        try:
+            data = self.path.read_bytes()
+        except OSError:
+            return {}
+
+        if data[: len(_MAGIC)] != _MAGIC:
+            return {}
+
+        try:
+            # The file lives next to the module's bytecode and is written by
+            # attrs itself, so it's exactly as trustworthy as the bytecode.
+            codes = marshal.loads(data[len(_MAGIC) :])  # noqa: S302
+        except (EOFError, ValueError, TypeError):
+            return {}
+
+        if not isinstance(codes, dict):
+            return {}
+
+        return codes
+
+    def get(self, key):
+        code = self._codes.get(key)
+        if code is not None:
+            self._used[key] = code
+
+        return code
+
+    def set(self, key, code):
+        self._codes[key] = self._used[key] = code
+        self._dirty = True
+
+    def flush(self):
+        """
+        Write all used entries to disk, if anything changed.
+
+        Failures are ignored the same way Python ignores failures to write
+        bytecode files.
+        """
+        if not self._dirty and len(self._used) == len(self._codes):
+            return
+
+        tmp = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp.write_bytes(_MAGIC + marshal.dumps(self._used))
+            tmp.replace(self.path)
+        except (OSError, ValueError):
+            with contextlib.suppress(OSError):
+                tmp.unlink()
+        else:
+            self._codes = dict(self._used)
+            self._dirty = False
+
+
+def _module_name_for_filename(filename):
+    """
+    Find the name of the module that defines the class whose method has been
+    given *filename* by `_generate_unique_filename`.
+
+    Return `None` if it can't be determined.
+    """
+    if not filename.startswith("<attrs generated "):
+        return None
+
+    # "<attrs generated __init__ mod.ule.Cls.Inner>" or "...Inner-2>"
+    qualified = filename[1:-1].rsplit(" ", 1)[-1]
+    parts = qualified.split(".")
+    for i in range(len(parts) - 1, 0, -1):
+        name = ".".join(parts[:i])
+        if name in sys.modules:
+            return name
+
+    return None
+
+
+def _cache_path_for(module_name):
+    """
+    Return the path of the cache file for *module_name* or `None` if the
+    module doesn't live in a file.
+    """
+    if _TAG is None:
+        return None
+
+    path = getattr(sys.modules.get(module_name), "__file__", None)
+    if not path:
+        return None
+
+    path = Path(path)
+
+    return path.parent / "__pycache__" / f"{path.stem}.attrs.{_TAG}.bin"
+
+
+def _get_cache(filename):
+    module_name = _module_name_for_filename(filename)
+    if module_name is None:
+        return None
+
+    path = _cache_path_for(module_name)
+    if path is None:
+        return None
+
+    cache = _caches.get(path)
+    if cache is None:
+        cache = _caches[path] = _ModuleCodeCache(path)
+
+    return cache
+
+
+def _make_key(script, filename):
+    h = hashlib.sha256(filename.encode("utf-8"))
+    h.update(b"\0")
+    h.update(script.encode("utf-8"))
+
+    return h.hexdigest()
+
+
+def _compile(script, filename):
+    return compile(script, filename, "exec")
+
+
+def compile_cached(script, filename):
+    """
+    Return the code object for *script* compiled using *filename*, but try to
+    load it from the on-disk cache first.
+    """
+    cache = _get_cache(filename)
+    if cache is None:
+        return _compile(script, filename)
+
+    key = _make_key(script, filename)
+    code = cache.get(key)
+    if code is None:
+        code = _compile(script, filename)
+        cache.set(key, code)
+
+    return code
+
+
+def _replace_filename(code, filename):
+    """
+    Return a copy of *code* and all code objects nested within that claim to
+    come from *filename*.
+    """
+    consts = tuple(
+        _replace_filename(c, filename) if isinstance(c, types.CodeType) else c
+        for c in code.co_consts
+    )
+
+    return code.replace(co_filename=filename, co_consts=consts)
+
+
+class MemoInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class _CodeMemo:
+    """
+    A least-recently-used cache of code objects keyed by their script.
+
+    Code objects don't depend on the globals they are evaluated in, therefore
+    it's enough to key them by the script and evaluate them in the globals of
+    the class at hand.  That also evaluates defaults and annotations anew,
+    such that each class gets its own function object.
+    """
+
+    __slots__ = ("_codes", "_lock", "hits", "maxsize", "misses")
+
+    def __init__(self, maxsize):
+        self._codes = {}
+        self._lock = threading.Lock()
+        self.maxsize = maxsize
+        self.hits = self.misses = 0
+
+    def get(self, script, filename, compile_func=_compile):
+        """
+        Return the code object for *script* with *filename* and use
+        *compile_func* to create it if it's not memoized yet.
+        """
+        if not self.maxsize:
+            return compile_func(script, filename)
+
+        with self._lock:
+            code = self._codes.pop(script, None)
+            if code is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+
+        if code is None:
+            code = compile_func(script, filename)
+        elif code.co_filename != filename:
+            code = _replace_filename(code, filename)
+
+        # Classes can be created from several threads at once, so the
+        # reordering and the eviction must not interleave.
+        with self._lock:
+            self._codes[script] = code
+            if len(self._codes) > self.maxsize:
+                del self._codes[next(iter(self._codes))]
+
+        return code
+
+    def info(self):
+        return MemoInfo(self.hits, self.misses, self.maxsize, len(self._codes))
+
+    def clear(self):
+        with self._lock:
+            self._codes.clear()
+            self.hits = self.misses = 0
+
+
+# code.replace() is only available on Python 3.8 and later.
+memo = _CodeMemo(1024 if hasattr(types.CodeType, "replace") else 0)
+
+
+@atexit.register
+def flush():
+    """
+    Write all dirty caches to disk.
+    """
+    for cache in _caches.values():
+        cache.flush()
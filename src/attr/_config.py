@@ -1,5 +1,8 @@
+import os
 __all__ = ['set_run_validators', 'get_run_validators']
 _run_validators = True
+_use_code_cache = os.environ.get('ATTRS_CODE_CACHE', '') not in ('', '0')
+'\nWhether code objects of generated methods are cached on disk.  See\n`attr._codecache`.\n'
 
 def set_run_validators(run):
     """
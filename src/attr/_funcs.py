@@ -1,7 +1,15 @@
 import copy
 from ._compat import PY_3_9_PLUS, get_generic_base
-from ._make import _OBJ_SETATTR, NOTHING, fields
+from . import _config
+from ._make import _HASH_CACHE_FIELD, _OBJ_SETATTR, NOTHING, Converter, Factory, _compile_and_eval, _fmt_validation, _frozen_setattrs, _generate_unique_filename, fields
 from .exceptions import AttrsAttributeNotFoundError
+_ATOMIC_TYPES = {t: t for t in (int, float, complex, str, bytes, bool, type(None))}
+_ATOMIC_TYPES.update({t.__name__: t for t in (int, float, complex, str, bytes, bool)})
+'''
+Types whose instances are returned as-is by `asdict` and `astuple`.  Fields
+annotated with them get a fast path in the generated serializers -- guarded by
+an exact class check, so lying annotations can't change results.
+'''
 
 def asdict(inst, recurse=True, filter=None, dict_factory=dict, retain_collection_types=False, value_serializer=None):
     """
@@ -47,14 +55,153 @@ def asdict(inst, recurse=True, filter=None, dict_factory=dict, retain_collection
     ..  versionadded:: 20.3.0 *value_serializer*
     ..  versionadded:: 21.3.0
         If a dict has a collection for a key, it is serialized as a tuple.
+    ..  versionchanged:: 24.3.0
+        Without *filter* and *value_serializer*, a specialized serializer is
+        generated on first use for each class.
     """
-    pass
+    if recurse is True and filter is None and value_serializer is None and (dict_factory is dict):
+        cls = inst.__class__
+        serialize = cls.__dict__.get('__attrs_asdict__') or _make_asdict(cls)
+        return serialize(inst, _fast_asdict_retain if retain_collection_types is True else _fast_asdict)
+    attrs = fields(inst.__class__)
+    rv = dict_factory()
+    for a in attrs:
+        v = getattr(inst, a.name)
+        if filter is not None and (not filter(a, v)):
+            continue
+        if value_serializer is not None:
+            v = value_serializer(inst, a, v)
+        if recurse is True:
+            if has(v.__class__):
+                rv[a.name] = asdict(v, recurse=True, filter=filter, dict_factory=dict_factory, retain_collection_types=retain_collection_types, value_serializer=value_serializer)
+            elif isinstance(v, (tuple, list, set, frozenset)):
+                cf = v.__class__ if retain_collection_types is True else list
+                items = [_asdict_anything(i, is_key=False, filter=filter, dict_factory=dict_factory, retain_collection_types=retain_collection_types, value_serializer=value_serializer) for i in v]
+                try:
+                    rv[a.name] = cf(items)
+                except TypeError:
+                    if not issubclass(cf, tuple):
+                        raise
+                    rv[a.name] = cf(*items)
+            elif isinstance(v, dict):
+                df = dict_factory
+                rv[a.name] = df(((_asdict_anything(kk, is_key=True, filter=filter, dict_factory=df, retain_collection_types=retain_collection_types, value_serializer=value_serializer), _asdict_anything(vv, is_key=False, filter=filter, dict_factory=df, retain_collection_types=retain_collection_types, value_serializer=value_serializer)) for kk, vv in v.items()))
+            else:
+                rv[a.name] = v
+        else:
+            rv[a.name] = v
+    return rv
 
 def _asdict_anything(val, is_key, filter, dict_factory, retain_collection_types, value_serializer):
     """
     ``asdict`` only works on attrs instances, this works on anything.
     """
-    pass
+    if getattr(val.__class__, '__attrs_attrs__', None) is not None:
+        rv = asdict(val, recurse=True, filter=filter, dict_factory=dict_factory, retain_collection_types=retain_collection_types, value_serializer=value_serializer)
+    elif isinstance(val, (tuple, list, set, frozenset)):
+        if retain_collection_types is True:
+            cf = val.__class__
+        elif is_key:
+            cf = tuple
+        else:
+            cf = list
+        items = [_asdict_anything(i, is_key=False, filter=filter, dict_factory=dict_factory, retain_collection_types=retain_collection_types, value_serializer=value_serializer) for i in val]
+        try:
+            rv = cf(items)
+        except TypeError:
+            if not issubclass(cf, tuple):
+                raise
+            rv = cf(*items)
+    elif isinstance(val, dict):
+        df = dict_factory
+        rv = df(((_asdict_anything(kk, is_key=True, filter=filter, dict_factory=df, retain_collection_types=retain_collection_types, value_serializer=value_serializer), _asdict_anything(vv, is_key=False, filter=filter, dict_factory=df, retain_collection_types=retain_collection_types, value_serializer=value_serializer)) for kk, vv in val.items()))
+    else:
+        rv = val
+        if value_serializer is not None:
+            rv = value_serializer(None, None, rv)
+    return rv
+
+def _atomic_type(a):
+    """
+    Return the type from `_ATOMIC_TYPES` that *a* is annotated with, or
+    `None`.
+    """
+    try:
+        return _ATOMIC_TYPES.get(a.type)
+    except TypeError:
+        return None
+
+def _make_serializer(cls, method_name, fmt_return):
+    """
+    Generate a specialized serializer for *cls*, attach it to *cls* as
+    *method_name*, and return it.
+
+    It takes the instance and a function that serializes field values (see
+    `_make_fast_asdict_anything`), loads the fields directly, and skips the
+    dispatch for fields whose values are of the type they're annotated with.
+
+    *fmt_return* is called with the fields and the expressions for their
+    serialized values and returns the expression that the serializer returns.
+    """
+    attrs = fields(cls)
+    globs = {}
+    lines = []
+    values = []
+    for i, a in enumerate(attrs):
+        lines.append(f'    v{i} = inst.{a.name}')
+        t = _atomic_type(a)
+        if t is None:
+            values.append(f'anything(v{i})')
+        else:
+            globs[f'_t{i}'] = t
+            values.append(f'v{i} if v{i}.__class__ is _t{i} else anything(v{i})')
+    script = '\n'.join([f'def {method_name}(inst, anything):', *lines, f'    return {fmt_return(attrs, values)}'])
+    locs = {}
+    _compile_and_eval(script, globs, locs, _generate_unique_filename(cls, method_name))
+    serialize = locs[method_name]
+    setattr(cls, method_name, serialize)
+    return serialize
+
+def _make_asdict(cls):
+    """
+    Generate the specialized `asdict` serializer for *cls*.
+    """
+    return _make_serializer(cls, '__attrs_asdict__', lambda attrs, values: '{' + ', '.join((f'{a.name!r}: {v}' for a, v in zip(attrs, values))) + '}')
+
+def _make_fast_asdict_anything(retain_collection_types):
+    """
+    Create a function that serializes any value like `_asdict_anything` with
+    the default arguments of `asdict` does, but uses the specialized
+    serializers for *attrs* instances.
+    """
+
+    def anything(val, is_key=False):
+        cls = val.__class__
+        serialize = cls.__dict__.get('__attrs_asdict__')
+        if serialize is not None:
+            return serialize(val, anything)
+        if getattr(cls, '__attrs_attrs__', None) is not None:
+            return _make_asdict(cls)(val, anything)
+        if isinstance(val, (tuple, list, set, frozenset)):
+            if retain_collection_types:
+                cf = cls
+            elif is_key:
+                cf = tuple
+            else:
+                cf = list
+            items = [anything(i) for i in val]
+            try:
+                return cf(items)
+            except TypeError:
+                if not issubclass(cf, tuple):
+                    raise
+                return cf(*items)
+        if isinstance(val, dict):
+            return {anything(k, True): anything(v) for k, v in val.items()}
+        return val
+    return anything
+_fast_asdict = _make_fast_asdict_anything(False)
+_fast_asdict_retain = _make_fast_asdict_anything(True)
 
 def astuple(inst, recurse=True, filter=None, tuple_factory=tuple, retain_collection_types=False):
     """
@@ -91,8 +238,90 @@ def astuple(inst, recurse=True, filter=None, tuple_factory=tuple, retain_collect
             If *cls* is not an *attrs* class.
 
     ..  versionadded:: 16.2.0
+    ..  versionchanged:: 24.3.0
+        Without *filter* and with the default *tuple_factory*, a specialized
+        serializer is generated on first use for each class.
+    """
+    if recurse is True and filter is None and (tuple_factory is tuple):
+        cls = inst.__class__
+        serialize = cls.__dict__.get('__attrs_astuple__') or _make_astuple(cls)
+        return serialize(inst, _fast_astuple_retain if retain_collection_types is True else _fast_astuple)
+    attrs = fields(inst.__class__)
+    rv = []
+    retain = retain_collection_types
+    for a in attrs:
+        v = getattr(inst, a.name)
+        if filter is not None and (not filter(a, v)):
+            continue
+        if recurse is True:
+            if has(v.__class__):
+                rv.append(astuple(v, recurse=True, filter=filter, tuple_factory=tuple_factory, retain_collection_types=retain))
+            elif isinstance(v, (tuple, list, set, frozenset)):
+                cf = v.__class__ if retain is True else list
+                items = [astuple(j, recurse=True, filter=filter, tuple_factory=tuple_factory, retain_collection_types=retain) if has(j.__class__) else j for j in v]
+                try:
+                    rv.append(cf(items))
+                except TypeError:
+                    if not issubclass(cf, tuple):
+                        raise
+                    rv.append(cf(*items))
+            elif isinstance(v, dict):
+                df = v.__class__ if retain is True else dict
+                rv.append(df(((astuple(kk, tuple_factory=tuple_factory, retain_collection_types=retain) if has(kk.__class__) else kk, astuple(vv, tuple_factory=tuple_factory, retain_collection_types=retain) if has(vv.__class__) else vv) for kk, vv in v.items())))
+            else:
+                rv.append(v)
+        else:
+            rv.append(v)
+    return rv if tuple_factory is list else tuple_factory(rv)
+
+def _make_astuple(cls):
+    """
+    Generate the specialized `astuple` serializer for *cls*.
+    """
+    return _make_serializer(cls, '__attrs_astuple__', lambda attrs, values: '(' + ''.join((f'{v}, ' for v in values)) + ')')
+
+def _make_fast_astuple_anything(retain_collection_types):
+    """
+    Create a function that serializes field values like `astuple` with its
+    default arguments does, but uses the specialized serializers for *attrs*
+    instances.
+
+    Unlike `asdict`, `astuple` only looks for *attrs* instances one level deep
+    into collections.
     """
-    pass
+
+    def member(val):
+        cls = val.__class__
+        serialize = cls.__dict__.get('__attrs_astuple__')
+        if serialize is not None:
+            return serialize(val, anything)
+        if getattr(cls, '__attrs_attrs__', None) is not None:
+            return _make_astuple(cls)(val, anything)
+        return val
+
+    def anything(val):
+        cls = val.__class__
+        serialize = cls.__dict__.get('__attrs_astuple__')
+        if serialize is not None:
+            return serialize(val, anything)
+        if getattr(cls, '__attrs_attrs__', None) is not None:
+            return _make_astuple(cls)(val, anything)
+        if isinstance(val, (tuple, list, set, frozenset)):
+            cf = cls if retain_collection_types else list
+            items = [member(j) for j in val]
+            try:
+                return cf(items)
+            except TypeError:
+                if not issubclass(cf, tuple):
+                    raise
+                return cf(*items)
+        if isinstance(val, dict):
+            df = cls if retain_collection_types else dict
+            return df(((member(kk), member(vv)) for kk, vv in val.items()))
+        return val
+    return anything
+_fast_astuple = _make_fast_astuple_anything(False)
+_fast_astuple_retain = _make_fast_astuple_anything(True)
 
 def has(cls):
     """
@@ -175,8 +404,283 @@ def evolve(*args, **changes):
        argument.
     .. versionchanged:: 24.1.0
        *inst* can't be passed as a keyword argument anymore.
+    .. versionchanged:: 24.3.0
+       A specialized implementation is generated on first use for each class.
+       Unless the class has an ``__attrs_pre_init__``, an
+       ``__attrs_post_init__``, a custom ``__init__``, or a ``__setattr__``
+       other than the one of frozen classes, the fields that don't change are
+       copied without running their converters and validators again.
     """
-    pass
+    try:
+        (inst,) = args
+    except ValueError:
+        msg = f'evolve() takes 1 positional argument, but {len(args)} were given'
+        raise TypeError(msg) from None
+    cls = inst.__class__
+    evolve_ = cls.__dict__.get('__attrs_evolve__') or _make_evolve(cls)
+    return evolve_(inst, changes)
+
+def _make_evolve(cls):
+    """
+    Generate the specialized `evolve` for *cls*, attach it to *cls* as
+    ``__attrs_evolve__``, and return it.
+
+    It takes the instance and the dict of changes.  If the work of the
+    initializer can be replicated (see `_can_inline_init`), it copies the
+    fields that don't change, and only converts and validates the ones that
+    do.  Fields with ``init=False`` are reset to their defaults and
+    validated, because that's what the initializer does.
+
+    Otherwise, it calls the initializer with the values of all fields that
+    are passed to it -- using their aliases -- overridden by *changes*, such
+    that converters, validators, and ``__attrs_post_init__`` run exactly like
+    before.
+
+    If *cls* has an incremental cached hash, the new instance's hash is
+    derived from the one of *inst* if that one has been computed already.
+    """
+    globs = {'_cls': cls}
+    if _can_inline_init(cls):
+        lines = _fmt_evolve_copy(cls, globs)
+    else:
+        items = ''.join((f'{a.alias!r}: inst.{a.name}, ' for a in fields(cls) if a.init))
+        lines = ['def __attrs_evolve__(inst, changes):', f'    self = _cls(**{{{items}**changes}})']
+    update_hash = cls.__dict__.get('__attrs_hash_update__')
+    if update_hash is not None:
+        globs['_update_hash'] = update_hash
+        lines.append('    _update_hash(self, inst)')
+    lines.append('    return self')
+    locs = {}
+    _compile_and_eval('\n'.join(lines), globs, locs, _generate_unique_filename(cls, '__attrs_evolve__'))
+    evolve_ = locs['__attrs_evolve__']
+    cls.__attrs_evolve__ = evolve_
+    return evolve_
+
+def _fmt_evolve_copy(cls, globs):
+    """
+    Return the lines of an ``__attrs_evolve__`` for *cls* that copies the
+    fields that don't change instead of calling the initializer, and add the
+    globals they need to *globs*.
+    """
+    attrs = fields(cls)
+    init_attrs = [a for a in attrs if a.init]
+    globs.update({'_config': _config, '_new': object.__new__, '_setattr': _OBJ_SETATTR, '_aliases': frozenset((a.alias for a in init_attrs)), 'attr_dict': {a.name: a for a in attrs}})
+    lines = ['def __attrs_evolve__(inst, changes):', '    if not _aliases.issuperset(changes):', '        unknown = sorted(set(changes) - _aliases)[0]', f"        msg = f'{cls.__qualname__}.__init__() got an unexpected keyword argument {{unknown!r}}'", '        raise TypeError(msg)', '    self = _new(_cls)']
+    validation = []
+    for a in attrs:
+        if a.init:
+            lines.extend([f'    if {a.alias!r} in changes:', f'        v = changes[{a.alias!r}]'])
+            if a.converter is not None:
+                lines.extend((f'        {line}' for line in _converter(a)._fmt_converter_lines(a.name, 'v', globs)))
+            lines.extend([f'        _setattr(self, {a.name!r}, v)', '    else:', f'        _setattr(self, {a.name!r}, inst.{a.name})'])
+            if a.validator is not None:
+                validation.append(f'        if {a.alias!r} in changes:')
+                validation.extend((f'            {line}' for line in _fmt_validation(a, f'self.{a.name}', globs)))
+            continue
+        value = _fmt_default(a, globs)
+        if value is None:
+            continue
+        lines.append(f'    v = {value}')
+        if a.converter is not None:
+            lines.extend((f'    {line}' for line in _converter(a)._fmt_converter_lines(a.name, 'v', globs)))
+        lines.append(f'    _setattr(self, {a.name!r}, v)')
+        if a.validator is not None:
+            validation.extend((f'        {line}' for line in _fmt_validation(a, f'self.{a.name}', globs)))
+    if _has_cache_hash_field(cls):
+        lines.append(f'    _setattr(self, {_HASH_CACHE_FIELD!r}, None)')
+    if validation:
+        lines.append('    if _config._run_validators is True:')
+        lines.extend(validation)
+    return lines
+
+def from_rows(cls, rows):
+    """
+    Create a list of instances of *cls* from an iterable of rows.
+
+    This is equivalent to, but much faster than, calling *cls* with the values
+    of each row.  It's meant for materializing many records at once -- for
+    example, from a database cursor.
+
+    Args:
+        cls (type): An *attrs* class.
+
+        rows (~collections.abc.Iterable):
+            Sequences that contain a value for *each* field that is passed to
+            ``__init__`` -- in the order of `attrs.fields`, including
+            keyword-only fields.
+
+    Returns:
+        list: The instances of *cls*.
+
+    Raises:
+        attrs.exceptions.NotAnAttrsClassError:
+            If *cls* is not an *attrs* class.
+
+        ValueError: If a row has the wrong number of values.
+
+    .. versionadded:: 24.3.0
+    """
+    return _get_bulk(cls, None)(rows)
+
+def from_columns(cls, **columns):
+    """
+    Create a list of instances of *cls* from columns of values.
+
+    This is equivalent to, but much faster than, calling *cls* once for each
+    row of the columns.
+
+    Args:
+        cls (type): An *attrs* class.
+
+        columns (~collections.abc.Iterable):
+            The values of the fields, passed by the name of their ``__init__``
+            parameter.  Columns of fields with defaults may be left out.  The
+            shortest column determines the number of instances.
+
+    Returns:
+        list: The instances of *cls*.
+
+    Raises:
+        attrs.exceptions.NotAnAttrsClassError:
+            If *cls* is not an *attrs* class.
+
+        TypeError:
+            If a column has no matching field, or a field without a default
+            has no column.
+
+    .. versionadded:: 24.3.0
+    """
+    return _get_bulk(cls, frozenset(columns))(columns)
+
+def _get_bulk(cls, names):
+    """
+    Return the bulk constructor of *cls* for the columns *names* -- or for rows
+    if *names* is `None` -- and generate it if necessary.
+    """
+    bulk = cls.__dict__.get('__attrs_bulk__')
+    if bulk is not None:
+        build = bulk.get(names)
+        if build is not None:
+            return build
+    build = _make_bulk(cls, names)
+    if bulk is None:
+        bulk = {}
+        cls.__attrs_bulk__ = bulk
+    bulk[names] = build
+    return build
+
+def _can_inline_init(cls):
+    """
+    Check whether the work of the ``__init__`` of *cls* can be replicated
+    without calling it.
+
+    That's the case if it's the one generated by *attrs* and the class doesn't
+    hook into initialization in other ways.  Since the fields are set using
+    `object.__setattr__`, that includes ``__setattr__`` -- be it a custom one
+    or the one that *attrs* generates for *on_setattr* hooks.
+    """
+    code = getattr(cls.__init__, '__code__', None)
+    return code is not None and code.co_filename == _generate_unique_filename(cls, 'init') and (cls.__new__ is object.__new__) and (cls.__setattr__ in (object.__setattr__, _frozen_setattrs)) and (not issubclass(cls, BaseException)) and (getattr(cls, '__attrs_pre_init__', None) is None) and (getattr(cls, '__attrs_post_init__', None) is None)
+
+def _fmt_default(a, globs):
+    """
+    Return an expression for the default of *a* -- which may refer to
+    ``self`` -- and add the globals it needs to *globs*, or return `None` if
+    *a* has no default.
+    """
+    if a.default is NOTHING:
+        return None
+    if isinstance(a.default, Factory):
+        globs[f'__attr_factory_{a.name}'] = a.default.factory
+        return f'__attr_factory_{a.name}({("self" if a.default.takes_self else "")})'
+    globs[f'__attr_default_{a.name}'] = a.default
+    return f'__attr_default_{a.name}'
+
+def _converter(a):
+    """
+    Return the converter of *a* as a `Converter`.
+    """
+    return a.converter if isinstance(a.converter, Converter) else Converter(a.converter)
+
+def _has_cache_hash_field(cls):
+    """
+    Check whether the generated ``__init__`` of *cls* resets the cached hash.
+    """
+    code = cls.__init__.__code__
+    return _HASH_CACHE_FIELD in code.co_names or _HASH_CACHE_FIELD in code.co_consts
+
+def _make_bulk(cls, names):
+    """
+    Generate the bulk constructor of *cls* for the columns *names* or for
+    rows if *names* is `None`.
+
+    If possible, it creates the instances without calling ``__init__`` and
+    runs the validators afterwards -- one column at a time and only if
+    validators are enabled.  Since ``__init__`` also runs them only after all
+    fields are set, they observe the same state.  Validators that have a
+    ``validate_many`` method get the whole column at once.  Otherwise, it
+    calls *cls* with keyword arguments.
+    """
+    attrs = fields(cls)
+    init_attrs = [a for a in attrs if a.init]
+    if names is None:
+        given = init_attrs
+        name = 'from_rows'
+        source = 'rows'
+    else:
+        aliases = {a.alias for a in init_attrs}
+        unknown = sorted(names - aliases)
+        if unknown:
+            msg = f'{cls.__name__} has no field for the column {unknown[0]!r}.'
+            raise TypeError(msg)
+        given = [a for a in init_attrs if a.alias in names]
+        for a in init_attrs:
+            if a.alias not in names and a.default is NOTHING:
+                msg = f'{cls.__name__} requires a column for {a.alias!r}.'
+                raise TypeError(msg)
+        name = 'from_columns'
+        source = 'zip(' + ', '.join((f'columns[{a.alias!r}]' for a in given)) + ')'
+    value_vars = {a.name: f'v{i}' for i, a in enumerate(given)}
+    targets = ''.join((f'{v}, ' for v in value_vars.values()))
+    globs = {'_cls': cls}
+    lines = [f'def {name}({"rows" if names is None else "columns"}):', '    insts = []', '    append = insts.append', f'    for ({targets}) in {source}:']
+    if not _can_inline_init(cls):
+        kwargs = ', '.join((f'{a.alias}={value_vars[a.name]}' for a in given))
+        lines.append(f'        append(_cls({kwargs}))')
+    else:
+        globs.update({'_config': _config, '_new': object.__new__, '_setattr': _OBJ_SETATTR, 'attr_dict': {a.name: a for a in attrs}})
+        lines.append('        self = _new(_cls)')
+        for a in attrs:
+            if a.name in value_vars:
+                value = value_vars[a.name]
+            else:
+                value = _fmt_default(a, globs)
+                if value is None:
+                    continue
+            if a.converter is not None:
+                if value not in value_vars.values():
+                    lines.append(f'        d_{a.name} = {value}')
+                    value = f'd_{a.name}'
+                lines.extend((f'        {line}' for line in _converter(a)._fmt_converter_lines(a.name, value, globs)))
+            lines.append(f'        _setattr(self, {a.name!r}, {value})')
+        if _has_cache_hash_field(cls):
+            lines.append(f'        _setattr(self, {_HASH_CACHE_FIELD!r}, None)')
+        lines.append('        append(self)')
+        validated = [a for a in attrs if a.validator is not None]
+        if validated:
+            lines.append('    if _config._run_validators is True:')
+            for a in validated:
+                if hasattr(a.validator, 'validate_many'):
+                    globs[f'__attr_validator_{a.name}'] = a.validator
+                    globs[f'__attr_{a.name}'] = a
+                    lines.append(f'        __attr_validator_{a.name}.validate_many(__attr_{a.name}, [self.{a.name} for self in insts])')
+                else:
+                    lines.append('        for self in insts:')
+                    lines.extend((f'            {line}' for line in _fmt_validation(a, f'self.{a.name}', globs)))
+    lines.append('    return insts')
+    locs = {}
+    _compile_and_eval('\n'.join(lines), globs, locs, _generate_unique_filename(cls, name))
+    return locs[name]
 
 def resolve_types(cls, globalns=None, localns=None, attribs=None, include_extras=True):
     """
@@ -0,0 +1,322 @@
+# SPDX-License-Identifier: MIT
+
+"""
+Streaming JSON serialization of *attrs* instances.
+
+Instead of building the dict tree of `attrs.asdict` and encoding it
+afterwards, the instances are walked directly and the JSON document is
+emitted in chunks as it's produced.  Therefore, the memory that's needed is
+bounded by the chunk size and the nesting depth -- not the size of the
+document.
+"""
+
+import io
+import weakref
+
+from json.encoder import encode_basestring
+
+from ._make import fields
+
+
+# The key of the field metadata that overrides the name of a field in JSON
+# documents.
+_JSON_NAME = "json_name"
+
+# Number of pieces that are collected before they are joined and, if they
+# add up to the chunk size, handed out.
+_FLUSH_PIECES = 1024
+
+# Class -> tuple of (Attribute, encoded key) for each field.
+_keys = weakref.WeakKeyDictionary()
+
+
+def _encode_float(o):
+    if o != o:  # noqa: PLR0124
+        return "NaN"
+    if o == float("inf"):
+        return "Infinity"
+    if o == float("-inf"):
+        return "-Infinity"
+
+    return float.__repr__(o)
+
+
+_SCALARS = {
+    str: encode_basestring,
+    int: int.__repr__,
+    float: _encode_float,
+    bool: lambda o: "true" if o else "false",
+    type(None): lambda o: "null",
+}
+
+
+def _encode_scalar(o):
+    """
+    Encode *o* if it's a JSON scalar or an instance of a subclass of one, or
+    return `None`.
+    """
+    encode = _SCALARS.get(o.__class__)
+    if encode is not None:
+        return encode(o)
+    if isinstance(o, str):
+        return encode_basestring(o)
+    if isinstance(o, int):
+        return int.__repr__(o)
+    if isinstance(o, float):
+        return _encode_float(o)
+
+    return None
+
+
+def _encode_key(k):
+    if isinstance(k, str):
+        return encode_basestring(k)
+    if k is True or k is False or k is None or isinstance(k, (int, float)):
+        return encode_basestring(_encode_scalar(k))
+
+    msg = f"keys must be str, int, float, bool or None, not {k.__class__.__name__}"
+    raise TypeError(msg)
+
+
+def _get_keys(cls):
+    try:
+        return _keys[cls]
+    except KeyError:
+        pass
+
+    rv = _keys[cls] = tuple(
+        (a, encode_basestring(a.metadata.get(_JSON_NAME, a.name)) + ":")
+        for a in fields(cls)
+    )
+
+    return rv
+
+
+class _Encoder:
+    """
+    Encodes a single document.
+
+    The ``_iter_*`` generators append the pieces of the document to *parts*
+    and only yield -- without a value -- when enough of them piled up, such
+    that they can be handed out by `chunks`.
+    """
+
+    __slots__ = ("chunk_size", "default", "filter", "parts", "serializer")
+
+    def __init__(self, filter, value_serializer, default, chunk_size):
+        self.filter = filter
+        self.serializer = value_serializer
+        self.default = default
+        self.chunk_size = chunk_size
+        self.parts = []
+
+    def chunks(self, inst):
+        parts = self.parts
+        for _ in self._iter_instance(inst):
+            s = "".join(parts)
+            parts.clear()
+            if len(s) >= self.chunk_size:
+                yield s
+            else:
+                parts.append(s)
+
+        if parts:
+            yield "".join(parts)
+
+    def _iter_value(self, v, serialize, serialize_leaf=True):
+        """
+        Encode an arbitrary value.
+
+        If *serialize* is False, *v* has been returned by the value serializer
+        or by *default* and is encoded as is.  If *serialize_leaf* is False,
+        only the items of *v* are passed to the value serializer, because *v*
+        is a field value that has been serialized already.
+        """
+        if (
+            serialize
+            and getattr(v.__class__, "__attrs_attrs__", None) is not None
+        ):
+            yield from self._iter_instance(v)
+        elif isinstance(v, (list, tuple, set, frozenset)):
+            yield from self._iter_array(v, serialize)
+        elif isinstance(v, dict):
+            yield from self._iter_object(v, serialize)
+        elif serialize and serialize_leaf and self.serializer is not None:
+            yield from self._iter_value(self.serializer(None, None, v), False)
+        else:
+            s = _encode_scalar(v)
+            if s is not None:
+                self.parts.append(s)
+            elif self.default is not None:
+                yield from self._iter_value(self.default(v), False)
+            else:
+                msg = f"Object of type {v.__class__.__name__} is not JSON serializable"
+                raise TypeError(msg)
+
+    def _iter_instance(self, inst):
+        parts = self.parts
+        filter = self.filter
+        serializer = self.serializer
+        sep = "{"
+        for a, key in _get_keys(inst.__class__):
+            v = getattr(inst, a.name)
+            if filter is not None and not filter(a, v):
+                continue
+            if serializer is not None:
+                v = serializer(inst, a, v)
+
+            parts.append(sep)
+            parts.append(key)
+            sep = ","
+
+            encode = _SCALARS.get(v.__class__)
+            if encode is not None:
+                parts.append(encode(v))
+            else:
+                yield from self._iter_value(v, True, False)
+
+        parts.append("{}" if sep == "{" else "}")
+        if len(parts) >= _FLUSH_PIECES:
+            yield
+
+    def _iter_array(self, v, serialize):
+        parts = self.parts
+        # Leaves in containers go through the value serializer.
+        scalars = _SCALARS if not serialize or self.serializer is None else {}
+        sep = "["
+        for item in v:
+            parts.append(sep)
+            sep = ","
+
+            encode = scalars.get(item.__class__)
+            if encode is not None:
+                parts.append(encode(item))
+            else:
+                yield from self._iter_value(item, serialize)
+
+            if len(parts) >= _FLUSH_PIECES:
+                yield
+
+        parts.append("[]" if sep == "[" else "]")
+
+    def _iter_object(self, v, serialize):
+        parts = self.parts
+        serializer = self.serializer if serialize else None
+        scalars = _SCALARS if serializer is None else {}
+        sep = "{"
+        for key, item in v.items():
+            k = key if serializer is None else serializer(None, None, key)
+
+            parts.append(sep)
+            parts.append(_encode_key(k))
+            parts.append(":")
+            sep = ","
+
+            encode = scalars.get(item.__class__)
+            if encode is not None:
+                parts.append(encode(item))
+            else:
+                yield from self._iter_value(item, serialize)
+
+            if len(parts) >= _FLUSH_PIECES:
+                yield
+
+        parts.append("{}" if sep == "{" else "}")
+
+
+def iter_json(
+    inst,
+    *,
+    filter=None,
+    value_serializer=None,
+    default=None,
+    chunk_size=65536,
+):
+    """
+    Encode *inst* as a JSON document and yield it in UTF-8-encoded chunks.
+
+    The result is the same as ``json.dumps(attrs.asdict(inst),
+    separators=(",", ":"), ensure_ascii=False).encode()``, but *inst* is
+    walked directly instead of building an intermediate dict tree first, so
+    huge documents can be streamed without ever holding them in memory.
+
+    Fields with a ``"json_name"`` key in their *metadata* are written using
+    that name.
+
+    Args:
+        inst: Instance of an *attrs*-decorated class.
+
+        filter (~typing.Callable):
+            A callable whose return code determines whether an attribute is
+            included (`True`) or dropped (`False`).  Is called with the
+            `attrs.Attribute` as the first argument and the value as the
+            second argument.
+
+        value_serializer (typing.Callable | None):
+            A hook that is called for every attribute or dict key/value.  It
+            receives the current instance, field and value and must return the
+            (updated) value.  The hook is run *after* the optional *filter* has
+            been applied.
+
+        default (typing.Callable | None):
+            Called with values that aren't JSON-serializable and must return a
+            JSON-serializable version of it.  Like *default* of `json.dumps`.
+
+        chunk_size (int):
+            The minimum number of characters that are collected before a
+            chunk is yielded.  Only the last chunk can be smaller.
+
+    Returns:
+        typing.Iterator[bytes]: The chunks of the document.
+
+    Raises:
+        TypeError: If a value isn't JSON-serializable.
+
+        attrs.exceptions.NotAnAttrsClassError:
+            If *inst* is not an instance of an *attrs* class.
+
+    .. versionadded:: 24.3.0
+    """
+    fields(inst.__class__)
+
+    return _iter_json(
+        _Encoder(filter, value_serializer, default, chunk_size), inst
+    )
+
+
+def _iter_json(encoder, inst):
+    for chunk in encoder.chunks(inst):
+        yield chunk.encode("utf-8")
+
+
+def dump_json(
+    inst,
+    fp,
+    *,
+    filter=None,
+    value_serializer=None,
+    default=None,
+    chunk_size=65536,
+):
+    """
+    Encode *inst* as a JSON document and write it to *fp* in chunks.
+
+    *fp* can be opened in binary mode -- then the document is UTF-8-encoded
+    -- or text mode.  It's treated as binary if it's a raw or buffered binary
+    stream, or if its *mode* contains ``b``.  Otherwise, `str`\ s are
+    written to it.  The remaining arguments are the same as for
+    `attrs.iter_json`.
+
+    .. versionadded:: 24.3.0
+    """
+    fields(inst.__class__)
+
+    encoder = _Encoder(filter, value_serializer, default, chunk_size)
+    write = fp.write
+    binary = isinstance(fp, (io.RawIOBase, io.BufferedIOBase))
+    if binary or "b" in getattr(fp, "mode", ""):
+        for chunk in encoder.chunks(inst):
+            write(chunk.encode("utf-8"))
+    else:
+        for chunk in encoder.chunks(inst):
+            write(chunk)
@@ -7,11 +7,14 @@ import functools
 import inspect
 import itertools
 import linecache
+import math
 import sys
+import threading
 import types
 import typing
+import weakref
 from operator import itemgetter
-from . import _compat, _config, setters
+from . import _codecache, _compat, _config, _repr, setters
 from ._compat import PY_3_8_PLUS, PY_3_10_PLUS, PY_3_11_PLUS, _AnnotationExtractor, _get_annotations, get_generic_base
 from .exceptions import DefaultAlreadySetError, FrozenInstanceError, NotAnAttrsClassError, UnannotatedAttributeError
 _OBJ_SETATTR = object.__setattr__
@@ -102,14 +105,34 @@ def _compile_and_eval(script, globs, locs=None, filename=''):
     """
     Evaluate the script with the given global (globs) and local (locs)
     variables.
+
+    Code objects are memoized in-process by their script.  On a miss, they're
+    loaded from the on-disk code cache instead of being compiled, if it's
+    enabled.
     """
-    pass
+    if _config._use_code_cache:
+        compile_func = _codecache.compile_cached
+    else:
+        compile_func = _codecache._compile
+    bytecode = _codecache.memo.get(script, filename, compile_func)
+    eval(bytecode, globs, locs)
 
 def _make_method(name, script, filename, globs, locals=None):
     """
     Create the method with the script given and return the method object.
     """
-    pass
+    locs = {} if locals is None else locals
+    count = 1
+    base_filename = filename
+    while True:
+        linecache_tuple = (len(script), None, script.splitlines(True), filename)
+        old_val = linecache.cache.setdefault(filename, linecache_tuple)
+        if old_val == linecache_tuple:
+            break
+        filename = f'{base_filename[:-1]}-{count}>'
+        count += 1
+    _compile_and_eval(script, globs, locs, filename)
+    return locs[name]
 
 def _make_attr_tuple_class(cls_name, attr_names):
     """
@@ -184,13 +207,60 @@ def _frozen_delattrs(self, name):
     """
     pass
 
+def _set_method_dunders(cls, name, method):
+    """
+    Set __module__, __qualname__, and __doc__ of *method* called *name* of
+    *cls* like `_ClassBuilder._add_method_dunders` does it, if possible.
+    """
+    with contextlib.suppress(AttributeError):
+        method.__module__ = cls.__module__
+    with contextlib.suppress(AttributeError):
+        method.__qualname__ = f'{cls.__qualname__}.{name}'
+    with contextlib.suppress(AttributeError):
+        method.__doc__ = f'Method generated by attrs for class {cls.__qualname__}.'
+    return method
+
+class _LazyMethods:
+    """
+    A non-data descriptor that stands in for one or more generated methods
+    until one of them is accessed for the first time.
+
+    *make* is called with the final class and returns a dict of method names
+    to functions.  All of them replace their stand-ins on the class, therefore
+    the cost of generating them is paid at most once and the steady-state
+    calls are exactly as fast as with eagerly generated methods.
+    """
+    __slots__ = ('_make', 'name')
+
+    def __init__(self, name, make):
+        self.name = name
+        self._make = make
+
+    def __repr__(self):
+        return f'<lazy attrs method {self.name!r}>'
+
+    def __get__(self, instance, owner=None):
+        if owner is None:
+            owner = type(instance)
+        for cls in owner.__mro__:
+            if cls.__dict__.get(self.name) is self:
+                break
+        else:
+            return self
+        for name, meth in self._make(cls).items():
+            current = cls.__dict__.get(name)
+            if not (isinstance(current, _LazyMethods) and current._make is self._make):
+                continue
+            setattr(cls, name, _set_method_dunders(cls, name, meth))
+        return cls.__dict__[self.name].__get__(instance, owner)
+
 class _ClassBuilder:
     """
     Iteratively build *one* class.
     """
-    __slots__ = ('_attr_names', '_attrs', '_base_attr_map', '_base_names', '_cache_hash', '_cls', '_cls_dict', '_delete_attribs', '_frozen', '_has_pre_init', '_pre_init_has_args', '_has_post_init', '_is_exc', '_on_setattr', '_slots', '_weakref_slot', '_wrote_own_setattr', '_has_custom_setattr')
+    __slots__ = ('_attr_names', '_attrs', '_base_attr_map', '_base_names', '_cache_hash', '_cls', '_cls_dict', '_delete_attribs', '_frozen', '_has_pre_init', '_pre_init_has_args', '_has_post_init', '_is_exc', '_on_setattr', '_slots', '_weakref_slot', '_wrote_own_setattr', '_has_custom_setattr', '_lazy_methods', '_incremental_hash', '_intern', '_repr_limit')
 
-    def __init__(self, cls, these, slots, frozen, weakref_slot, getstate_setstate, auto_attribs, kw_only, cache_hash, is_exc, collect_by_mro, on_setattr, has_custom_setattr, field_transformer):
+    def __init__(self, cls, these, slots, frozen, weakref_slot, getstate_setstate, auto_attribs, kw_only, cache_hash, is_exc, collect_by_mro, on_setattr, has_custom_setattr, field_transformer, lazy_methods=False, incremental_hash=False, intern=False, repr_limit=None):
         attrs, base_attrs, base_map = _transform_attrs(cls, these, auto_attribs, kw_only, collect_by_mro, field_transformer)
         self._cls = cls
         self._cls_dict = dict(cls.__dict__) if slots else {}
@@ -214,6 +284,10 @@ class _ClassBuilder:
         self._on_setattr = on_setattr
         self._has_custom_setattr = has_custom_setattr
         self._wrote_own_setattr = False
+        self._lazy_methods = lazy_methods
+        self._incremental_hash = incremental_hash
+        self._intern = intern
+        self._repr_limit = repr_limit
         self._cls_dict['__attrs_attrs__'] = self._attrs
         if frozen:
             self._cls_dict['__setattr__'] = _frozen_setattrs
@@ -262,6 +336,22 @@ class _ClassBuilder:
         """
         pass
 
+    def _add_methods(self, names, make):
+        """
+        Add the methods called *names* that are created by calling *make* with
+        the final class.
+
+        If the class has been requested to have lazy methods, they are
+        generated on first access instead.
+        """
+        if self._lazy_methods:
+            for name in names:
+                self._cls_dict[name] = _LazyMethods(name, make)
+        else:
+            for name, meth in make(self._cls).items():
+                self._cls_dict[name] = self._add_method_dunders(meth)
+        return self
+
     def _add_method_dunders(self, method):
         """
         Add __module__ and __qualname__ to a *method* if possible.
@@ -339,7 +429,7 @@ def _determine_whether_to_implement(cls, flag, auto_detect, dunders, default=Tru
     """
     pass
 
-def attrs(maybe_cls=None, these=None, repr_ns=None, repr=None, cmp=None, hash=None, init=None, slots=False, frozen=False, weakref_slot=True, str=False, auto_attribs=False, kw_only=False, cache_hash=False, auto_exc=False, eq=None, order=None, auto_detect=False, collect_by_mro=False, getstate_setstate=None, on_setattr=None, field_transformer=None, match_args=True, unsafe_hash=None):
+def attrs(maybe_cls=None, these=None, repr_ns=None, repr=None, cmp=None, hash=None, init=None, slots=False, frozen=False, weakref_slot=True, str=False, auto_attribs=False, kw_only=False, cache_hash=False, auto_exc=False, eq=None, order=None, auto_detect=False, collect_by_mro=False, getstate_setstate=None, on_setattr=None, field_transformer=None, match_args=True, unsafe_hash=None, lazy_methods=False, defer=False, incremental_hash=False, intern=False, repr_limit=None):
     """
     A class decorator that adds :term:`dunder methods` according to the
     specified attributes using `attr.ib` or the *these* argument.
@@ -405,10 +495,148 @@ def attrs(maybe_cls=None, these=None, repr_ns=None, repr=None, cmp=None, hash=No
        If a class has an *inherited* classmethod called
        ``__attrs_init_subclass__``, it is executed after the class is created.
     .. deprecated:: 24.1.0 *hash* is deprecated in favor of *unsafe_hash*.
+    .. versionadded:: 24.3.0 *lazy_methods*
+    .. versionadded:: 24.3.0 *defer*
+    .. versionadded:: 24.3.0 *incremental_hash*
+    .. versionadded:: 24.3.0 *intern*
+    .. versionadded:: 24.3.0 *repr_limit*
     """
     pass
 _attrs = attrs
 '\nInternal alias so we can use it in functions that take an argument called\n*attrs*.\n'
+_DEFERRED_STAND_INS = ('__attrs_attrs__', '__init__', '__new__', '__init_subclass__')
+
+class _DeferredBuild:
+    """
+    Everything necessary to build a class whose building has been deferred
+    using *defer*.
+
+    Until the class is finalized, it only carries its `_CountingAttr`\\ s and
+    stand-ins for ``__attrs_attrs__`` and ``__init__`` (dict classes) or
+    ``__new__`` (slotted classes) that finalize it on first use.
+
+    Slotted classes are replaced when they're built, therefore they can't be
+    subclassed before they're finalized -- and the replaced class can't be
+    subclassed afterwards.
+    """
+    __slots__ = ('_build', '_built', '_lock', '_originals', 'cls')
+
+    def __init__(self, cls, build):
+        self.cls = cls
+        self._build = build
+        self._built = None
+        self._lock = threading.Lock()
+        self._originals = {name: cls.__dict__[name] for name in _DEFERRED_STAND_INS if name in cls.__dict__}
+
+    def install(self, slots):
+        """
+        Install the stand-ins on the class and return it.
+        """
+        cls = self.cls
+        deferred = self
+        cls.__attrs_deferred__ = self
+        cls.__attrs_attrs__ = _DeferredAttrs(self)
+        if slots:
+
+            def __new__(c, *args, **kwargs):
+                return deferred.finalize()(*args, **kwargs)
+
+            def __init_subclass__(c, **kwargs):
+                msg = f'{cls.__qualname__} is a deferred slotted class and can only be subclassed after it has been finalized.  Use attrs.finalize_module() or attrs.fields() to finalize it and subclass the finalized class.'
+                raise TypeError(msg)
+            cls.__new__ = __new__
+            cls.__init_subclass__ = classmethod(__init_subclass__)
+        else:
+
+            def __init__(self, *args, **kwargs):
+                deferred.finalize().__init__(self, *args, **kwargs)
+            cls.__init__ = __init__
+        return cls
+
+    def finalize(self):
+        """
+        Build the class if necessary and return it.
+
+        If building a slotted class replaced the original class, its name in
+        its module is rebound to the new one.
+        """
+        built = self._built
+        if built is not None:
+            return built
+        with self._lock:
+            if self._built is not None:
+                return self._built
+            cls = self.cls
+            del cls.__attrs_deferred__
+            for name in _DEFERRED_STAND_INS:
+                if name in self._originals:
+                    setattr(cls, name, self._originals[name])
+                elif name in cls.__dict__:
+                    delattr(cls, name)
+            built = self._build(cls)
+            if built is not cls:
+                module = sys.modules.get(cls.__module__)
+                if getattr(module, cls.__qualname__, None) is cls:
+                    setattr(module, cls.__qualname__, built)
+                cls.__attrs_attrs__ = built.__attrs_attrs__
+                cls.__new__ = lambda c, *args, **kwargs: built(*args, **kwargs)
+                cls.__init_subclass__ = classmethod(_make_replaced_init_subclass(cls, built))
+            self._built = built
+        return built
+
+def _make_replaced_init_subclass(cls, built):
+    """
+    Return an ``__init_subclass__`` for the class *cls* that has been replaced
+    by *built*, which refuses subclasses.
+
+    Instances of subclasses would lack the slots and methods of *built*.
+    """
+
+    def __init_subclass__(c, **kwargs):
+        msg = f'{cls.__qualname__} has been replaced by its finalized slotted class, subclass {built.__module__}.{built.__qualname__} instead.'
+        raise TypeError(msg)
+    return __init_subclass__
+
+class _DeferredAttrs:
+    """
+    Stand-in for ``__attrs_attrs__`` that finalizes a deferred class once
+    somebody -- like `fields` -- asks for its attributes.
+    """
+    __slots__ = ('_deferred',)
+
+    def __init__(self, deferred):
+        self._deferred = deferred
+
+    def __get__(self, instance, owner=None):
+        return self._deferred.finalize().__attrs_attrs__
+
+def finalize_module(module):
+    """
+    Finalize all classes in *module* whose building has been deferred using
+    *defer* and return the module.
+
+    This is mostly useful for slotted classes that are replaced by new
+    classes when they're built: their names in *module* are rebound to the
+    final classes, such that all later imports and ``isinstance`` checks see
+    the right ones.
+
+    Args:
+        module (types.ModuleType | str): The module or its name.
+
+    Returns:
+        types.ModuleType: The module.
+
+    .. versionadded:: 24.3.0
+    """
+    if isinstance(module, str):
+        module = sys.modules[module]
+    for obj in list(vars(module).values()):
+        if not isinstance(obj, type):
+            continue
+        deferred = obj.__dict__.get('__attrs_deferred__')
+        if deferred is not None:
+            deferred.finalize()
+    return module
 
 def _has_frozen_base_class(cls):
     """
@@ -421,43 +649,390 @@ def _generate_unique_filename(cls, func_name):
     """
     Create a "filename" suitable for a function being generated.
     """
-    pass
+    return f"<attrs generated {func_name} {cls.__module__}.{getattr(cls, '__qualname__', cls.__name__)}>"
+
+_HASH_MASK = 2 ** 64 - 1
+_HASH_MULTIPLIER = 11400714819323198485
+'\nOdd 64-bit constant (derived from the golden ratio) that the per-field\nmultipliers of incremental hashes are derived from.\n'
+
+def _hashed_attrs(attrs):
+    """
+    Return the attributes of *attrs* that are part of the hash.
+    """
+    return tuple((a for a in attrs if a.hash is True or (a.hash is None and a.eq is True)))
+
+def _fmt_field_hash(a, i, value_var, globs):
+    """
+    Return an expression for the contribution of field *a* -- the *i*-th
+    hashed field -- with the value in *value_var* to an incremental hash and
+    add the globals it needs to *globs*.
+
+    Each field's hash is multiplied by its own odd constant modulo 2**64,
+    such that equal values in different fields don't cancel each other out
+    when the contributions are XORed.
+    """
+    globs['_mask'] = _HASH_MASK
+    globs[f'_{a.name}_mult'] = _HASH_MULTIPLIER * (2 * i + 1) & _HASH_MASK
+    if a.eq_key:
+        globs[f'_{a.name}_key'] = a.eq_key
+        value_var = f'_{a.name}_key({value_var})'
+    return f'(hash({value_var}) * _{a.name}_mult & _mask)'
+
+def _make_hash(cls, attrs, frozen, cache_hash, incremental=False):
+    """
+    Create __hash__ method for *cls* with *attrs*.
+
+    If *incremental* is true, the hash is the XOR of the (scrambled) hashes
+    of the fields instead of the hash of a tuple of them, which allows
+    `_make_hash_update` to update it when only some fields change.
+    """
+    attrs = _hashed_attrs(attrs)
+    unique_filename = _generate_unique_filename(cls, 'hash')
+    type_hash = hash(unique_filename)
+    globs = {}
+    if incremental:
+        terms = [str(type_hash & _HASH_MASK), *(_fmt_field_hash(a, i, f'self.{a.name}', globs) for i, a in enumerate(attrs))]
+        hash_expr = ' ^ '.join(terms)
+    else:
+        values = []
+        for a in attrs:
+            if a.eq_key:
+                cmp_name = f'_{a.name}_key'
+                globs[cmp_name] = a.eq_key
+                values.append(f'{cmp_name}(self.{a.name})')
+            else:
+                values.append(f'self.{a.name}')
+        hash_expr = f"hash(({type_hash}, {''.join((f'{value}, ' for value in values))}))"
+    if cache_hash:
+        globs['_cache_wrapper'] = _CacheHashWrapper
+        if frozen:
+            store = f"_setattr(self, '{_HASH_CACHE_FIELD}', _cache_wrapper({hash_expr}))"
+            globs['_setattr'] = _OBJ_SETATTR
+        else:
+            store = f'self.{_HASH_CACHE_FIELD} = _cache_wrapper({hash_expr})'
+        lines = ['def __hash__(self):', f'    if self.{_HASH_CACHE_FIELD} is None:', f'        {store}', f'    return self.{_HASH_CACHE_FIELD}']
+    else:
+        lines = ['def __hash__(self):', f'    return {hash_expr}']
+    return _make_method('__hash__', '\n'.join(lines), unique_filename, globs)
+
+def _make_hash_update(cls, attrs):
+    """
+    Create the ``__attrs_hash_update__`` function for *cls* with *attrs*
+    whose hash has been created using ``_make_hash(..., incremental=True,
+    cache_hash=True)``.
+
+    It's called with a fresh instance and the instance it has been derived
+    from -- like by `attrs.evolve` -- and if the latter has a cached hash,
+    it computes the new instance's hash by only exchanging the contributions
+    of the fields whose values aren't identical.
+    """
+    attrs = _hashed_attrs(attrs)
+    globs = {'_cache_wrapper': _CacheHashWrapper, '_setattr': _OBJ_SETATTR}
+    lines = ['def __attrs_hash_update__(new, old):', f'    h = old.{_HASH_CACHE_FIELD}', '    if h is None:', '        return']
+    for i, a in enumerate(attrs):
+        lines.extend([f'    if new.{a.name} is not old.{a.name}:', f"        h ^= {_fmt_field_hash(a, i, f'old.{a.name}', globs)} ^ {_fmt_field_hash(a, i, f'new.{a.name}', globs)}"])
+    lines.append(f"    _setattr(new, '{_HASH_CACHE_FIELD}', _cache_wrapper(h))")
+    return _make_method('__attrs_hash_update__', '\n'.join(lines), _generate_unique_filename(cls, '__attrs_hash_update__'), globs)
 
 def _add_hash(cls, attrs):
     """
     Add a hash method to *cls*.
     """
-    pass
+    cls.__hash__ = _make_hash(cls, attrs, frozen=False, cache_hash=False)
+    return cls
 
 def _make_ne():
     """
     Create __ne__ method.
     """
-    pass
 
-def _make_eq(cls, attrs):
+    def __ne__(self, other):
+        """
+        Check equality and either forward a NotImplemented or
+        return the result negated.
+        """
+        result = self.__eq__(other)
+        if result is NotImplemented:
+            return NotImplemented
+        return not result
+    return __ne__
+
+def _make_eq(cls, attrs, cache_hash=False, frozen=False):
     """
     Create __eq__ method for *cls* with *attrs*.
-    """
-    pass
+
+    Instances are compared field by field and the comparison stops at the
+    first field that differs.  Like tuple comparison, fields are checked for
+    identity before equality, such that ``nan`` fields compare equal to
+    themselves.
+
+    If *cache_hash* and *frozen* are true and all hashed fields are compared
+    too, instances whose hashes have both been cached already and differ are
+    unequal without looking at any fields.  Cached hashes of instances of
+    classes that aren't frozen go stale once a field changes.
+    """
+    hash_implies_eq = not any((a.hash is True and (not a.eq) for a in attrs))
+    attrs = [a for a in attrs if a.eq]
+    unique_filename = _generate_unique_filename(cls, 'eq')
+    lines = ['def __eq__(self, other):', '    if self is other:', '        return True', '    if other.__class__ is not self.__class__:', '        return NotImplemented']
+    if cache_hash and frozen and hash_implies_eq:
+        lines.extend([f'    if self.{_HASH_CACHE_FIELD} is not None and other.{_HASH_CACHE_FIELD} is not None and self.{_HASH_CACHE_FIELD} != other.{_HASH_CACHE_FIELD}:', '        return False'])
+    globs = {}
+    for a in attrs:
+        if a.eq_key:
+            cmp_name = f'_{a.name}_key'
+            globs[cmp_name] = a.eq_key
+            lines.extend([f'    self_{a.name} = {cmp_name}(self.{a.name})', f'    other_{a.name} = {cmp_name}(other.{a.name})'])
+            self_value, other_value = (f'self_{a.name}', f'other_{a.name}')
+        else:
+            self_value, other_value = (f'self.{a.name}', f'other.{a.name}')
+        lines.extend([f'    if {self_value} is not {other_value} and (not {self_value} == {other_value}):', '        return False'])
+    lines.append('    return True')
+    script = '\n'.join(lines)
+    return _make_method('__eq__', script, unique_filename, globs)
 
 def _make_order(cls, attrs):
     """
     Create ordering methods for *cls* with *attrs*.
-    """
-    pass
+
+    They compare instances lexicographically like tuples of their fields
+    would compare, but field by field without building any tuples.  Keys are
+    only computed for fields that are reached.
+    """
+    attrs = [a for a in attrs if a.order]
+    unique_filename = _generate_unique_filename(cls, 'order')
+    globs = {}
+    compare_lines = []
+    for a in attrs:
+        if a.order_key:
+            cmp_name = f'_{a.name}_key'
+            globs[cmp_name] = a.order_key
+            compare_lines.extend([f'    self_{a.name} = {cmp_name}(self.{a.name})', f'    other_{a.name} = {cmp_name}(other.{a.name})'])
+            self_value, other_value = (f'self_{a.name}', f'other_{a.name}')
+        else:
+            self_value, other_value = (f'self.{a.name}', f'other.{a.name}')
+        compare_lines.extend([f'    if {self_value} is not {other_value} and (not {self_value} == {other_value}):', f'        return {self_value} {{op}} {other_value}'])
+    lines = []
+    for name, op, when_equal in (('__lt__', '<', False), ('__le__', '<=', True), ('__gt__', '>', False), ('__ge__', '>=', True)):
+        lines.extend([f'def {name}(self, other):', '    if other.__class__ is not self.__class__:', '        return NotImplemented', *(line.format(op=op) for line in compare_lines), f'    return {when_equal}'])
+    locs = {}
+    _make_method('__lt__', '\n'.join(lines), unique_filename, globs, locs)
+    return (locs['__lt__'], locs['__le__'], locs['__gt__'], locs['__ge__'])
+
+def _make_sort_key(cls, attrs):
+    """
+    Create the ``__attrs_sort_key__`` function for *cls* with *attrs*.
+
+    It returns a tuple that orders like the instance it's called with, such
+    that ``list.sort(key=C.__attrs_sort_key__)`` computes the keys of each
+    element exactly once.
+    """
+    attrs = [a for a in attrs if a.order]
+    unique_filename = _generate_unique_filename(cls, '__attrs_sort_key__')
+    globs = {}
+    values = []
+    for a in attrs:
+        if a.order_key:
+            cmp_name = f'_{a.name}_key'
+            globs[cmp_name] = a.order_key
+            values.append(f'{cmp_name}(self.{a.name})')
+        else:
+            values.append(f'self.{a.name}')
+    script = f"def __attrs_sort_key__(self):\n    return ({''.join((f'{value}, ' for value in values))})"
+    return _make_method('__attrs_sort_key__', script, unique_filename, globs)
 
 def _add_eq(cls, attrs=None):
     """
     Add equality methods to *cls* with *attrs*.
     """
-    pass
-
-def _add_repr(cls, ns=None, attrs=None):
+    if attrs is None:
+        attrs = cls.__attrs_attrs__
+    cls.__eq__ = _make_eq(cls, attrs)
+    cls.__ne__ = _make_ne()
+    return cls
+
+_INTERN_EXACT_TYPES = frozenset((int, str, bytes, bool, type(None)))
+
+def _intern_key(value):
+    """
+    Return a key for *value* that is only equal to the key of another value
+    if both are indistinguishable.
+
+    Raise `TypeError` for values whose equality doesn't imply that -- like
+    floats with different signs of zero, equal values of different types, or
+    `decimal.Decimal` with different exponents -- and for mutable values.
+    """
+    cls = value.__class__
+    if cls in _INTERN_EXACT_TYPES:
+        return (cls, value)
+    if cls is float:
+        return (cls, value, math.copysign(1.0, value))
+    if cls is complex:
+        return (cls, value, math.copysign(1.0, value.real), math.copysign(1.0, value.imag))
+    if cls is tuple:
+        return (cls, tuple(map(_intern_key, value)))
+    if cls is frozenset:
+        return (cls, frozenset(map(_intern_key, value)))
+    if isinstance(value, enum.Enum):
+        return (cls, value)
+    msg = f'Values of type {cls.__qualname__} are not interned.'
+    raise TypeError(msg)
+
+def _reconstruct_interned(cls, values):
+    """
+    Unpickle and copy interned instances by setting their field *values*
+    without running converters or validators again, such that they are
+    interned again.
+    """
+    return cls.__attrs_intern__(values)
+
+def _add_interning(cls):
+    """
+    Make the built frozen class *cls* intern its instances and return it.
+
+    The generated ``__init__`` is moved into a ``__new__`` that runs it on a
+    fresh instance and then looks up the instance's class, field values, and
+    their classes in a table of weak references.  If an identical instance
+    is alive already, that one is returned and the fresh one is discarded.
+
+    The values are looked up using `_intern_key`, such that only instances
+    whose values are indistinguishable share an instance: ``C(1)`` and
+    ``C(True)``, or ``C(0.0)`` and ``C(-0.0)`` don't.  Values of other types
+    -- including mutable ones -- prevent interning of the instance that holds
+    them.
+
+    Copies and unpickled instances are rebuilt from their field values
+    as they are and looked up in the same table.
+
+    Subclasses that have their own ``__init__`` are not interned.
+    """
+    if cls.__setattr__ is not _frozen_setattrs:
+        msg = 'Invalid value for intern.  To use interning, the class must be frozen.'
+        raise TypeError(msg)
+    if not cls.__weakrefoffset__:
+        msg = 'Invalid value for intern.  To use interning, instances must be weakly referenceable.'
+        raise TypeError(msg)
+    attrs = cls.__attrs_attrs__
+    init = cls.__init__
+    key = ''.join((f'_key(inst.{a.name}), ' for a in attrs))
+    values = ''.join((f'self.{a.name}, ' for a in attrs))
+    lookup = ['    try:', f'        key = (cls, {key})', '    except TypeError:', '        return inst', '    return _table.setdefault(key, inst)']
+    rebuild = ['def __attrs_intern__(cls, values):', '    inst = _new(cls)']
+    rebuild.extend((f'    _setattr(inst, {a.name!r}, values[{i}])' for i, a in enumerate(attrs)))
+    if _HASH_CACHE_FIELD in init.__code__.co_names or _HASH_CACHE_FIELD in init.__code__.co_consts:
+        rebuild.append(f'    _setattr(inst, {_HASH_CACHE_FIELD!r}, None)')
+    globs = {'_new': object.__new__, '_init': init, '_setattr': _OBJ_SETATTR, '_key': _intern_key, '_table': weakref.WeakValueDictionary(), '_reconstruct': _reconstruct_interned, '_reduce_ex': object.__reduce_ex__}
+    lines = ['def __init__(self, *args, **kwargs):', '    pass', 'def __new__(cls, *args, **kwargs):', '    if cls.__init__ is not _noop_init:', '        return _new(cls)', '    inst = _new(cls)', '    _init(inst, *args, **kwargs)', *lookup, *rebuild, *lookup, 'def __reduce_ex__(self, protocol):', '    if self.__class__.__init__ is not _noop_init:', '        return _reduce_ex(self, protocol)', f'    return (_reconstruct, (self.__class__, ({values})))']
+    locs = {}
+    _make_method('__new__', '\n'.join(lines), _generate_unique_filename(cls, 'intern'), globs, locs)
+    globs['_noop_init'] = locs['__init__']
+    signature = inspect.signature(init)
+    for name in ('__new__', '__init__', '__attrs_intern__', '__reduce_ex__'):
+        meth = locs[name]
+        meth.__qualname__ = f'{cls.__qualname__}.{name}'
+        if name in ('__new__', '__init__'):
+            meth.__signature__ = signature
+        if name == '__new__':
+            meth = staticmethod(meth)
+        elif name == '__attrs_intern__':
+            meth = classmethod(meth)
+        setattr(cls, name, meth)
+    return cls
+
+_REPR_ACYCLIC_TYPES = frozenset((int, float, complex, bool, str, bytes, type(None)))
+_REPR_ACYCLIC_NAMES = frozenset(('int', 'float', 'complex', 'bool', 'str', 'bytes', 'None'))
+_REPR_ACYCLIC_CONTAINERS = frozenset((tuple, frozenset, typing.Tuple, typing.FrozenSet))
+
+def _repr_is_acyclic(tp):
+    """
+    Check whether the repr of a value annotated with *tp* can never lead back
+    to the instance that holds it.
+
+    That's the case for scalar built-ins, enums, `typing.Literal`\\ s, and
+    unions and immutable containers thereof.  Anything that isn't known to be
+    acyclic -- including string annotations other than the names of the
+    scalar built-ins -- is not.
+    """
+    if isinstance(tp, str):
+        return tp in _REPR_ACYCLIC_NAMES
+    try:
+        if tp in _REPR_ACYCLIC_TYPES:
+            return True
+    except TypeError:
+        return False
+    if isinstance(tp, type):
+        return issubclass(tp, enum.Enum)
+    origin = getattr(tp, '__origin__', None)
+    args = getattr(tp, '__args__', None) or ()
+    if origin is getattr(typing, 'Literal', None):
+        return True
+    if origin is typing.Union or (PY_3_10_PLUS and isinstance(tp, types.UnionType)) or origin in _REPR_ACYCLIC_CONTAINERS:
+        return bool(args) and all((arg is Ellipsis or _repr_is_acyclic(arg) for arg in args))
+    return False
+
+def _repr_limit_lines(limit, globs):
+    """
+    Return the lines that make a generated __repr__ honor *limit* and active
+    `repr_limit` blocks.
+
+    The thread-local limit is only looked up if any block is active in any
+    thread, so unbounded reprs pay for a single global lookup.
+    """
+    lines = ['    if _limits.active:', '        limit = _limits.current()', '        if limit is not None:', '            return _limits.bounded_repr(self, limit)']
+    if limit is not None:
+        globs['_limit'] = limit
+        lines.append('    return _limits.bounded_repr(self, _limit)')
+    return lines
+
+def _make_repr(attrs, ns, cls, limit=None):
+    """
+    Create __repr__ method for *cls* with *attrs*.
+
+    The whole repr is a single f-string that's put together when the class
+    is created.  The thread-local recursion guard is only consulted if a
+    field could hold a reference back to the instance, judging by its
+    annotated type and whether it has a custom repr.
+
+    If *limit* is a `ReprLimit` (or True for the default one), or if a
+    `repr_limit` block is active, the repr is bounded instead.
+    """
+    unique_filename = _generate_unique_filename(cls, 'repr')
+    attr_names_with_reprs = tuple(((a.name, repr if a.repr is True else a.repr, a.init, a.type) for a in attrs if a.repr is not False))
+    globs = {name + '_repr': r for name, r, _, _ in attr_names_with_reprs if r != repr}
+    globs['_compat'] = _compat
+    globs['AttributeError'] = AttributeError
+    globs['NOTHING'] = NOTHING
+    globs['_limits'] = _repr
+    if limit is True:
+        limit = _repr.ReprLimit()
+    attribute_fragments = []
+    for name, r, i, _ in attr_names_with_reprs:
+        accessor = 'self.' + name if i else 'getattr(self, "' + name + '", NOTHING)'
+        fragment = f'{name}={{{accessor}!r}}' if r == repr else f'{name}={{{name}_repr({accessor})}}'
+        attribute_fragments.append(fragment)
+    repr_fragment = ', '.join(attribute_fragments)
+    if ns is None:
+        globs['_qualname'] = cls.__qualname__
+        globs['_name'] = cls.__qualname__.rsplit('>.', 1)[-1]
+        lines = ['def __repr__(self):', *_repr_limit_lines(limit, globs), '    qualname = self.__class__.__qualname__', "    name = _name if qualname == _qualname else qualname.rsplit('>.', 1)[-1]"]
+        cls_name_fragment = '{name}'
+    else:
+        lines = ['def __repr__(self):', *_repr_limit_lines(limit, globs)]
+        cls_name_fragment = ns + '.{self.__class__.__name__}'
+    if all((r == repr and _repr_is_acyclic(tp) for _, r, _, tp in attr_names_with_reprs)):
+        lines.append(f"    return f'{cls_name_fragment}({repr_fragment})'")
+    else:
+        lines.extend(['    try:', '        already_repring = _compat.repr_context.already_repring', '    except AttributeError:', '        already_repring = {id(self)}', '        _compat.repr_context.already_repring = already_repring', '    else:', '        if id(self) in already_repring:', "            return '...'", '        already_repring.add(id(self))', '    try:', f"        return f'{cls_name_fragment}({repr_fragment})'", '    finally:', '        already_repring.remove(id(self))'])
+    return _make_method('__repr__', '\n'.join(lines), unique_filename, globs=globs)
+
+def _add_repr(cls, ns=None, attrs=None, limit=None):
     """
     Add a repr method to *cls*.
     """
-    pass
+    if attrs is None:
+        attrs = cls.__attrs_attrs__
+    cls.__repr__ = _make_repr(attrs, ns, cls, limit)
+    return cls
 
 def fields(cls):
     """
@@ -549,6 +1124,69 @@ def _assign_with_converter(attr_name: str, value_var: str, has_on_setattr: bool,
     """
     pass
 
+def _fmt_validation(a: Attribute, value_var: str, globs: dict) -> list[str]:
+    """
+    Return the lines that validate *value_var* using the validator of *a* and
+    add the globals they need to *globs*.
+
+    Validators that know how to check a value inline -- like most of the ones
+    in `attr.validators` -- are only called if that check fails, such that
+    they raise their usual exception.
+
+    There's always at least one line, even for an empty `and_`, because the
+    lines often are the body of a block.
+    """
+    attr_name = '__attr_' + a.name
+    globs[attr_name] = a
+    return _fmt_validator_lines(a.validator, '__attr_validator_' + a.name, 'self', attr_name, value_var, globs) or ['pass']
+
+def _fmt_validator_lines(validator, name: str, inst_var: str, attr_var: str, value_var: str, globs: dict) -> list[str]:
+    """
+    Return the lines that call *validator* -- stored as *name* in *globs* --
+    with the variables *inst_var*, *attr_var*, and *value_var*, but check
+    inline first, if possible.
+
+    The members of `and_` validators are laid out one after another.
+    """
+    if validator.__class__ is _AndValidator:
+        lines = []
+        for i, v in enumerate(validator._validators):
+            lines.extend(_fmt_validator_lines(v, f'{name}_{i}', inst_var, attr_var, value_var, globs))
+        return lines
+    globs[name] = validator
+    call = f'{name}({inst_var}, {attr_var}, {value_var})'
+    fmt = getattr(validator.__class__, '_fmt_inline_check', None)
+    check = None if fmt is None else fmt(validator, value_var, name, globs)
+    if check is None:
+        return [call]
+    return [f'if not ({check}):', f'    {call}']
+
+def _fmt_conversion(converter, attr_name: str, value_var: str, name: str, globs: dict) -> list[str]:
+    """
+    Return lines that convert the variable named *value_var* in place using
+    *converter* for the attribute *attr_name*.
+
+    The converter -- or whatever else the lines need -- is stored under
+    *name* or names prefixed by it in *globs*.  Built-in converters carry an
+    ``_fmt_inline`` function that takes the same arguments and expands them
+    inline, such that no Python-level function is called for them.
+    """
+    func = converter.converter if isinstance(converter, Converter) else converter
+    if isinstance(func, types.FunctionType):
+        fmt = getattr(func, '_fmt_inline', None)
+        if fmt is not None:
+            return fmt(attr_name, value_var, name, globs)
+    if not isinstance(converter, Converter):
+        globs[name] = converter
+        return [f'{value_var} = {name}({value_var})']
+    globs[name] = converter.converter
+    args = [value_var]
+    if converter.takes_self:
+        args.append('self')
+    if converter.takes_field:
+        args.append(f'attr_dict[{attr_name!r}]')
+    return [f"{value_var} = {name}({', '.join(args)})"]
+
 def _determine_setters(frozen: bool, slots: bool, base_attr_map: dict[str, type]):
     """
     Determine the correct setter functions based on whether a class is frozen
@@ -821,7 +1459,7 @@ class Converter:
         Return the name that a converter for an attribute name *attr_name*
         would have.
         """
-        pass
+        return f'__attr_converter_{attr_name}'
 
     def _fmt_converter_call(self, attr_name: str, value_var: str) -> str:
         """
@@ -829,7 +1467,22 @@ class Converter:
         *attr_name* and the value in variable named *value_var* according to
         `self.takes_self` and `self.takes_field`.
         """
-        pass
+        if not (self.takes_self or self.takes_field):
+            return f'{self._get_global_name(attr_name)}({value_var})'
+        if self.takes_self and (not self.takes_field):
+            return f'{self._get_global_name(attr_name)}({value_var}, self)'
+        if not self.takes_self and self.takes_field:
+            return f"{self._get_global_name(attr_name)}({value_var}, attr_dict['{attr_name}'])"
+        return f"{self._get_global_name(attr_name)}({value_var}, self, attr_dict['{attr_name}'])"
+
+    def _fmt_converter_lines(self, attr_name: str, value_var: str, globs: dict) -> list[str]:
+        """
+        Return lines that convert the variable named *value_var* in place and
+        add the globals they need to *globs*.
+
+        Unlike `_fmt_converter_call`, built-in converters are expanded inline.
+        """
+        return _fmt_conversion(self, attr_name, value_var, self._get_global_name(attr_name), globs)
 
     def __getstate__(self):
         """
@@ -877,16 +1530,57 @@ def make_class(name, attrs, bases=(object,), class_body=None, **attributes_argum
     """
     pass
 
-@attrs(slots=True, unsafe_hash=True)
+@attrs(slots=True, unsafe_hash=True, getstate_setstate=False)
 class _AndValidator:
     """
     Compose many validators to a single one.
+
+    On first use, the validators are compiled into a single function that runs
+    them one after another and checks the built-in ones inline.  The compiled
+    function isn't pickled.
     """
     _validators = attrib()
+    _compiled = attrib(default=None, init=False, repr=False, eq=False, hash=False)
 
     def __call__(self, inst, attr, value):
-        for v in self._validators:
-            v(inst, attr, value)
+        validate = self._compiled
+        if validate is None:
+            validate = self._compiled = _make_and_validator(self._validators)
+        validate(inst, attr, value)
+
+    def __getstate__(self):
+        return {'_validators': self._validators}
+
+    def __setstate__(self, state):
+        self._validators = state['_validators']
+        self._compiled = None
+
+    def _fmt_inline_check(self, value_var, prefix, globs):
+        """
+        Return an expression that is true if *value_var* is valid for all
+        validators, or `None` if any of them can't be checked inline.
+        """
+        checks = []
+        for i, v in enumerate(self._validators):
+            fmt = getattr(v.__class__, '_fmt_inline_check', None)
+            check = None if fmt is None else fmt(v, value_var, f'{prefix}_{i}', globs)
+            if check is None:
+                return None
+            checks.append(check)
+        return '(' + ' and '.join(checks or ['True']) + ')'
+
+def _make_and_validator(validators):
+    """
+    Compile *validators* into a single validator function.
+    """
+    globs = {}
+    lines = []
+    for i, v in enumerate(validators):
+        lines.extend(_fmt_validator_lines(v, f'_v{i}', 'inst', 'attr', 'value', globs))
+    script = 'def validate(inst, attr, value):\n' + ''.join((f'    {line}\n' for line in lines or ['pass']))
+    locs = {}
+    _compile_and_eval(script, globs, locs, '<attrs generated and_ validator>')
+    return locs['validate']
 
 def and_(*validators):
     """
@@ -899,8 +1593,25 @@ def and_(*validators):
             Arbitrary number of validators.
 
     .. versionadded:: 17.1.0
+    .. versionchanged:: 24.3.0
+       Nested `and_` validators are flattened and validators that are equal
+       to one that comes before them are dropped.
     """
-    pass
+    vals = []
+    for validator in _flatten_validators(validators):
+        if validator not in vals:
+            vals.append(validator)
+    return _AndValidator(tuple(vals))
+
+def _flatten_validators(validators):
+    """
+    Yield *validators* and the members of nested `and_` validators in order.
+    """
+    for validator in validators:
+        if isinstance(validator, _AndValidator):
+            yield from _flatten_validators(validator._validators)
+        else:
+            yield validator
 
 def pipe(*converters):
     """
@@ -917,7 +1628,32 @@ def pipe(*converters):
 
     .. versionadded:: 20.1.0
     """
-    pass
+
+    def pipe_converter(val, inst, field):
+        for c in converters:
+            val = c(val, inst, field) if isinstance(c, Converter) else c(val)
+        return val
+    if not converters:
+        A = typing.TypeVar('A')
+        pipe_converter.__annotations__.update({'val': A, 'return': A})
+    else:
+        t = _AnnotationExtractor(converters[0]).get_first_param_type()
+        if t:
+            pipe_converter.__annotations__['val'] = t
+        last = converters[-1]
+        if not PY_3_11_PLUS and isinstance(last, Converter):
+            last = last.__call__
+        rt = _AnnotationExtractor(last).get_return_type()
+        if rt:
+            pipe_converter.__annotations__['return'] = rt
+
+    def fmt_inline(attr_name, value_var, name, globs):
+        lines = []
+        for i, c in enumerate(converters):
+            lines.extend(_fmt_conversion(c, attr_name, value_var, f'{name}_{i}', globs))
+        return lines
+    pipe_converter._fmt_inline = fmt_inline
+    return Converter(pipe_converter, takes_self=True, takes_field=True)
 
 # Create Attribute instances for each slot
 _a = [Attribute(name=name, default=NOTHING, validator=None, repr=True, cmp=None, eq=True, order=False, hash=name != 'metadata', init=True, inherited=False, alias=_default_init_alias_for(name)) for name in Attribute.__slots__]
@@ -9,7 +9,7 @@ from ._funcs import astuple as _astuple
 from ._make import _DEFAULT_ON_SETATTR, NOTHING, _frozen_setattrs, attrib, attrs
 from .exceptions import UnannotatedAttributeError
 
-def define(maybe_cls=None, *, these=None, repr=None, unsafe_hash=None, hash=None, init=None, slots=True, frozen=False, weakref_slot=True, str=False, auto_attribs=None, kw_only=False, cache_hash=False, auto_exc=True, eq=None, order=False, auto_detect=True, getstate_setstate=None, on_setattr=None, field_transformer=None, match_args=True):
+def define(maybe_cls=None, *, these=None, repr=None, unsafe_hash=None, hash=None, init=None, slots=True, frozen=False, weakref_slot=True, str=False, auto_attribs=None, kw_only=False, cache_hash=False, auto_exc=True, eq=None, order=False, auto_detect=True, getstate_setstate=None, on_setattr=None, field_transformer=None, match_args=True, lazy_methods=False, defer=False, incremental_hash=False, intern=False, repr_limit=None):
     """
     A class decorator that adds :term:`dunder methods` according to
     :term:`fields <field>` specified using :doc:`type annotations <types>`,
@@ -160,6 +160,46 @@ def define(maybe_cls=None, *, these=None, repr=None, unsafe_hash=None, hash=None
             object creation.  If such changes occur, the behavior of the
             object's hash code is undefined.
 
+        incremental_hash (bool):
+            Combine the hashes of the fields using XOR instead of hashing a
+            tuple of them.  Together with *frozen* and *cache_hash*, this
+            allows `attrs.evolve` to derive the hash of the new instance from
+            the cached hash of the old one by only exchanging the hashes of
+            the fields that changed.  Useful for persistent data structures
+            that are derived from each other and used as dictionary keys.
+
+            .. versionadded:: 24.3.0
+
+        intern (bool):
+            Intern the instances of a *frozen* class: instantiating it
+            returns an existing instance if one with indistinguishable field
+            values is still alive.  This deduplicates memory for value
+            objects that are created over and over again, and comparing
+            interned instances that are equal is an identity check.
+
+            Only instances whose field values are `None`, `bool`, `int`,
+            `float`, `complex`, `str`, `bytes`, enum members, or tuples and
+            frozensets of them are interned -- values of other types may be
+            equal without being interchangeable.  Equal values of different
+            types (like ``1`` and ``1.0``) and ``0.0`` and ``-0.0`` aren't
+            merged.
+
+            The instances are kept in a table of weak references, therefore
+            *weakref_slot* must be True for slotted classes.  Pickling and
+            copying interned instances goes through the class, so the copies
+            are interned too.
+
+            .. versionadded:: 24.3.0
+
+        repr_limit (attrs.ReprLimit | bool | None):
+            Bound the generated ``__repr__`` by the limits of an
+            `attrs.ReprLimit` -- or the default limits if True.  The object
+            graph is walked only until the limits are reached, so reprs of
+            instances that hold huge containers or deep trees stay cheap.  To
+            bound reprs temporarily, use `attrs.repr_limit` instead.
+
+            .. versionadded:: 24.3.0
+
         frozen (bool):
             Make instances immutable after initialization.  If someone attempts
             to modify a frozen instance, `attrs.exceptions.FrozenInstanceError`
@@ -205,6 +245,35 @@ def define(maybe_cls=None, *, these=None, repr=None, unsafe_hash=None, hash=None
             non-keyword-only ``__init__`` parameter names on Python 3.10 and
             later. Ignored on older Python versions.
 
+        lazy_methods (bool):
+            If True, ``__repr__``, the equality and ordering methods, and
+            ``__hash__`` are only generated once they're accessed for the first
+            time.  This makes creating classes whose instances are never
+            printed, compared, or hashed considerably cheaper.  Once generated,
+            the methods replace their stand-ins on the class and are exactly as
+            fast as eagerly generated ones.
+
+            ``__hash__`` is always generated eagerly when *cache_hash* is True.
+
+            .. versionadded:: 24.3.0
+
+        defer (bool):
+            If True, only remember the class and its fields and postpone all
+            the work of building it until it's used for the first time --
+            that is, when it's instantiated or its fields are inspected using
+            `attrs.fields` and friends.  Use this for modules with many classes
+            of which only few are used by each run of a program.
+
+            Since slotted classes are *replaced* by new classes when they're
+            built, references to them that have been taken before they were
+            finalized keep pointing to the original classes.  Instantiating
+            them still returns instances of the final class, but
+            ``isinstance`` checks against them fail.  Call
+            `attrs.finalize_module` once all classes of a module are defined to
+            avoid that.
+
+            .. versionadded:: 24.3.0
+
         collect_by_mro (bool):
             If True, *attrs* collects attributes from base classes correctly
             according to the `method resolution order
@@ -0,0 +1,191 @@
+# SPDX-License-Identifier: MIT
+
+"""
+Bounded reprs of *attrs* instances.
+
+Instead of rendering the whole object graph and truncating the result, the
+graph is walked using `reprlib` such that the walk stops as soon as the
+limits are reached -- no matter how big the containers or how deep the trees
+are.
+"""
+
+import contextlib
+import reprlib
+import threading
+
+from typing import NamedTuple
+
+from . import _compat
+
+
+class ReprLimit(NamedTuple):
+    """
+    Limits for bounded reprs.
+
+    Args:
+        length (int):
+            The maximum length of the whole repr.  Once it's reached,
+            remaining fields and items are rendered as ``...``.
+
+        items (int):
+            The maximum number of items that are rendered of each container.
+
+        depth (int):
+            The maximum nesting depth of instances and containers that are
+            rendered.
+
+    .. versionadded:: 24.3.0
+    """
+
+    length: int = 1000
+    items: int = 10
+    depth: int = 4
+
+
+# Number of active repr_limit() blocks in all threads, such that generated
+# reprs only have to look at the thread-local limit if there's any.
+active = 0
+_active_lock = threading.Lock()
+
+
+def _has_attrs_repr(obj):
+    """
+    Check whether *obj* is an instance of an *attrs* class with a generated
+    ``__repr__``.
+    """
+    cls = obj.__class__
+    if getattr(cls, "__attrs_attrs__", None) is None:
+        return False
+
+    code = getattr(cls.__repr__, "__code__", None)
+
+    return code is not None and code.co_filename.startswith(
+        "<attrs generated repr "
+    )
+
+
+class _BoundedRepr(reprlib.Repr):
+    """
+    A `reprlib.Repr` that also walks *attrs* instances and stops walking once
+    the total length has been used up.
+    """
+
+    def __init__(self, limit):
+        super().__init__()
+        self.maxlevel = limit.depth
+        self.maxtuple = self.maxlist = self.maxarray = self.maxdict = (
+            limit.items
+        )
+        self.maxset = self.maxfrozenset = self.maxdeque = limit.items
+        self.maxstring = self.maxlong = self.maxother = limit.length
+        self.remaining = limit.length
+
+    def repr1(self, x, level):
+        if self.remaining <= 0:
+            return "..."
+
+        before = self.remaining
+        if _has_attrs_repr(x):
+            rv = self.repr_attrs(x, level)
+        else:
+            rv = super().repr1(x, level)
+
+        # Containers have been charged for their items already.
+        if self.remaining == before:
+            self.remaining -= len(rv)
+
+        return rv
+
+    def repr_attrs(self, x, level):
+        name = x.__class__.__qualname__.rsplit(">.", 1)[-1]
+        if level <= 0:
+            return f"{name}(...)"
+
+        pieces = []
+        for a in x.__class__.__attrs_attrs__:
+            if a.repr is False:
+                continue
+
+            if self.remaining <= 0:
+                pieces.append("...")
+                break
+
+            try:
+                value = getattr(x, a.name)
+            except AttributeError:
+                r = "NOTHING"
+            else:
+                r = (
+                    self.repr1(value, level - 1)
+                    if a.repr is True
+                    else self.repr_custom(a.repr(value))
+                )
+            pieces.append(f"{a.name}={r}")
+
+        return f"{name}({', '.join(pieces)})"
+
+    def repr_custom(self, r):
+        """
+        Cut the string *r* returned by a custom field repr to the remaining
+        length and charge it.
+        """
+        if len(r) > self.remaining:
+            r = r[: max(self.remaining - 3, 0)] + "..."
+        self.remaining -= len(r)
+
+        return r
+
+
+def bounded_repr(inst, limit):
+    """
+    Return the repr of *inst* within the `ReprLimit` *limit*.
+    """
+    rv = _BoundedRepr(limit).repr1(inst, limit.depth)
+    if len(rv) > limit.length:
+        rv = rv[: max(limit.length - 3, 0)] + "..."
+
+    return rv
+
+
+def current():
+    """
+    Return the `ReprLimit` of the innermost `repr_limit` block of the current
+    thread, or `None` if there's none.
+    """
+    return getattr(_compat.repr_context, "limit", None)
+
+
+@contextlib.contextmanager
+def repr_limit(*, length=1000, items=10, depth=4):
+    """
+    A context manager that bounds the reprs of all *attrs* instances within
+    its block in the current thread.
+
+    Args:
+        length (int): The maximum length of the whole repr.
+
+        items (int):
+            The maximum number of items that are rendered of each container.
+
+        depth (int):
+            The maximum nesting depth of instances and containers that are
+            rendered.
+
+    Returns:
+        ReprLimit: The active limit.
+
+    .. versionadded:: 24.3.0
+    """
+    global active
+
+    limit = ReprLimit(length, items, depth)
+    previous = current()
+    _compat.repr_context.limit = limit
+    with _active_lock:
+        active += 1
+    try:
+        yield limit
+    finally:
+        with _active_lock:
+            active -= 1
+        _compat.repr_context.limit = previous
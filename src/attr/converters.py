@@ -3,7 +3,7 @@ Commonly useful converters.
 """
 import typing
 from ._compat import _AnnotationExtractor
-from ._make import NOTHING, Factory, pipe
+from ._make import NOTHING, Converter, Factory, _fmt_conversion, pipe
 __all__ = ['default_if_none', 'optional', 'pipe', 'to_bool']
 
 def optional(converter):
@@ -20,7 +20,33 @@ def optional(converter):
 
     .. versionadded:: 17.1.0
     """
-    pass
+    if isinstance(converter, Converter):
+
+        def optional_converter(val, inst, field):
+            if val is None:
+                return None
+            return converter(val, inst, field)
+    else:
+
+        def optional_converter(val):
+            if val is None:
+                return None
+            return converter(val)
+    xtr = _AnnotationExtractor(converter)
+    t = xtr.get_first_param_type()
+    if t:
+        optional_converter.__annotations__['val'] = typing.Optional[t]
+    rt = xtr.get_return_type()
+    if rt:
+        optional_converter.__annotations__['return'] = typing.Optional[rt]
+
+    def fmt_inline(attr_name, value_var, name, globs):
+        lines = _fmt_conversion(converter, attr_name, value_var, f'{name}_c', globs)
+        return [f'if {value_var} is not None:', *(f'    {line}' for line in lines or ['pass'])]
+    optional_converter._fmt_inline = fmt_inline
+    if isinstance(converter, Converter):
+        return Converter(optional_converter, takes_self=True, takes_field=True)
+    return optional_converter
 
 def default_if_none(default=NOTHING, factory=None):
     """
@@ -48,7 +74,39 @@ def default_if_none(default=NOTHING, factory=None):
 
     .. versionadded:: 18.2.0
     """
-    pass
+    if default is NOTHING and factory is None:
+        msg = 'Must pass either `default` or `factory`.'
+        raise TypeError(msg)
+    if default is not NOTHING and factory is not None:
+        msg = 'Must pass either `default` or `factory` but not both.'
+        raise TypeError(msg)
+    if factory is not None:
+        default = Factory(factory)
+    if isinstance(default, Factory):
+        if default.takes_self:
+            msg = '`takes_self` is not supported by default_if_none.'
+            raise ValueError(msg)
+
+        def default_if_none_converter(val):
+            if val is not None:
+                return val
+            return default.factory()
+
+        def fmt_inline(attr_name, value_var, name, globs):
+            globs[f'{name}_factory'] = default.factory
+            return [f'if {value_var} is None:', f'    {value_var} = {name}_factory()']
+    else:
+
+        def default_if_none_converter(val):
+            if val is not None:
+                return val
+            return default
+
+        def fmt_inline(attr_name, value_var, name, globs):
+            globs[f'{name}_default'] = default
+            return [f'if {value_var} is None:', f'    {value_var} = {name}_default']
+    default_if_none_converter._fmt_inline = fmt_inline
+    return default_if_none_converter
 
 def to_bool(val):
     """
@@ -78,4 +136,26 @@ def to_bool(val):
 
     .. versionadded:: 21.3.0
     """
-    pass
\ No newline at end of file
+    if isinstance(val, str):
+        val = val.lower()
+    if val in (True, 'true', 't', 'yes', 'y', 'on', '1', 1):
+        return True
+    if val in (False, 'false', 'f', 'no', 'n', 'off', '0', 0):
+        return False
+    msg = f'Cannot convert value to bool: {val!r}'
+    raise ValueError(msg)
+_TO_BOOL = {**dict.fromkeys((True, 'true', 't', 'yes', 'y', 'on', '1'), True), **dict.fromkeys((False, 'false', 'f', 'no', 'n', 'off', '0'), False)}
+_TO_BOOL_TYPES = frozenset((str, bool, int))
+
+def _fmt_to_bool_inline(attr_name, value_var, name, globs):
+    """
+    Expand `to_bool` to a dict lookup.  Values that aren't exactly of one of
+    the types in ``_TO_BOOL_TYPES`` -- which are all hashable -- or aren't in
+    the dict are passed to `to_bool`, which either converts or rejects them.
+    """
+    globs[name] = to_bool
+    globs[f'{name}_table'] = _TO_BOOL
+    globs[f'{name}_types'] = _TO_BOOL_TYPES
+    rv = f'{name}_rv'
+    return [f'{rv} = ({name}_table.get({value_var}.lower() if {value_var}.__class__ is str else {value_var}) if {value_var}.__class__ in {name}_types else None)', f'{value_var} = {name}({value_var}) if {rv} is None else {rv}']
+to_bool._fmt_inline = _fmt_to_bool_inline
\ No newline at end of file
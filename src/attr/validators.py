@@ -1,15 +1,69 @@
 """
 Commonly useful validators.
 """
+import enum
+import functools
 import operator
+import random
 import re
-from contextlib import contextmanager
+import sys
+import weakref
+from collections.abc import Sequence
+from contextlib import contextmanager, suppress
+from itertools import compress, repeat
 from re import Pattern
 from ._config import get_run_validators, set_run_validators
-from ._make import _AndValidator, and_, attrib, attrs
+from ._make import _AndValidator, _compile_and_eval, and_, attrib, attrs
 from .converters import default_if_none
 from .exceptions import NotCallableError
-__all__ = ['and_', 'deep_iterable', 'deep_mapping', 'disabled', 'ge', 'get_disabled', 'gt', 'in_', 'instance_of', 'is_callable', 'le', 'lt', 'matches_re', 'max_len', 'min_len', 'not_', 'optional', 'or_', 'set_disabled']
+__all__ = ['TrackedList', 'and_', 'deep_iterable', 'deep_mapping', 'disabled', 'ge', 'get_disabled', 'gt', 'in_', 'instance_of', 'is_callable', 'le', 'lt', 'matches_re', 'max_len', 'min_len', 'not_', 'optional', 'or_', 'set_disabled']
+
+def _as_collection(values):
+    """
+    Return *values* such that it can be iterated more than once.
+    """
+    if hasattr(values, '__len__'):
+        return values
+    return list(values)
+
+def _raise_first_invalid(validator, attr, values, checks):
+    """
+    Call *validator* with the first of *values* whose result in *checks* is
+    false, so it raises its usual exception.
+    """
+    for value in compress(values, map(operator.not_, checks)):
+        validator(None, attr, value)
+
+def _numpy_for(values):
+    """
+    Return the numpy module if *values* is a NumPy array of booleans or
+    numbers, `None` otherwise.
+
+    NumPy is never imported by *attrs*: if it's not imported yet, *values*
+    can't be an array.
+    """
+    np = sys.modules.get('numpy')
+    if np is not None and isinstance(values, np.ndarray) and (values.dtype.kind in 'biuf'):
+        return np
+    return None
+
+_TYPE_CACHE_SIZE = 256
+'''
+How many classes each caching `instance_of` validator remembers.
+'''
+
+_DEEP_CACHE_SIZE = 128
+'''
+How many validated tuples and frozensets each caching `deep_iterable`
+validator remembers.
+'''
+
+_INLINE_COMPARE_OPS = {operator.lt: '<', operator.le: '<=', operator.ge: '>=', operator.gt: '>'}
+_INLINE_IN_TYPES = (int, float, complex, str, bytes, bool, type(None))
+'''
+Types whose instances are hashable and compare equal only to their own kind,
+such that `in_` can check them inline using a set.
+'''
 
 def set_disabled(disabled):
     """
@@ -52,22 +106,81 @@ def disabled():
     """
     pass
 
-@attrs(repr=False, slots=True, unsafe_hash=True)
+@attrs(repr=False, slots=True, unsafe_hash=True, getstate_setstate=False)
 class _InstanceOfValidator:
+    """
+    If *_valid_classes* is a `weakref.WeakKeyDictionary`, it remembers the
+    classes whose instances passed the check, such that checking further
+    instances is a dictionary lookup.  It isn't pickled, but an empty one is
+    created when unpickling.
+
+    Only successful checks are remembered: a class can't stop being a
+    subclass -- registering with an ABC only ever adds subclasses -- and
+    failing is slow anyway since it raises.
+    """
     type = attrib()
+    _valid_classes = attrib(default=None, eq=False, hash=False, repr=False)
 
     def __call__(self, inst, attr, value):
         """
         We use a callable class to be able to change the ``__repr__``.
         """
+        valid_classes = self._valid_classes
+        if valid_classes is not None and valid_classes.get(value.__class__):
+            return
         if not isinstance(value, self.type):
             msg = f"'{attr.name}' must be {self.type!r} (got {value!r} that is a {value.__class__!r})."
             raise TypeError(msg, attr, self.type, value)
+        if valid_classes is not None:
+            self._remember(value)
+
+    def __getstate__(self):
+        return {'type': self.type, 'cache': self._valid_classes is not None}
+
+    def __setstate__(self, state):
+        self.type = state['type']
+        self._valid_classes = weakref.WeakKeyDictionary() if state['cache'] else None
+
+    def _remember(self, value):
+        """
+        Remember that the class of *value* passes the check.
+
+        Proxies whose ``__class__`` differs from their type are never
+        remembered, because `isinstance` takes both into account.
+        """
+        cls = value.__class__
+        if type(value) is not cls:
+            return
+        valid_classes = self._valid_classes
+        if len(valid_classes) >= _TYPE_CACHE_SIZE:
+            with suppress(KeyError, RuntimeError):
+                del valid_classes[next(iter(valid_classes))]
+        valid_classes[cls] = True
+
+    def _fmt_inline_check(self, value_var, prefix, globs):
+        """
+        Return an expression that is true if *value_var* is valid and add the
+        globals it needs -- prefixed by *prefix* -- to *globs*.
+        """
+        if self._valid_classes is not None:
+            globs[f'{prefix}_valid_classes'] = self._valid_classes
+            return f'{prefix}_valid_classes.get({value_var}.__class__)'
+        globs[f'{prefix}_type'] = self.type
+        return f'isinstance({value_var}, {prefix}_type)'
+
+    def validate_many(self, attr, values):
+        """
+        Validate all *values* at once and raise like ``__call__`` for the
+        first one that is invalid.
+        """
+        values = _as_collection(values)
+        if not all(map(isinstance, values, repeat(self.type))):
+            _raise_first_invalid(self, attr, values, map(isinstance, values, repeat(self.type)))
 
     def __repr__(self):
         return f'<instance_of validator for type {self.type!r}>'
 
-def instance_of(type):
+def instance_of(type, *, cache=False):
     """
     A validator that raises a `TypeError` if the initializer is called with a
     wrong type for this particular attribute (checks are performed using
@@ -76,12 +189,24 @@ def instance_of(type):
     Args:
         type (type | tuple[type]): The type to check for.
 
+        cache (bool):
+            Remember the classes of values that passed the check, such that
+            checking further values of the same class is a dictionary lookup
+            instead of an `isinstance` call.  Worthwhile for ABCs like
+            `collections.abc.Mapping` and long tuples of types.  The classes
+            are referenced weakly and only the most recent ones are kept.
+
+            Don't use it for types whose checks depend on more than the
+            class of the value, like runtime-checkable protocols.
+
     Raises:
         TypeError:
             With a human readable error message, the attribute (of type
             `attrs.Attribute`), the expected type, and the value it got.
+
+    .. versionadded:: 24.3.0 *cache*
     """
-    pass
+    return _InstanceOfValidator(type, weakref.WeakKeyDictionary() if cache else None)
 
 @attrs(repr=False, frozen=True, slots=True)
 class _MatchesReValidator:
@@ -96,6 +221,23 @@ class _MatchesReValidator:
             msg = f"'{attr.name}' must match regex {self.pattern.pattern!r} ({value!r} doesn't)"
             raise ValueError(msg, attr, self.pattern, value)
 
+    def _fmt_inline_check(self, value_var, prefix, globs):
+        """
+        Return an expression that is true if *value_var* is valid and add the
+        globals it needs -- prefixed by *prefix* -- to *globs*.
+        """
+        globs[f'{prefix}_match'] = self.match_func
+        return f'{prefix}_match({value_var})'
+
+    def validate_many(self, attr, values):
+        """
+        Validate all *values* at once and raise like ``__call__`` for the
+        first one that is invalid.
+        """
+        values = _as_collection(values)
+        if not all(map(self.match_func, values)):
+            _raise_first_invalid(self, attr, values, map(self.match_func, values))
+
     def __repr__(self):
         return f'<matches_re validator for pattern {self.pattern!r}>'
 
@@ -119,8 +261,35 @@ def matches_re(regex, flags=0, func=None):
 
     .. versionadded:: 19.2.0
     .. versionchanged:: 21.3.0 *regex* can be a pre-compiled pattern.
+    .. versionchanged:: 24.3.0
+       Validators for the same *regex*, *flags*, and *func* are shared across
+       fields.
     """
-    pass
+    valid_funcs = (re.fullmatch, None, re.search, re.match)
+    if func not in valid_funcs:
+        msg = "'func' must be one of {}.".format(', '.join(sorted((e and e.__name__ or 'None' for e in set(valid_funcs)))))
+        raise ValueError(msg)
+    if isinstance(regex, Pattern) and flags:
+        msg = "'flags' can only be used with a string pattern; pass flags to re.compile() instead"
+        raise TypeError(msg)
+    return _matches_re(regex, flags, func or re.fullmatch)
+
+@functools.lru_cache(maxsize=256)
+def _matches_re(regex, flags, func):
+    """
+    Create a `matches_re` validator.
+
+    The validators are immutable, therefore fields that use the same regular
+    expression share one -- and with it the compiled pattern.
+    """
+    pattern = regex if isinstance(regex, Pattern) else re.compile(regex, flags)
+    if func is re.match:
+        match_func = pattern.match
+    elif func is re.search:
+        match_func = pattern.search
+    else:
+        match_func = pattern.fullmatch
+    return _MatchesReValidator(pattern, match_func)
 
 @attrs(repr=False, slots=True, unsafe_hash=True)
 class _OptionalValidator:
@@ -131,6 +300,21 @@ class _OptionalValidator:
             return
         self.validator(inst, attr, value)
 
+    def _fmt_inline_check(self, value_var, prefix, globs):
+        """
+        Return an expression that is true if *value_var* is valid and add the
+        globals it needs -- prefixed by *prefix* -- to *globs*.
+
+        Return `None` if the wrapped validator can't be checked inline.
+        """
+        fmt = getattr(self.validator.__class__, '_fmt_inline_check', None)
+        if fmt is None:
+            return None
+        check = fmt(self.validator, value_var, f'{prefix}_o', globs)
+        if check is None:
+            return None
+        return f'({value_var} is None or {check})'
+
     def __repr__(self):
         return f'<optional validator for {self.validator!r} or None>'
 
@@ -165,6 +349,46 @@ class _InValidator:
             msg = f"'{attr.name}' must be in {self._original_options!r} (got {value!r})"
             raise ValueError(msg, attr, self._original_options, value)
 
+    def _fmt_inline_check(self, value_var, prefix, globs):
+        """
+        Return an expression that is true if *value_var* is valid and add the
+        globals it needs -- prefixed by *prefix* -- to *globs*.
+
+        Only tuples and sets of plain values and enum members are checked
+        inline.  The expression is guarded by the exact class of the value so
+        it can't raise for unhashable values.  If it's false, ``__call__``
+        still decides.
+        """
+        if self.options.__class__ not in (tuple, frozenset):
+            return None
+        types = set()
+        for o in self.options:
+            if o.__class__ not in _INLINE_IN_TYPES and (not isinstance(o, enum.Enum)):
+                return None
+            types.add(o.__class__)
+        globs[f'{prefix}_types'] = frozenset(types)
+        globs[f'{prefix}_options'] = frozenset(self.options)
+        return f'({value_var}.__class__ in {prefix}_types and {value_var} in {prefix}_options)'
+
+    def validate_many(self, attr, values):
+        """
+        Validate all *values* at once and raise like ``__call__`` for the
+        first one that is invalid.
+
+        If the options are a tuple or a set of hashable objects, a set is used
+        for the lookups.
+        """
+        values = _as_collection(values)
+        if self.options.__class__ in (tuple, frozenset, set):
+            try:
+                options = frozenset(self.options)
+                if all(map(options.__contains__, values)):
+                    return
+            except TypeError:
+                pass
+        for value in values:
+            self(None, attr, value)
+
     def __repr__(self):
         return f'<in_ validator with options {self._original_options!r}>'
 
@@ -227,10 +451,53 @@ def is_callable():
     """
     pass
 
-@attrs(repr=False, slots=True, unsafe_hash=True)
+def _sample(value, k):
+    """
+    Return *k* random members of *value* in their original order -- or
+    *value* itself if it's not a sized collection or isn't larger than *k*.
+    """
+    try:
+        n = len(value)
+    except TypeError:
+        return value
+    if n <= k:
+        return value
+    if not isinstance(value, Sequence):
+        value = tuple(value)
+    return [value[i] for i in sorted(random.sample(range(n), k))]
+
+class TrackedList(list):
+    """
+    A `list` that remembers how many of its items have been validated by a
+    `deep_iterable` validator, such that assigning it again only validates
+    the items that have been appended since.
+
+    Appending and extending keeps what has been validated, all other
+    modifications make the next validation start from scratch.
+
+    .. versionadded:: 24.3.0
+    """
+    _attrs_validated = None
+
+def _resets_validation(name):
+    meth = getattr(list, name)
+
+    @functools.wraps(meth)
+    def wrapper(self, *args, **kwargs):
+        self._attrs_validated = None
+        return meth(self, *args, **kwargs)
+    return wrapper
+
+for _name in ('__setitem__', '__delitem__', '__imul__', 'clear', 'insert', 'pop', 'remove', 'reverse', 'sort'):
+    setattr(TrackedList, _name, _resets_validation(_name))
+
+@attrs(repr=False, slots=True, unsafe_hash=True, getstate_setstate=False)
 class _DeepIterable:
     member_validator = attrib(validator=is_callable())
     iterable_validator = attrib(default=None, validator=optional(is_callable()))
+    sample = attrib(default=None, validator=optional(instance_of(int)))
+    cache = attrib(default=False)
+    _seen = attrib(factory=dict, init=False, repr=False, eq=False, hash=False)
 
     def __call__(self, inst, attr, value):
         """
@@ -238,14 +505,78 @@ class _DeepIterable:
         """
         if self.iterable_validator is not None:
             self.iterable_validator(inst, attr, value)
-        for member in value:
+        if isinstance(value, TrackedList):
+            validated = value._attrs_validated
+            start = validated[1] if validated is not None and validated[0] is self else 0
+            for member in value[start:]:
+                self.member_validator(inst, attr, member)
+            value._attrs_validated = (self, len(value))
+            return
+        cacheable = self.cache and value.__class__ in (tuple, frozenset)
+        if cacheable and self._is_remembered(value):
+            return
+        for member in value if self.sample is None else _sample(value, self.sample):
             self.member_validator(inst, attr, member)
+        if cacheable:
+            self._remember(value)
+
+    def _is_remembered(self, value):
+        entry = self._seen.get(id(value))
+        if value.__class__ is frozenset:
+            return entry is not None and entry() is value
+        return entry == _tuple_fingerprint(value)
+
+    def _remember(self, value):
+        """
+        Remember that the members of the immutable *value* are valid.
+
+        *value* isn't kept alive, since it may be huge.  Therefore,
+        frozensets are remembered by a weak reference.  Tuples can't be weakly
+        referenced, so they are remembered by their length and the identities
+        of their first and last members.  A tuple that is created at the
+        address of a remembered one that has been freed in the meantime and
+        that shares these is wrongly taken for validated.
+        """
+        seen = self._seen
+        seen[id(value)] = weakref.ref(value) if value.__class__ is frozenset else _tuple_fingerprint(value)
+        if len(seen) > _DEEP_CACHE_SIZE:
+            with suppress(KeyError, RuntimeError):
+                del seen[next(iter(seen))]
+
+    def __getstate__(self):
+        return {'member_validator': self.member_validator, 'iterable_validator': self.iterable_validator, 'sample': self.sample, 'cache': self.cache}
+
+    def __setstate__(self, state):
+        for name, value in state.items():
+            setattr(self, name, value)
+        self._seen = {}
 
     def __repr__(self):
         iterable_identifier = '' if self.iterable_validator is None else f' {self.iterable_validator!r}'
-        return f'<deep_iterable validator for{iterable_identifier} iterables of {self.member_validator!r}>'
+        return f'<deep_iterable validator for{iterable_identifier} iterables of {self.member_validator!r}{_fmt_deep_options(self.sample, self.cache)}>'
+
+def _tuple_fingerprint(value):
+    """
+    Return what a caching `deep_iterable` validator remembers about the tuple
+    *value* without keeping it alive.
+    """
+    if not value:
+        return (0,)
+    return (len(value), id(value[0]), id(value[-1]))
 
-def deep_iterable(member_validator, iterable_validator=None):
+def _fmt_deep_options(sample, cache=False):
+    """
+    Format the options of deep validators that deviate from the default for
+    their reprs.
+    """
+    rv = ''
+    if sample is not None:
+        rv += f' (sampling {sample})'
+    if cache:
+        rv += ' (cached)'
+    return rv
+
+def deep_iterable(member_validator, iterable_validator=None, *, sample=None, cache=False):
     """
     A validator that performs deep validation of an iterable.
 
@@ -255,18 +586,39 @@ def deep_iterable(member_validator, iterable_validator=None):
         iterable_validator:
             Validator to apply to iterable itself (optional).
 
+        sample (int | None):
+            Only validate this many randomly chosen members of sized
+            iterables.  Meant for large collections whose members come from
+            a trusted source.
+
+        cache (bool):
+            Remember the last validated tuples and frozensets by their
+            identity and don't validate their members again.  Their members
+            can't be replaced, so that's only unsafe if a member itself
+            changes in a way that makes it invalid.  The containers aren't
+            kept alive: tuples are recognized by their identity, length, and
+            first and last members, so a new tuple that takes the place of a
+            freed one and shares these is taken for validated.
+
+    `TrackedList`\\ s are validated incrementally regardless of these
+    options.
+
     Raises
         TypeError: if any sub-validators fail
 
     .. versionadded:: 19.1.0
+    .. versionadded:: 24.3.0 *sample* and *cache*
     """
-    pass
+    if isinstance(member_validator, (list, tuple)):
+        member_validator = and_(*member_validator)
+    return _DeepIterable(member_validator, iterable_validator, sample, cache)
 
 @attrs(repr=False, slots=True, unsafe_hash=True)
 class _DeepMapping:
     key_validator = attrib(validator=is_callable())
     value_validator = attrib(validator=is_callable())
     mapping_validator = attrib(default=None, validator=optional(is_callable()))
+    sample = attrib(default=None, validator=optional(instance_of(int)))
 
     def __call__(self, inst, attr, value):
         """
@@ -274,14 +626,14 @@ class _DeepMapping:
         """
         if self.mapping_validator is not None:
             self.mapping_validator(inst, attr, value)
-        for key in value:
+        for key in value if self.sample is None else _sample(value, self.sample):
             self.key_validator(inst, attr, key)
             self.value_validator(inst, attr, value[key])
 
     def __repr__(self):
-        return f'<deep_mapping validator for objects mapping {self.key_validator!r} to {self.value_validator!r}>'
+        return f'<deep_mapping validator for objects mapping {self.key_validator!r} to {self.value_validator!r}{_fmt_deep_options(self.sample)}>'
 
-def deep_mapping(key_validator, value_validator, mapping_validator=None):
+def deep_mapping(key_validator, value_validator, mapping_validator=None, *, sample=None):
     """
     A validator that performs deep validation of a dictionary.
 
@@ -293,12 +645,17 @@ def deep_mapping(key_validator, value_validator, mapping_validator=None):
         mapping_validator:
             Validator to apply to top-level mapping attribute (optional).
 
+        sample (int | None):
+            Only validate this many randomly chosen items.  Meant for large
+            mappings whose items come from a trusted source.
+
     .. versionadded:: 19.1.0
+    .. versionadded:: 24.3.0 *sample*
 
     Raises:
         TypeError: if any sub-validators fail
     """
-    pass
+    return _DeepMapping(key_validator, value_validator, mapping_validator, sample)
 
 @attrs(repr=False, frozen=True, slots=True)
 class _NumberValidator:
@@ -314,6 +671,38 @@ class _NumberValidator:
             msg = f"'{attr.name}' must be {self.compare_op} {self.bound}: {value}"
             raise ValueError(msg)
 
+    def _fmt_inline_check(self, value_var, prefix, globs):
+        """
+        Return an expression that is true if *value_var* is valid and add the
+        globals it needs -- prefixed by *prefix* -- to *globs*.
+        """
+        op = _INLINE_COMPARE_OPS.get(self.compare_func)
+        if op is None:
+            return None
+        globs[f'{prefix}_bound'] = self.bound
+        return f'{value_var} {op} {prefix}_bound'
+
+    def validate_many(self, attr, values):
+        """
+        Validate all *values* at once and raise like ``__call__`` for the
+        first one that is invalid.
+
+        NumPy arrays of numbers are compared in one go.
+        """
+        np = _numpy_for(values)
+        if np is not None:
+            try:
+                ok = self.compare_func(values, self.bound)
+            except TypeError:
+                ok = None
+            if isinstance(ok, np.ndarray):
+                if not ok.all():
+                    self(None, attr, values[ok.argmin()])
+                return
+        values = _as_collection(values)
+        if not all(map(self.compare_func, values, repeat(self.bound))):
+            _raise_first_invalid(self, attr, values, map(self.compare_func, values, repeat(self.bound)))
+
     def __repr__(self):
         return f'<Validator for x {self.compare_op} {self.bound}>'
 
@@ -385,6 +774,23 @@ class _MaxLengthValidator:
             msg = f"Length of '{attr.name}' must be <= {self.max_length}: {len(value)}"
             raise ValueError(msg)
 
+    def _fmt_inline_check(self, value_var, prefix, globs):
+        """
+        Return an expression that is true if *value_var* is valid and add the
+        globals it needs -- prefixed by *prefix* -- to *globs*.
+        """
+        globs[f'{prefix}_length'] = self.max_length
+        return f'len({value_var}) <= {prefix}_length'
+
+    def validate_many(self, attr, values):
+        """
+        Validate all *values* at once and raise like ``__call__`` for the
+        first one that is invalid.
+        """
+        values = _as_collection(values)
+        if max(map(len, values), default=0) > self.max_length:
+            _raise_first_invalid(self, attr, values, map(self.max_length.__ge__, map(len, values)))
+
     def __repr__(self):
         return f'<max_len validator for {self.max_length}>'
 
@@ -412,6 +818,23 @@ class _MinLengthValidator:
             msg = f"Length of '{attr.name}' must be >= {self.min_length}: {len(value)}"
             raise ValueError(msg)
 
+    def _fmt_inline_check(self, value_var, prefix, globs):
+        """
+        Return an expression that is true if *value_var* is valid and add the
+        globals it needs -- prefixed by *prefix* -- to *globs*.
+        """
+        globs[f'{prefix}_length'] = self.min_length
+        return f'len({value_var}) >= {prefix}_length'
+
+    def validate_many(self, attr, values):
+        """
+        Validate all *values* at once and raise like ``__call__`` for the
+        first one that is invalid.
+        """
+        values = _as_collection(values)
+        if min(map(len, values), default=self.min_length) < self.min_length:
+            _raise_first_invalid(self, attr, values, map(self.min_length.__le__, map(len, values)))
+
     def __repr__(self):
         return f'<min_len validator for {self.min_length}>'
 
@@ -506,21 +929,94 @@ def not_(validator, *, msg=None, exc_types=(ValueError, TypeError)):
     """
     pass
 
-@attrs(repr=False, slots=True, unsafe_hash=True)
+@attrs(repr=False, slots=True, unsafe_hash=True, getstate_setstate=False)
 class _OrValidator:
+    """
+    On first use, the checks of all validators that can be checked inline are
+    compiled into a single predicate that doesn't raise.  Only if it's false,
+    the validators are called -- in an order that moves validators that
+    succeed to the front.
+
+    Neither the predicate nor the order are pickled.
+    """
     validators = attrib()
+    _check = attrib(default=None, init=False, repr=False, eq=False, hash=False)
+    _order = attrib(default=(), init=False, repr=False, eq=False, hash=False)
 
     def __call__(self, inst, attr, value):
-        for v in self.validators:
+        check = self._check
+        if check is None:
+            check = self._compile()
+        if check is not False and check(value):
+            return
+        order = self._order
+        for i, v in enumerate(order):
             try:
                 v(inst, attr, value)
-            except Exception:
+            # Validators may signal invalid values using any exception.
+            except Exception:  # noqa: BLE001, S112
                 continue
-            else:
-                return
+            if i:
+                self._order = (*order[:i - 1], v, order[i - 1], *order[i + 1:])
+            return
         msg = f'None of {self.validators!r} satisfied for value {value!r}'
         raise ValueError(msg)
 
+    def _compile(self):
+        """
+        Compile the inline checks of the validators into a predicate, store
+        it, and return it -- or `False` if there are none.
+
+        Some inline checks raise for values of the wrong type (for example,
+        comparisons, ``len()``, and lookups of unhashable values), therefore
+        each of them is guarded on its own and one that raises counts as
+        unsatisfied.
+        """
+        self._order = tuple(self.validators)
+        globs = {}
+        checks = []
+        for i, v in enumerate(self.validators):
+            fmt = getattr(v.__class__, '_fmt_inline_check', None)
+            check = None if fmt is None else fmt(v, 'value', f'_v{i}', globs)
+            if check is not None:
+                checks.append(check)
+        if not checks:
+            self._check = False
+            return False
+        lines = ['def check(value):']
+        for check in checks:
+            lines.extend(['    try:', f'        if {check}:', '            return True', '    except (TypeError, ValueError):', '        pass'])
+        lines.append('    return False')
+        locs = {}
+        _compile_and_eval('\n'.join(lines) + '\n', globs, locs, '<attrs generated or_ validator>')
+        self._check = locs['check']
+        return self._check
+
+    def _fmt_inline_check(self, value_var, prefix, globs):
+        """
+        Return an expression that is true if *value_var* is valid for any of
+        the validators, or `None` if none of them can be checked inline.
+
+        The expression calls the compiled predicate, because the checks of
+        the members can't be combined inline without letting their exceptions
+        escape.
+        """
+        check = self._check
+        if check is None:
+            check = self._compile()
+        if check is False:
+            return None
+        globs[f'{prefix}_check'] = check
+        return f'{prefix}_check({value_var})'
+
+    def __getstate__(self):
+        return {'validators': self.validators}
+
+    def __setstate__(self, state):
+        self.validators = state['validators']
+        self._check = None
+        self._order = ()
+
     def __repr__(self):
         return f'<or validator wrapping {self.validators!r}>'
 
@@ -542,5 +1038,11 @@ def or_(*validators):
             failed all of them.
 
     .. versionadded:: 24.1.0
+    .. versionchanged:: 24.3.0
+       Built-in validators are checked without raising and catching
+       exceptions and the validators that succeed most are tried first.
     """
-    pass
\ No newline at end of file
+    vals = []
+    for v in validators:
+        vals.extend(v.validators if isinstance(v, _OrValidator) else [v])
+    return _OrValidator(tuple(vals))
\ No newline at end of file
@@ -31,19 +31,25 @@ def disabled() -> ContextManager[None]: ...
 # To be more precise on instance_of use some overloads.
 # If there are more than 3 items in the tuple then we fall back to Any
 @overload
-def instance_of(type: type[_T]) -> _ValidatorType[_T]: ...
+def instance_of(
+    type: type[_T], *, cache: bool = ...
+) -> _ValidatorType[_T]: ...
 @overload
-def instance_of(type: tuple[type[_T]]) -> _ValidatorType[_T]: ...
+def instance_of(
+    type: tuple[type[_T]], *, cache: bool = ...
+) -> _ValidatorType[_T]: ...
 @overload
 def instance_of(
-    type: tuple[type[_T1], type[_T2]]
+    type: tuple[type[_T1], type[_T2]], *, cache: bool = ...
 ) -> _ValidatorType[_T1 | _T2]: ...
 @overload
 def instance_of(
-    type: tuple[type[_T1], type[_T2], type[_T3]]
+    type: tuple[type[_T1], type[_T2], type[_T3]], *, cache: bool = ...
 ) -> _ValidatorType[_T1 | _T2 | _T3]: ...
 @overload
-def instance_of(type: tuple[type, ...]) -> _ValidatorType[Any]: ...
+def instance_of(
+    type: tuple[type, ...], *, cache: bool = ...
+) -> _ValidatorType[Any]: ...
 def optional(
     validator: (
         _ValidatorType[_T]
@@ -58,14 +64,21 @@ def matches_re(
     flags: int = ...,
     func: Callable[[AnyStr, AnyStr, int], Match[AnyStr] | None] | None = ...,
 ) -> _ValidatorType[AnyStr]: ...
+class TrackedList(list[_T]): ...
+
 def deep_iterable(
     member_validator: _ValidatorArgType[_T],
     iterable_validator: _ValidatorType[_I] | None = ...,
+    *,
+    sample: int | None = ...,
+    cache: bool = ...,
 ) -> _ValidatorType[_I]: ...
 def deep_mapping(
     key_validator: _ValidatorType[_K],
     value_validator: _ValidatorType[_V],
     mapping_validator: _ValidatorType[_M] | None = ...,
+    *,
+    sample: int | None = ...,
 ) -> _ValidatorType[_M]: ...
 def is_callable() -> _ValidatorType[_T]: ...
 def lt(val: _T) -> _ValidatorType[_T]: ...
@@ -6,18 +6,25 @@ from attr import (
     AttrsInstance,
     Converter,
     Factory,
+    ReprLimit,
     _make_getattr,
     assoc,
     cmp_using,
     define,
+    dump_json,
     evolve,
     field,
     fields,
     fields_dict,
+    finalize_module,
+    from_columns,
+    from_rows,
     frozen,
     has,
+    iter_json,
     make_class,
     mutable,
+    repr_limit,
     resolve_types,
     validate,
 )
@@ -46,6 +53,7 @@ __all__ = [
     "Converter",
     "converters",
     "define",
+    "dump_json",
     "evolve",
     "exceptions",
     "Factory",
@@ -53,11 +61,17 @@ __all__ = [
     "fields_dict",
     "fields",
     "filters",
+    "finalize_module",
+    "from_columns",
+    "from_rows",
     "frozen",
     "has",
+    "iter_json",
     "make_class",
     "mutable",
     "NOTHING",
+    "ReprLimit",
+    "repr_limit",
     "resolve_types",
     "setters",
     "validate",
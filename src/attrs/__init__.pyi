@@ -26,15 +26,22 @@ from attr import AttrsInstance as AttrsInstance
 from attr import cmp_using as cmp_using
 from attr import converters as converters
 from attr import Converter as Converter
+from attr import dump_json as dump_json
 from attr import evolve as evolve
 from attr import exceptions as exceptions
 from attr import Factory as Factory
 from attr import fields as fields
 from attr import fields_dict as fields_dict
 from attr import filters as filters
+from attr import finalize_module as finalize_module
+from attr import from_columns as from_columns
+from attr import from_rows as from_rows
 from attr import has as has
+from attr import iter_json as iter_json
 from attr import make_class as make_class
 from attr import NOTHING as NOTHING
+from attr import ReprLimit as ReprLimit
+from attr import repr_limit as repr_limit
 from attr import resolve_types as resolve_types
 from attr import setters as setters
 from attr import validate as validate
@@ -168,6 +175,11 @@ def define(
     on_setattr: _OnSetAttrArgType | None = ...,
     field_transformer: _FieldTransformer | None = ...,
     match_args: bool = ...,
+    lazy_methods: bool = ...,
+    defer: bool = ...,
+    incremental_hash: bool = ...,
+    intern: bool = ...,
+    repr_limit: ReprLimit | bool | None = ...,
 ) -> _C: ...
 @overload
 @dataclass_transform(field_specifiers=(attrib, field))
@@ -194,6 +206,11 @@ def define(
     on_setattr: _OnSetAttrArgType | None = ...,
     field_transformer: _FieldTransformer | None = ...,
     match_args: bool = ...,
+    lazy_methods: bool = ...,
+    defer: bool = ...,
+    incremental_hash: bool = ...,
+    intern: bool = ...,
+    repr_limit: ReprLimit | bool | None = ...,
 ) -> Callable[[_C], _C]: ...
 
 mutable = define
@@ -223,6 +240,11 @@ def frozen(
     on_setattr: _OnSetAttrArgType | None = ...,
     field_transformer: _FieldTransformer | None = ...,
     match_args: bool = ...,
+    lazy_methods: bool = ...,
+    defer: bool = ...,
+    incremental_hash: bool = ...,
+    intern: bool = ...,
+    repr_limit: ReprLimit | bool | None = ...,
 ) -> _C: ...
 @overload
 @dataclass_transform(frozen_default=True, field_specifiers=(attrib, field))
@@ -249,4 +271,9 @@ def frozen(
     on_setattr: _OnSetAttrArgType | None = ...,
     field_transformer: _FieldTransformer | None = ...,
     match_args: bool = ...,
+    lazy_methods: bool = ...,
+    defer: bool = ...,
+    incremental_hash: bool = ...,
+    intern: bool = ...,
+    repr_limit: ReprLimit | bool | None = ...,
 ) -> Callable[[_C], _C]: ...
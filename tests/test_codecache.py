@@ -0,0 +1,249 @@
+# SPDX-License-Identifier: MIT
+
+"""
+Tests for `attr._codecache`.
+"""
+
+import marshal
+import sys
+import threading
+import types
+
+import pytest
+
+from attr import _codecache
+
+
+SCRIPT = "def __init__(self, x):\n    self.x = x\n"
+
+
+@pytest.fixture(name="module")
+def _module(tmp_path):
+    """
+    A fake module that lives in *tmp_path*.
+    """
+    name = "attrs_codecache_test_mod"
+    mod = types.ModuleType(name)
+    mod.__file__ = str(tmp_path / f"{name}.py")
+    sys.modules[name] = mod
+
+    yield mod
+
+    del sys.modules[name]
+    _codecache._caches.clear()
+
+
+def _filename(mod):
+    return f"<attrs generated __init__ {mod.__name__}.C>"
+
+
+class TestModuleNameForFilename:
+    def test_finds_module(self, module):
+        """
+        The longest prefix that is an imported module wins.
+        """
+        assert module.__name__ == _codecache._module_name_for_filename(
+            f"<attrs generated __eq__ {module.__name__}.f.<locals>.C-2>"
+        )
+
+    @pytest.mark.parametrize(
+        "filename",
+        ["", "<string>", "<attrs generated __init__ not_a_module_xyz.C>"],
+    )
+    def test_unknown(self, filename):
+        """
+        Returns None for foreign filenames and unknown modules.
+        """
+        assert None is _codecache._module_name_for_filename(filename)
+
+
+class TestCompileCached:
+    def test_cache_path(self, module, tmp_path):
+        """
+        The cache lives in __pycache__ and is tagged with the cache tag.
+        """
+        assert (
+            tmp_path
+            / "__pycache__"
+            / f"{module.__name__}.attrs.{sys.implementation.cache_tag}.bin"
+        ) == _codecache._cache_path_for(module.__name__)
+
+    def test_roundtrip(self, module):
+        """
+        Code objects are written on flush and loaded by a fresh cache without
+        compiling again.
+        """
+        fn = _filename(module)
+        code = _codecache.compile_cached(SCRIPT, fn)
+
+        assert fn == code.co_filename
+
+        _codecache.flush()
+        _codecache._caches.clear()
+
+        cache = _codecache._get_cache(fn)
+
+        assert code == cache.get(_codecache._make_key(SCRIPT, fn))
+
+    def test_key_depends_on_script(self):
+        """
+        Different scripts or filenames lead to different keys.
+        """
+        assert _codecache._make_key(SCRIPT, "a") != _codecache._make_key(
+            SCRIPT + "\n", "a"
+        )
+        assert _codecache._make_key(SCRIPT, "a") != _codecache._make_key(
+            SCRIPT, "b"
+        )
+
+    def test_wrong_magic(self, module):
+        """
+        Cache files written by other Python versions are ignored.
+        """
+        fn = _filename(module)
+        path = _codecache._cache_path_for(module.__name__)
+        key = _codecache._make_key(SCRIPT, fn)
+        _codecache.compile_cached(SCRIPT, fn)
+        _codecache.flush()
+
+        data = path.read_bytes()
+        path.write_bytes(
+            b"\x00" * len(_codecache._MAGIC) + data[len(_codecache._MAGIC) :]
+        )
+
+        assert None is _codecache._ModuleCodeCache(path).get(key)
+
+    def test_corrupt(self, module):
+        """
+        Corrupt cache files are ignored.
+        """
+        path = _codecache._cache_path_for(module.__name__)
+        path.parent.mkdir()
+        path.write_bytes(_codecache._MAGIC + b"garbage")
+
+        assert {} == _codecache._ModuleCodeCache(path)._codes
+
+    def test_prunes_unused(self, module):
+        """
+        Only entries used by the current process are written back.
+        """
+        fn = _filename(module)
+        path = _codecache._cache_path_for(module.__name__)
+        _codecache.compile_cached(SCRIPT, fn)
+        _codecache.compile_cached("x = 1\n", fn)
+        _codecache.flush()
+        _codecache._caches.clear()
+
+        _codecache.compile_cached(SCRIPT, fn)
+        _codecache.flush()
+
+        codes = marshal.loads(path.read_bytes()[len(_codecache._MAGIC) :])
+
+        assert [_codecache._make_key(SCRIPT, fn)] == list(codes)
+
+    def test_no_file(self, module):
+        """
+        Scripts for classes from modules without a file are just compiled.
+        """
+        del module.__file__
+        fn = _filename(module)
+
+        code = _codecache.compile_cached(SCRIPT, fn)
+
+        assert {} == _codecache._caches
+        assert fn == code.co_filename
+
+
+class TestCodeMemo:
+    def test_hit_replaces_filename(self):
+        """
+        Identical scripts are compiled only once, but each code object -- and
+        the code objects nested within -- carries the filename it's asked for.
+        """
+        memo = _codecache._CodeMemo(8)
+
+        c1 = memo.get(SCRIPT, "<a>")
+        c2 = memo.get(SCRIPT, "<b>")
+
+        assert (1, 1, 8, 1) == memo.info()
+        assert "<a>" == c1.co_filename
+        assert "<b>" == c2.co_filename
+        assert ["<b>"] == [
+            c.co_filename for c in c2.co_consts if isinstance(c, type(c2))
+        ]
+
+    def test_rebinds_globals(self):
+        """
+        Functions created from memoized code objects use the globals they have
+        been evaluated in.
+        """
+        memo = _codecache._CodeMemo(8)
+        script = "def f(x=default):\n    return (x, g)\n"
+        fs = []
+        for i in range(2):
+            globs = {"default": i, "g": str(i)}
+            locs = {}
+            eval(memo.get(script, f"<f{i}>"), globs, locs)
+            fs.append(locs["f"])
+
+        assert 1 == memo.hits
+        assert [(0, "0"), (1, "1")] == [f() for f in fs]
+
+    def test_lru(self):
+        """
+        The least recently used entry is evicted once maxsize is exceeded.
+        """
+        memo = _codecache._CodeMemo(2)
+
+        memo.get("a = 1", "<a>")
+        memo.get("b = 1", "<b>")
+        memo.get("a = 1", "<a>")
+        memo.get("c = 1", "<c>")
+
+        assert ["a = 1", "c = 1"] == list(memo._codes)
+        assert (1, 3, 2, 2) == memo.info()
+
+    def test_threads(self):
+        """
+        Concurrent evictions don't raise.
+        """
+        memo = _codecache._CodeMemo(2)
+        errors = []
+
+        def work(i):
+            try:
+                for j in range(200):
+                    memo.get(f"x = {(i + j) % 5}", "<x>")
+            except Exception as e:  # noqa: BLE001
+                errors.append(e)
+
+        threads = [threading.Thread(target=work, args=(i,)) for i in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert [] == errors
+        assert 2 == memo.info().currsize
+
+    def test_clear(self):
+        """
+        clear() resets entries and counters.
+        """
+        memo = _codecache._CodeMemo(2)
+        memo.get("a = 1", "<a>")
+
+        memo.clear()
+
+        assert (0, 0, 2, 0) == memo.info()
+
+    def test_disabled(self):
+        """
+        A maxsize of 0 compiles every time.
+        """
+        memo = _codecache._CodeMemo(0)
+
+        memo.get("a = 1", "<a>")
+        memo.get("a = 1", "<a>")
+
+        assert (0, 0, 0, 0) == memo.info()
@@ -295,3 +295,96 @@ class TestToBool:
         assert not to_bool("f")
         assert not to_bool("no")
         assert not to_bool("off")
+
+
+def _inline(converter):
+    """
+    Compile the inline expansion of *converter* into a function that takes
+    the instance and the value and returns the converted value.
+    """
+    if not isinstance(converter, Converter):
+        converter = Converter(converter)
+    globs = {"attr_dict": {"x": "field"}}
+    lines = converter._fmt_converter_lines("x", "x", globs)
+    script = "def convert(self, x):\n" + "".join(
+        f"    {line}\n" for line in [*lines, "return x"]
+    )
+    locs = {}
+    exec(script, globs, locs)
+
+    return lines, locs["convert"]
+
+
+def _outcome(func, *args):
+    try:
+        return func(*args)
+    except Exception as e:  # noqa: BLE001
+        return type(e), str(e)
+
+
+class TestInline:
+    """
+    Tests for expanding built-in converters inline.
+    """
+
+    @pytest.mark.parametrize(
+        ("converter", "values"),
+        [
+            (to_bool, [True, 0, 1.0, "On", "0", 2, [], None]),
+            (optional(int), [None, "3", "x"]),
+            (default_if_none(5), [None, 0]),
+            (default_if_none(factory=list), [None, "a"]),
+            (
+                pipe(optional(str), default_if_none("d"), to_bool),
+                [None, 1, "no", "zz"],
+            ),
+            (pipe(), [1]),
+            (optional(pipe()), [None, 1]),
+            (
+                pipe(int, Converter(lambda v, f: (v, f), takes_field=True)),
+                ["4"],
+            ),
+            (optional(Converter(lambda v, s: (v, s), takes_self=True)), [1]),
+        ],
+    )
+    def test_like_call(self, converter, values):
+        """
+        Inline expansions convert -- and fail -- like calling the converter.
+        """
+        _, convert = _inline(converter)
+        if isinstance(converter, Converter):
+
+            def call(v):
+                return converter(v, None, "field")
+
+        else:
+            call = converter
+
+        for v in values:
+            assert _outcome(call, v) == _outcome(convert, None, v)
+
+    @pytest.mark.parametrize(
+        "converter",
+        [
+            to_bool,
+            optional(int),
+            default_if_none(0),
+            pipe(default_if_none("1"), to_bool),
+        ],
+    )
+    def test_no_calls(self, converter):
+        """
+        Built-in converters don't call out unless a conversion is necessary.
+        """
+        lines, _ = _inline(converter)
+
+        assert "__attr_converter_x(x)" not in [line.strip() for line in lines]
+
+    def test_other_converters(self):
+        """
+        Other converters are called like _fmt_converter_call does it.
+        """
+        assert ["x = __attr_converter_x(x)"] == _inline(int)[0]
+        assert ["x = __attr_converter_x(x, self)"] == _inline(
+            Converter(lambda v, s: v, takes_self=True)
+        )[0]
@@ -6,8 +6,10 @@ Tests for dunder methods from `attrib._make`.
 
 
 import copy
+import enum
 import inspect
 import pickle
+import typing
 
 import pytest
 
@@ -16,11 +18,16 @@ from hypothesis.strategies import booleans
 
 import attr
 
+from attr import _compat
 from attr._make import (
     NOTHING,
     Factory,
     _add_repr,
+    _make_eq,
     _make_init,
+    _make_order,
+    _make_sort_key,
+    _repr_is_acyclic,
     fields,
     make_class,
 )
@@ -320,6 +327,121 @@ class TestEqOrder:
         """
         assert NotImplemented == (cls(1, 2).__ge__(42))
 
+    def test_order_keys_computed_lazily(self):
+        """
+        Order keys are only computed for fields that are reached.
+        """
+        keyed = []
+
+        def key(value):
+            keyed.append(value)
+            return value
+
+        C = make_class(
+            "C", {"a": attr.ib(), "b": attr.ib(order=key)}, order=True
+        )
+        lt, le, gt, ge = _make_order(C, C.__attrs_attrs__)
+
+        assert lt(C(1, "x"), C(2, "y"))
+        assert ge(C(1, "x"), C(1, "x"))
+        assert ["x", "x"] == keyed
+
+    @pytest.mark.parametrize(
+        "cls", [OrderC, OrderCSlots, OrderCallableC, OrderCallableCSlots]
+    )
+    def test_sort_key(self, cls):
+        """
+        __attrs_sort_key__ returns tuples that order like the instances.
+        """
+        sort_key = _make_sort_key(cls, cls.__attrs_attrs__)
+        insts = [cls(*a) for a in [("b", "A"), ("B", "b"), ("a", "a")]]
+
+        assert sorted(insts) == sorted(insts, key=sort_key)
+        assert sort_key(insts[2]) < sort_key(insts[0])
+
+    def test_sort_key_empty(self):
+        """
+        Classes without ordered fields have empty sort keys.
+        """
+        C = make_class("C", {"a": attr.ib(order=False)}, order=True)
+
+        assert () == _make_sort_key(C, C.__attrs_attrs__)(C(1))
+
+    @pytest.mark.parametrize("cls", [EqC, EqCSlots])
+    def test_eq_identical_members(self, cls):
+        """
+        Like tuples, __eq__ checks fields for identity before equality.
+        """
+        nan = float("nan")
+
+        assert cls(nan, 1) == cls(nan, 1)
+        assert cls(float("nan"), 1) != cls(float("nan"), 1)
+
+    @pytest.mark.parametrize("cls", [EqC, EqCSlots])
+    def test_eq_stops_early(self, cls):
+        """
+        __eq__ stops comparing at the first field that differs.
+        """
+        compared = []
+
+        class Loud:
+            def __eq__(self, other):
+                compared.append(self)
+                return False
+
+        assert cls(1, Loud()) != cls(2, Loud())
+        assert [] == compared
+
+    @pytest.mark.parametrize(
+        "cls", [HashCSlotsCached, HashCFrozenNotSlotsCached]
+    )
+    def test_eq_cached_hash(self, cls):
+        """
+        If both hashes of instances of frozen classes have been cached
+        already and differ, fields aren't compared.
+        """
+        eq = _make_eq(cls, cls.__attrs_attrs__, cache_hash=True, frozen=True)
+        i1, i2, i3 = cls(1, "b"), cls(2, "b"), cls(1, "b")
+        hash(i1)
+        hash(i2)
+
+        assert False is eq(i1, i2)
+        assert True is eq(i1, i3)
+        assert True is eq(i1, i1)
+
+    def test_eq_cached_hash_not_frozen(self):
+        """
+        Cached hashes of instances of classes that aren't frozen are ignored,
+        since they're stale once a field changes.
+        """
+        eq = _make_eq(
+            HashCCached, HashCCached.__attrs_attrs__, cache_hash=True
+        )
+        i1, i2 = HashCCached(1, "b"), HashCCached(2, "b")
+        hash(i1)
+        hash(i2)
+        i2.a = 1
+
+        assert True is eq(i1, i2)
+
+    def test_eq_cached_hash_unequal_hash_fields(self):
+        """
+        If a field is hashed, but not compared, cached hashes are ignored.
+        """
+        C = make_class(
+            "C",
+            {"a": attr.ib(), "b": attr.ib(eq=False, hash=True)},
+            frozen=True,
+            unsafe_hash=True,
+            cache_hash=True,
+        )
+        eq = _make_eq(C, C.__attrs_attrs__, cache_hash=True, frozen=True)
+        i1, i2 = C(1, 1), C(1, 2)
+        hash(i1)
+        hash(i2)
+
+        assert True is eq(i1, i2)
+
 
 class TestAddRepr:
     """
@@ -390,6 +512,80 @@ class TestAddRepr:
         cycle.cycle = {"cycle": [cycle]}
         assert "LongCycle(value=14, cycle={'cycle': [...]})" == repr(cycle)
 
+    def test_acyclic_skips_guard(self, monkeypatch):
+        """
+        If no field can lead back to the instance judging by its type, the
+        recursion guard isn't touched.
+        """
+
+        @attr.s
+        class C:
+            a = attr.ib(type=int)
+            b = attr.ib(type=typing.Optional[str])
+
+        monkeypatch.delattr(_compat, "repr_context")
+
+        assert "C(a=1, b=None)" == repr(C(1, None))
+
+    def test_nested_class_name(self):
+        """
+        The precomputed class name is stripped of the <locals> part, but
+        subclasses still use their own.
+        """
+
+        @attr.s(auto_attribs=True)
+        class C:
+            a: int
+
+        class D(C):
+            pass
+
+        assert "C(a=1)" == repr(C(1))
+        assert "D(a=1)" == repr(D(1))
+
+    class Color(enum.Enum):
+        RED = 1
+
+    @pytest.mark.parametrize(
+        "tp",
+        [
+            int,
+            "str",
+            Color,
+            typing.Optional[int],
+            typing.Tuple[int, ...],
+            typing.FrozenSet[bytes],
+            typing.Union[int, str, None],
+        ],
+    )
+    def test_acyclic(self, tp):
+        """
+        Scalars, enums, and unions and immutable containers thereof can't
+        lead back to the instance.
+        """
+        assert _repr_is_acyclic(tp)
+
+    @pytest.mark.parametrize(
+        "tp",
+        [
+            None,
+            object,
+            list,
+            "list",
+            "C",
+            tuple,
+            typing.Any,
+            typing.List[int],
+            typing.Tuple[int, list],
+            typing.Optional[typing.Dict[str, int]],
+        ],
+    )
+    def test_maybe_cyclic(self, tp):
+        """
+        Anything else could.
+        """
+        assert not _repr_is_acyclic(tp)
+
     def test_underscores(self):
         """
         repr does not strip underscores.
@@ -516,6 +712,75 @@ class TestAddHash:
             )
         assert exc_args == e.value.args
 
+    @pytest.mark.parametrize("cache_hash", [True, False])
+    def test_incremental_hash(self, cache_hash):
+        """
+        Incremental hashes are equal for equal instances and take the order
+        of the fields and their eq keys into account.
+        """
+        C = make_class(
+            "C",
+            {"a": attr.ib(), "b": attr.ib(eq=str.lower)},
+            frozen=True,
+            unsafe_hash=True,
+            cache_hash=cache_hash,
+            incremental_hash=True,
+        )
+
+        assert hash(C(1, "x")) == hash(C(1, "X"))
+        assert hash(C("x", "y")) != hash(C("y", "x"))
+        assert hash(C("x", "x")) != hash(C("y", "y"))
+
+        if cache_hash:
+            old = C(1, "x")
+            hash(old)
+            new = C(1, "Y")
+
+            C.__attrs_hash_update__(new, old)
+
+            assert C(1, "y").__hash__() == new._attrs_cached_hash
+
+    def test_hash_update(self):
+        """
+        __attrs_hash_update__ derives the cached hash of an instance from the
+        cached hash of the instance it has been derived from.
+        """
+        C = make_class(
+            "C",
+            ["a", "b", "c"],
+            frozen=True,
+            unsafe_hash=True,
+            cache_hash=True,
+            incremental_hash=True,
+        )
+        old = C(1, (2, 3), "4")
+        hash(old)
+        new = C(1, (2, 3), "5")
+
+        C.__attrs_hash_update__(new, old)
+
+        assert new._attrs_cached_hash is not None
+        assert C(1, (2, 3), "5").__hash__() == new._attrs_cached_hash
+        assert hash(C(1, (2, 3), "5")) == hash(new)
+
+    def test_hash_update_uncached(self):
+        """
+        If the old instance hasn't cached its hash yet, nothing happens.
+        """
+        C = make_class(
+            "C",
+            ["a"],
+            frozen=True,
+            unsafe_hash=True,
+            cache_hash=True,
+            incremental_hash=True,
+        )
+        new = C(2)
+
+        C.__attrs_hash_update__(new, C(1))
+
+        assert None is new._attrs_cached_hash
+
     def test_enforce_no_cached_hash_without_init(self):
         """
         Ensure exception is thrown if caching the hash code is requested
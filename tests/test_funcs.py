@@ -16,8 +16,18 @@ from hypothesis import strategies as st
 
 import attr
 
-from attr import asdict, assoc, astuple, evolve, fields, has
+from attr import (
+    asdict,
+    assoc,
+    astuple,
+    evolve,
+    fields,
+    from_columns,
+    from_rows,
+    has,
+)
 from attr._compat import Mapping, Sequence
+from attr._funcs import _can_inline_init
 from attr.exceptions import AttrsAttributeNotFoundError
 from attr.validators import instance_of
 
@@ -280,6 +290,111 @@ class TestAsDict:
             attr.asdict(instance, retain_collection_types=True)
 
 
+class TestAsDictFastPath:
+    """
+    Tests for the generated per-class `asdict` serializers.
+    """
+
+    @staticmethod
+    def _generic(inst, **kw):
+        """
+        Force the generic code path by passing a no-op filter.
+        """
+        return asdict(inst, filter=lambda a, v: True, **kw)
+
+    def test_generated_on_first_use(self):
+        """
+        The serializer is generated on the first call and attached to the
+        class -- but not to its subclasses.
+        """
+
+        @attr.s
+        class C:
+            x = attr.ib()
+
+        class D(C):
+            pass
+
+        assert "__attrs_asdict__" not in C.__dict__
+
+        asdict(C(1))
+        serialize = C.__dict__["__attrs_asdict__"]
+        asdict(C(2))
+
+        assert serialize is C.__dict__["__attrs_asdict__"]
+        assert "__attrs_asdict__" not in D.__dict__
+        assert {"x": 3} == asdict(D(3))
+        assert "__attrs_asdict__" in D.__dict__
+
+    @given(nested_classes, st.booleans())
+    def test_same_as_generic(self, cls, retain):
+        """
+        The fast path returns the same as the generic code path.
+        """
+        obj = cls()
+
+        assert self._generic(obj, retain_collection_types=retain) == asdict(
+            obj, retain_collection_types=retain
+        )
+
+    @pytest.mark.parametrize("retain", [True, False])
+    def test_collections(self, C, retain):
+        """
+        Collections are serialized like by the generic code path, including
+        dicts with collections as keys.
+        """
+        obj = C(
+            [C(1, (2, C(3, 4))), {5}],
+            {(1, 2): C(frozenset([3]), None), frozenset([4]): [C(5, 6)]},
+        )
+
+        assert self._generic(obj, retain_collection_types=retain) == asdict(
+            obj, retain_collection_types=retain
+        )
+
+    def test_lying_annotations(self):
+        """
+        Fields whose values aren't of the type they're annotated with are
+        still serialized properly.
+        """
+
+        @attr.s(auto_attribs=True)
+        class Inner:
+            x: int
+
+        @attr.s(auto_attribs=True)
+        class C:
+            a: int
+            b: "str"
+
+        assert {"a": {"x": 1}, "b": [{"x": 2}]} == asdict(
+            C(Inner(1), (Inner(2),))
+        )
+
+    def test_nested_named_tuple_retain_type(self):
+        """
+        Namedtuples nested in collections can be serialized if
+        retain_collection_types is True.
+        """
+
+        class Coordinates(NamedTuple):
+            lat: float
+            lon: float
+
+        @attr.s
+        class A:
+            coords = attr.ib()
+
+        instance = A([Coordinates(50.419019, 30.516225)])
+
+        assert {"coords": [Coordinates(50.419019, 30.516225)]} == asdict(
+            instance, retain_collection_types=True
+        )
+        assert {"coords": [Coordinates(50.419019, 30.516225)]} == (
+            self._generic(instance, retain_collection_types=True)
+        )
+
+
 class TestAsTuple:
     """
     Tests for `astuple`.
@@ -484,6 +599,79 @@ class TestAsTuple:
             attr.astuple(instance, retain_collection_types=True)
 
 
+class TestAsTupleFastPath:
+    """
+    Tests for the generated per-class `astuple` serializers.
+    """
+
+    @staticmethod
+    def _generic(inst, **kw):
+        """
+        Force the generic code path by passing a no-op filter.
+        """
+        return astuple(inst, filter=lambda a, v: True, **kw)
+
+    def test_generated_on_first_use(self, C):
+        """
+        The serializer is generated on the first call and attached to the
+        class.
+        """
+
+        @attr.s
+        class D:
+            x = attr.ib()
+
+        assert "__attrs_astuple__" not in D.__dict__
+
+        assert (1,) == astuple(D(1))
+        assert "__attrs_astuple__" in D.__dict__
+
+    def test_empty(self):
+        """
+        Classes without fields are serialized to empty tuples.
+        """
+
+        @attr.s
+        class E:
+            pass
+
+        assert () == astuple(E())
+
+    @given(nested_classes, st.booleans())
+    def test_same_as_generic(self, cls, retain):
+        """
+        The fast path returns the same as the generic code path.
+        """
+        obj = cls()
+
+        assert self._generic(obj, retain_collection_types=retain) == astuple(
+            obj, retain_collection_types=retain
+        )
+
+    @pytest.mark.parametrize("retain", [True, False])
+    def test_collections(self, C, retain):
+        """
+        Like the generic code path, only instances directly within
+        collections are serialized.
+        """
+
+        @attr.s(frozen=True)
+        class Key:
+            x = attr.ib()
+            y = attr.ib()
+
+        obj = C(
+            [C(1, 2), (C(3, 4),), {5}],
+            OrderedDict([(Key(1, 2), C(3, 4)), ((5, 6), [C(7, 8)])]),
+        )
+        expected = self._generic(obj, retain_collection_types=retain)
+
+        assert expected == astuple(obj, retain_collection_types=retain)
+        assert type(expected[1]) is type(
+            astuple(obj, retain_collection_types=retain)[1]
+        )
+
+
 class TestHas:
     """
     Tests for `has`.
@@ -811,3 +999,331 @@ class TestEvolve:
             inst: int
 
         assert C(42) == evolve(C(23), inst=42)
+
+    def test_generated_on_first_use(self):
+        """
+        The specialized evolve is generated on first use and attached to the
+        class -- but not to its subclasses.
+        """
+
+        @attr.s
+        class C:
+            x = attr.ib()
+
+        class D(C):
+            pass
+
+        assert "__attrs_evolve__" not in C.__dict__
+
+        assert C(2) == evolve(C(1), x=2)
+        assert "__attrs_evolve__" in C.__dict__
+        assert "__attrs_evolve__" not in D.__dict__
+
+        d = evolve(D(1), x=2)
+
+        assert D is d.__class__
+        assert 2 == d.x
+
+    def test_runs_initializer(self):
+        """
+        Converters, validators -- including ones that look at other fields --
+        and __attrs_post_init__ run like they do when instantiating.
+        """
+
+        @attr.s(frozen=True)
+        class C:
+            lo = attr.ib(converter=int)
+            hi = attr.ib()
+            span = attr.ib(init=False)
+
+            @hi.validator
+            def _check(self, attribute, value):
+                if value < self.lo:
+                    raise ValueError("hi < lo")
+
+            def __attrs_post_init__(self):
+                object.__setattr__(self, "span", self.hi - self.lo)
+
+        c = C("1", 5)
+
+        assert 2 == evolve(c, lo="3").span
+
+        with pytest.raises(ValueError, match="hi < lo"):
+            evolve(c, lo=6)
+
+    def test_incremental_hash(self):
+        """
+        The cached hash of an instance with an incremental hash is derived
+        from the cached hash of the evolved instance without hashing the
+        unchanged fields.
+        """
+        hashed = []
+
+        class Loud:
+            def __hash__(self):
+                hashed.append(self)
+                return 42
+
+        @attr.s(
+            frozen=True,
+            unsafe_hash=True,
+            cache_hash=True,
+            incremental_hash=True,
+        )
+        class C:
+            a = attr.ib()
+            b = attr.ib()
+
+        loud = Loud()
+        c = C(loud, 1)
+        hash(c)
+        del hashed[:]
+
+        c2 = evolve(c, b=2)
+
+        assert [] == hashed
+        assert C(loud, 2).__hash__() == c2._attrs_cached_hash
+
+    def test_copies_unchanged(self):
+        """
+        If the initializer can be bypassed, only the changed fields are
+        converted and validated, and fields with init=False are reset to
+        their defaults.
+        """
+        calls = []
+
+        def conv(value):
+            calls.append(("convert", value))
+            return value * 2
+
+        def val(inst, attribute, value):
+            calls.append(("validate", attribute.name, value))
+
+        @attr.s(frozen=True, slots=True)
+        class C:
+            x = attr.ib(converter=conv, validator=val)
+            _y = attr.ib(converter=conv, validator=val)
+            z = attr.ib(
+                init=False,
+                default=attr.Factory(lambda self: self.x + 1, takes_self=True),
+                validator=val,
+            )
+
+        c = C(1, 2)
+        del calls[:]
+
+        c2 = evolve(c, y=5)
+
+        assert (2, 10, 3) == (c2.x, c2._y, c2.z)
+        assert [
+            ("convert", 5),
+            ("validate", "_y", 10),
+            ("validate", "z", 3),
+        ] == calls
+
+        with pytest.raises(
+            TypeError, match="got an unexpected keyword argument '_y'"
+        ):
+            evolve(c, _y=5)
+
+        del calls[:]
+
+        with attr.validators.disabled():
+            evolve(c, x=3)
+
+        assert [("convert", 3)] == calls
+
+    def test_custom_setattr(self):
+        """
+        Classes with a custom __setattr__ are evolved by calling them, such
+        that __setattr__ runs for every field.
+        """
+        calls = []
+
+        @attr.s
+        class C:
+            x = attr.ib()
+            y = attr.ib()
+
+            def __setattr__(self, name, value):
+                calls.append((name, value))
+                object.__setattr__(self, name, value)
+
+        c = C(1, 2)
+        del calls[:]
+
+        assert C(1, 3) == evolve(c, y=3)
+        assert [("x", 1), ("y", 3)] == calls
+
+
+class TestBulk:
+    """
+    Tests for `from_rows` and `from_columns`.
+    """
+
+    @pytest.mark.parametrize("frozen", [True, False])
+    @pytest.mark.parametrize("slots", [True, False])
+    def test_like_init(self, slots, frozen):
+        """
+        Instances are equal to the ones created by calling the class,
+        including converters and defaults of fields with init=False.
+        """
+
+        @attr.s(slots=slots, frozen=frozen)
+        class C:
+            x = attr.ib(converter=int)
+            _y = attr.ib(factory=list)
+            z = attr.ib(
+                init=False,
+                default=attr.Factory(lambda self: self.x * 2, takes_self=True),
+            )
+
+        rows = [("1", [1]), ("2", [])]
+
+        assert [C(*row) for row in rows] == from_rows(C, rows)
+        assert [C("1"), C("2")] == from_columns(C, x=["1", "2"])
+
+    def test_validators(self):
+        """
+        Validators run for all instances, unless they're disabled.
+        """
+        seen = []
+
+        @attr.s
+        class C:
+            x = attr.ib(validator=lambda _, a, v: seen.append((a.name, v)))
+
+        from_rows(C, [(1,), (2,)])
+
+        assert [("x", 1), ("x", 2)] == seen
+
+        with attr.validators.disabled():
+            from_rows(C, [(3,)])
+
+        assert 2 == len(seen)
+
+    def test_bypasses_init(self):
+        """
+        Classes with a generated __init__ are instantiated without calling
+        it, and validators with validate_many get whole columns.
+        """
+        calls = []
+
+        class Validator:
+            def __call__(self, inst, attribute, value):
+                calls.append(("call", value))
+
+            def validate_many(self, attribute, values):
+                calls.append(("many", list(values)))
+
+        @attr.s
+        class C:
+            x = attr.ib(validator=Validator())
+
+        assert _can_inline_init(C)
+
+        from_rows(C, [(1,), (2,)])
+        from_columns(C, x=[3, 4])
+
+        assert [("many", [1, 2]), ("many", [3, 4])] == calls
+
+    def test_custom_setattr(self):
+        """
+        Classes with a custom __setattr__ are instantiated by calling them,
+        such that __setattr__ runs for every field.
+        """
+        calls = []
+
+        @attr.s
+        class C:
+            x = attr.ib()
+
+            def __setattr__(self, name, value):
+                calls.append((name, value))
+                object.__setattr__(self, name, value)
+
+        assert not _can_inline_init(C)
+
+        from_rows(C, [(1,)])
+        from_columns(C, x=[2])
+
+        assert [("x", 1), ("x", 2)] == calls
+
+    def test_validator_fails(self):
+        """
+        Failing validators raise like they do in __init__.
+        """
+
+        @attr.s
+        class C:
+            x = attr.ib(validator=instance_of(int))
+
+        with pytest.raises(TypeError):
+            from_columns(C, x=[1, "2"])
+
+    def test_post_init(self):
+        """
+        Classes with __attrs_post_init__ are instantiated by calling them.
+        """
+
+        @attr.s
+        class C:
+            x = attr.ib()
+
+            def __attrs_post_init__(self):
+                self.y = self.x + 1
+
+        assert [2, 3] == [c.y for c in from_rows(C, [(1,), (2,)])]
+
+    def test_cached(self):
+        """
+        Bulk constructors are generated once per class and set of columns.
+        """
+
+        @attr.s
+        class C:
+            x = attr.ib()
+            y = attr.ib(default=0)
+
+        from_rows(C, [])
+        from_columns(C, x=[])
+        from_columns(C, y=[], x=[])
+
+        assert {None, frozenset("x"), frozenset("xy")} == set(C.__attrs_bulk__)
+
+    def test_wrong_columns(self):
+        """
+        Unknown columns and missing columns for fields without defaults raise
+        a TypeError.
+        """
+
+        @attr.s
+        class C:
+            x = attr.ib()
+            y = attr.ib(default=0)
+
+        with pytest.raises(TypeError, match="C requires a column for 'x'."):
+            from_columns(C, y=[1])
+
+        with pytest.raises(TypeError, match="no field for the column 'z'."):
+            from_columns(C, x=[1], z=[1])
+
+    def test_wrong_row_length(self):
+        """
+        Rows need a value for each field.
+        """
+
+        @attr.s
+        class C:
+            x = attr.ib()
+            y = attr.ib(default=0)
+
+        with pytest.raises(ValueError):
+            from_rows(C, [(1,)])
+
+    def test_not_an_attrs_class(self):
+        """
+        Non-attrs classes raise NotAnAttrsClassError.
+        """
+        with pytest.raises(attr.exceptions.NotAnAttrsClassError):
+            from_rows(object, [])
@@ -0,0 +1,225 @@
+# SPDX-License-Identifier: MIT
+
+"""
+Tests for `attr._json`.
+"""
+
+import codecs
+import datetime
+import enum
+import io
+import json
+import math
+import tempfile
+
+from pathlib import Path
+
+import pytest
+
+import attr
+
+from attr.exceptions import NotAnAttrsClassError
+
+
+@attr.define
+class Leaf:
+    a: int = 1
+    b: str = "bé\n"
+    c: float = 3.0
+    d: tuple = (1, 2, 3)
+
+
+@attr.define
+class Node:
+    value: int
+    leaf: Leaf
+    child: object = None
+    tags: dict = attr.Factory(dict)
+    when: object = None
+
+
+@attr.define
+class Renamed:
+    id_: int = attr.field(metadata={"json_name": "id"})
+
+
+@attr.define
+class Empty:
+    pass
+
+
+class E(enum.IntEnum):
+    X = 3
+
+
+def dumps(inst, **kw):
+    return b"".join(attr.iter_json(inst, **kw))
+
+
+def reference(inst, **kw):
+    """
+    What the same document looks like if it's created using asdict.
+    """
+    return json.dumps(
+        attr.asdict(inst, **kw), separators=(",", ":"), ensure_ascii=False
+    ).encode()
+
+
+def _serialize(inst, field, value):
+    if isinstance(value, datetime.date):
+        return value.isoformat()
+
+    return value
+
+
+@pytest.fixture(name="tree")
+def _tree():
+    node = None
+    for i in range(20):
+        node = Node(
+            i,
+            Leaf(a=i),
+            node,
+            {
+                "k": [Leaf(), {1: None, True: 1.5, 2.5: "x"}],
+                "e": E.X,
+                "s": frozenset([1]),
+            },
+            Empty(),
+        )
+
+    return node
+
+
+class TestIterJSON:
+    def test_same_as_asdict(self, tree):
+        """
+        The document is the same as the one created from asdict.
+        """
+        assert reference(tree) == dumps(tree)
+
+    def test_filter_and_value_serializer(self):
+        """
+        filter and value_serializer are honored like by asdict.
+        """
+        inst = Node(
+            1,
+            Leaf(),
+            Node(2, Leaf()),
+            {
+                "d": datetime.date(2020, 1, 1),
+                datetime.date(2021, 1, 1): [datetime.date(2022, 1, 1)],
+            },
+            datetime.date(2023, 1, 1),
+        )
+        kw = {
+            "filter": attr.filters.exclude(attr.fields(Node).child),
+            "value_serializer": _serialize,
+        }
+
+        assert reference(inst, **kw) == dumps(inst, **kw)
+
+    def test_metadata_name(self):
+        """
+        The json_name metadata key overrides the name of a field.
+        """
+        assert b'{"id":42}' == dumps(Renamed(42))
+
+    def test_scalars(self):
+        """
+        Empty instances and non-finite floats are encoded like by json.
+        """
+        assert b"{}" == dumps(Empty())
+        assert b'{"a":1,"b":"b","c":NaN,"d":[]}' == dumps(
+            Leaf(b="b", c=math.nan, d=())
+        )
+
+    def test_default(self):
+        """
+        default is called for values that aren't JSON-serializable.
+        """
+        assert b'"when":"2020-01-01"}' in dumps(
+            Node(1, Leaf(), when=datetime.date(2020, 1, 1)), default=str
+        )
+
+    def test_not_serializable(self):
+        """
+        Values that aren't JSON-serializable raise a TypeError.
+        """
+        with pytest.raises(
+            TypeError, match="Object of type object is not JSON serializable"
+        ):
+            dumps(Node(1, Leaf(), when=object()))
+
+    def test_invalid_key(self):
+        """
+        Keys that aren't valid in JSON raise a TypeError.
+        """
+        with pytest.raises(TypeError, match="keys must be str"):
+            dumps(Node(1, Leaf(), tags={(1, 2): 3}))
+
+    def test_not_an_attrs_instance(self):
+        """
+        Non-attrs instances raise NotAnAttrsClassError immediately.
+        """
+        with pytest.raises(NotAnAttrsClassError):
+            attr.iter_json(object())
+
+    def test_chunks(self):
+        """
+        Huge documents are yielded in chunks that are at least chunk_size
+        long.
+        """
+        inst = Node(1, Leaf(), tags={"x": list(range(100_000))})
+
+        chunks = list(attr.iter_json(inst, chunk_size=1000))
+
+        assert len(chunks) > 1
+        assert all(len(c) >= 1000 for c in chunks[:-1])
+        assert reference(inst) == b"".join(chunks)
+
+
+class TestDumpJSON:
+    def test_binary(self, tree):
+        """
+        Binary files get UTF-8.
+        """
+        f = io.BytesIO()
+
+        attr.dump_json(tree, f, chunk_size=100)
+
+        assert reference(tree) == f.getvalue()
+
+    def test_text(self, tree):
+        """
+        Text files get str.
+        """
+        f = io.StringIO()
+
+        attr.dump_json(tree, f)
+
+        assert reference(tree).decode() == f.getvalue()
+
+    @pytest.mark.parametrize(
+        "kw", [{"mode": "w", "encoding": "utf-8"}, {"mode": "wb"}]
+    )
+    def test_temporary_file(self, tree, kw):
+        """
+        File-likes that aren't io streams are written according to their
+        mode.
+        """
+        with tempfile.NamedTemporaryFile(**kw) as f:
+            attr.dump_json(tree, f)
+            f.flush()
+
+            assert reference(tree) == Path(f.name).read_bytes()
+
+    def test_stream_writer(self, tree):
+        """
+        Writers without a mode get str.
+        """
+        f = io.BytesIO()
+
+        attr.dump_json(tree, codecs.getwriter("utf-8")(f))
+
+        assert reference(tree) == f.getvalue()
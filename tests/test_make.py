@@ -4,11 +4,15 @@
 Tests for `attr._make`.
 """
 import copy
+import decimal
 import functools
 import gc
 import inspect
 import itertools
+import pickle
 import sys
+import types
+import weakref
 
 from operator import attrgetter
 from typing import Generic, TypeVar
@@ -29,6 +33,8 @@ from attr._make import (
     _Attributes,
     _ClassBuilder,
     _CountingAttr,
+    _DeferredBuild,
+    _LazyMethods,
     _determine_attrib_eq_order,
     _determine_attrs_eq_order,
     _determine_whether_to_implement,
@@ -36,6 +42,7 @@ from attr._make import (
     and_,
     fields,
     fields_dict,
+    finalize_module,
     make_class,
     validate,
 )
@@ -1922,6 +1929,468 @@ class TestClassBuilder:
         assert actual == expected
 
 
+class TestLazyMethods:
+    """
+    Tests for `lazy_methods` and `_LazyMethods`.
+    """
+
+    @pytest.mark.parametrize("slots", [True, False])
+    @pytest.mark.parametrize("frozen", [True, False])
+    def test_lazy_methods(self, slots, frozen):
+        """
+        With lazy_methods=True, methods are generated on first use and
+        replace their stand-ins on the class.
+        """
+
+        @attr.s(
+            slots=slots,
+            frozen=frozen,
+            order=True,
+            unsafe_hash=True,
+            lazy_methods=True,
+        )
+        class C:
+            x = attr.ib()
+            y = attr.ib()
+
+        for name in ("__repr__", "__eq__", "__ne__", "__lt__", "__hash__"):
+            assert isinstance(C.__dict__[name], _LazyMethods)
+
+        assert "C(x=1, y=2)" == repr(C(1, 2))
+        assert C(1, 2) == C(1, 2)
+        assert C(1, 2) != C(1, 3)
+        assert C(1, 2) < C(1, 3)
+        assert C(1, 3) >= C(1, 2)
+        assert hash(C(1, 2)) == hash(C(1, 2))
+
+        for name in ("__repr__", "__eq__", "__ne__", "__lt__", "__hash__"):
+            meth = C.__dict__[name]
+
+            assert not isinstance(meth, _LazyMethods)
+            assert C.__qualname__ + "." + name == meth.__qualname__
+
+    def test_siblings(self):
+        """
+        Accessing one of the ordering methods materializes all of them.
+        """
+
+        @attr.s(order=True, lazy_methods=True)
+        class C:
+            x = attr.ib()
+
+        assert C(1) < C(2)
+
+        for name in ("__lt__", "__le__", "__gt__", "__ge__"):
+            assert not isinstance(C.__dict__[name], _LazyMethods)
+
+        assert isinstance(C.__dict__["__repr__"], _LazyMethods)
+
+    def test_subclass_materializes_base(self):
+        """
+        Using a lazy method through a subclass replaces it on the base class
+        that defines it.
+        """
+
+        @attr.s(lazy_methods=True)
+        class Base:
+            x = attr.ib()
+
+        class Sub(Base):
+            pass
+
+        assert "Sub(x=1)" == repr(Sub(1))
+        assert "__repr__" not in Sub.__dict__
+        assert not isinstance(Base.__dict__["__repr__"], _LazyMethods)
+
+    def test_make_called_once(self):
+        """
+        *make* is called with the defining class exactly once.
+        """
+        calls = []
+
+        def make(cls):
+            calls.append(cls)
+            return {"__repr__": lambda self: "lazy"}
+
+        class C:
+            __repr__ = _LazyMethods("__repr__", make)
+
+        assert "lazy" == repr(C())
+        assert "lazy" == repr(C())
+        assert [C] == calls
+        assert "TestLazyMethods.test_make_called_once.<locals>.C.__repr__" == (
+            C.__repr__.__qualname__
+        )
+
+    def test_dunders_like_eager(self):
+        """
+        Lazily generated methods get the same __module__, __qualname__, and
+        __doc__ as eagerly generated ones.
+        """
+
+        def make(lazy):
+            @attr.s(order=True, lazy_methods=lazy)
+            class C:
+                x = attr.ib()
+
+            return C
+
+        lazy, eager = make(True), make(False)
+
+        for name in ("__repr__", "__eq__", "__lt__"):
+            getattr(lazy, name)
+            lazy_meth, eager_meth = lazy.__dict__[name], eager.__dict__[name]
+
+            for dunder in ("__module__", "__qualname__", "__doc__"):
+                assert getattr(eager_meth, dunder) == getattr(
+                    lazy_meth, dunder
+                )
+
+    def test_eager_by_default(self):
+        """
+        Without lazy_methods, methods are generated eagerly.
+        """
+
+        @attr.s
+        class C:
+            x = attr.ib()
+
+        assert not isinstance(C.__dict__["__repr__"], _LazyMethods)
+
+    def test_repr(self):
+        """
+        The stand-ins have a helpful repr.
+        """
+        assert "<lazy attrs method '__eq__'>" == repr(
+            _LazyMethods("__eq__", None)
+        )
+
+
+class TestDefer:
+    """
+    Tests for *defer* and `finalize_module`.
+    """
+
+    @pytest.mark.parametrize("slots", [True, False])
+    def test_instantiation_finalizes(self, slots):
+        """
+        Deferred classes are built on first instantiation.
+        """
+
+        @attr.s(slots=slots, defer=True)
+        class C:
+            x = attr.ib()
+
+        assert isinstance(C.__dict__["x"], _CountingAttr)
+
+        i = C(1)
+
+        assert 1 == i.x
+        assert "C(x=1)" == repr(i)
+        assert "__attrs_deferred__" not in C.__dict__
+        assert slots is hasattr(type(i), "__slots__")
+
+    @pytest.mark.parametrize("slots", [True, False])
+    def test_fields_finalizes(self, slots):
+        """
+        Asking for the fields of a deferred class builds it.
+        """
+
+        @attr.s(slots=slots, defer=True)
+        class C:
+            x = attr.ib()
+
+        assert ("x",) == tuple(a.name for a in fields(C))
+        assert "__attrs_deferred__" not in C.__dict__
+
+    def test_finalized_once(self):
+        """
+        The build function is called exactly once and its result is cached.
+        """
+        calls = []
+
+        class C:
+            pass
+
+        def build(cls):
+            calls.append(cls)
+            cls.__attrs_attrs__ = ()
+            return cls
+
+        d = _DeferredBuild(C, build)
+        d.install(slots=False)
+
+        assert C is d.finalize()
+        assert C is d.finalize()
+        assert [C] == calls
+
+    def test_keeps_own_init(self):
+        """
+        Stand-ins don't clobber an `__init__` defined on the class.
+        """
+
+        class C:
+            def __init__(self):
+                self.x = 42
+
+        def build(cls):
+            cls.__attrs_attrs__ = ()
+            return cls
+
+        _DeferredBuild(C, build).install(slots=False)
+
+        assert 42 == C().x
+
+    def test_subclass_dict_class(self):
+        """
+        Deferred dict classes can be subclassed before they're finalized.
+        """
+
+        @attr.s(defer=True)
+        class Base:
+            x = attr.ib()
+
+        class Sub(Base):
+            pass
+
+        @attr.s
+        class Sub2(Base):
+            y = attr.ib()
+
+        assert isinstance(Sub(1), Sub)
+        assert 1 == Sub(1).x
+        assert (1, 2) == attr.astuple(Sub2(1, 2))
+
+    def test_subclass_slotted_class_before_finalizing(self):
+        """
+        Subclassing deferred slotted classes before they're finalized raises
+        a TypeError, because their instances would lack the slots.
+        """
+
+        @attr.s(slots=True, defer=True)
+        class Base:
+            x = attr.ib()
+
+        with pytest.raises(TypeError, match="can only be subclassed after"):
+
+            class Sub(Base):
+                pass
+
+        with pytest.raises(TypeError, match="can only be subclassed after"):
+
+            @attr.s(slots=True)
+            class Sub2(Base):
+                y = attr.ib()
+
+    def test_subclass_slotted_class_after_finalizing(self):
+        """
+        The finalized class can be subclassed, but the replaced one can't.
+        """
+
+        @attr.s(slots=True, defer=True)
+        class Base:
+            x = attr.ib()
+
+        built = type(Base(1))
+
+        @attr.s(slots=True)
+        class Sub(built):
+            y = attr.ib()
+
+        s = Sub(1, 2)
+
+        assert isinstance(s, Sub)
+        assert (1, 2) == attr.astuple(s)
+
+        with pytest.raises(TypeError, match="has been replaced"):
+
+            class Sub2(Base):
+                pass
+
+    def test_finalize_module(self, monkeypatch):
+        """
+        finalize_module builds all deferred classes of a module and rebinds
+        the names of slotted classes that have been replaced.
+        """
+        mod = types.ModuleType("attrs_defer_test_mod")
+        monkeypatch.setitem(sys.modules, mod.__name__, mod)
+
+        @attr.s(slots=True, defer=True)
+        class C:
+            x = attr.ib()
+
+        C.__qualname__ = "C"
+        C.__module__ = mod.__name__
+        mod.C = C
+
+        assert mod is finalize_module(mod.__name__)
+        assert mod.C is not C
+        assert "__slots__" in mod.C.__dict__
+        assert isinstance(C(1), mod.C)
+        assert fields(C) == fields(mod.C)
+
+
+@attr.s(frozen=True, slots=True, intern=True)
+class Interned:
+    x = attr.ib()
+    y = attr.ib(converter=int, default=0)
+
+
+def _increment(value):
+    return value + 1
+
+
+@attr.s(frozen=True, slots=True, intern=True, cache_hash=True, hash=True)
+class InternedIncremented:
+    x = attr.ib(converter=_increment)
+
+
+class TestIntern:
+    """
+    Tests for *intern*.
+    """
+
+    def test_identical(self):
+        """
+        Instances with identical field values are the same object -- also
+        after conversion.
+        """
+        i = Interned(1, "2")
+
+        assert i is Interned(1, 2)
+        assert i is Interned(x=1, y=2.0)
+        assert i is not Interned(2, 2)
+        assert "Interned(x=1, y=2)" == repr(i)
+
+    def test_value_types(self):
+        """
+        Equal values of different types aren't interned to the same object.
+        """
+        i = Interned(1)
+
+        assert i is not Interned(True)
+        assert i == Interned(1.0)
+        assert True is Interned(True).x
+
+    @pytest.mark.parametrize(
+        ("a", "b"),
+        [
+            (0.0, -0.0),
+            ((1,), (1.0,)),
+            (frozenset([1]), frozenset([1.0])),
+            (1j, complex(1, -0.0)),
+        ],
+    )
+    def test_equal_but_distinguishable(self, a, b):
+        """
+        Values that are equal but distinguishable aren't merged.
+        """
+        assert Interned(a) is Interned(a)
+        assert Interned(a) is not Interned(b)
+        assert repr(b) == repr(Interned(b).x)
+
+    def test_unsupported_types(self):
+        """
+        Instances with values of types whose equality doesn't imply that
+        they're interchangeable aren't interned.
+        """
+        a = Interned(decimal.Decimal("1.0"))
+        b = Interned(decimal.Decimal("1.00"))
+
+        assert a is not b
+        assert "1.00" == str(b.x)
+        assert Interned(a) is not Interned(a)
+
+    def test_weak(self):
+        """
+        Interned instances can be garbage-collected.
+        """
+        ref = weakref.ref(Interned("gone"))
+        gc.collect()
+
+        assert None is ref()
+
+    def test_unhashable(self):
+        """
+        Instances with unhashable values aren't interned.
+        """
+        assert [1] == Interned([1]).x
+        assert Interned([1]) is not Interned([1])
+
+    @pytest.mark.parametrize(
+        "dup",
+        [copy.copy, copy.deepcopy, lambda i: pickle.loads(pickle.dumps(i))],
+    )
+    def test_copies_are_interned(self, dup):
+        """
+        Copying and unpickling interned instances returns the interned
+        instances.
+        """
+        i = Interned(1, 2)
+
+        assert i is dup(i)
+
+    @pytest.mark.parametrize(
+        "dup",
+        [copy.copy, copy.deepcopy, lambda i: pickle.loads(pickle.dumps(i))],
+    )
+    def test_copies_keep_converted_values(self, dup):
+        """
+        Copying and unpickling don't run converters again, also if the
+        instance isn't interned.
+        """
+        i = InternedIncremented(1)
+        d = InternedIncremented(decimal.Decimal("1.0"))
+        d_dup = dup(d)
+
+        assert 2 == i.x
+        assert i is dup(i)
+        assert d is not d_dup
+        assert "2.0" == str(d_dup.x)
+        assert hash(d) == hash(d_dup)
+
+    def test_signature(self):
+        """
+        The signature of interned classes is the one of the generated
+        __init__.
+        """
+        assert "(x, y=0)" == str(inspect.signature(Interned))
+        assert "(self, x, y=0) -> None" == str(
+            inspect.signature(Interned.__init__)
+        )
+
+    def test_subclass(self):
+        """
+        Subclasses with their own __init__ aren't interned, plain ones are.
+        """
+
+        @attr.s(frozen=True, slots=True)
+        class Sub(Interned):
+            z = attr.ib(default=3)
+
+        class Plain(Interned):
+            pass
+
+        assert Sub(1) is not Sub(1)
+        assert 3 == copy.copy(Sub(1)).z
+        assert Plain(1) is Plain(1)
+        assert Plain(1) is not Interned(1)
+
+    @pytest.mark.parametrize(
+        "kw", [{"frozen": False}, {"slots": True, "weakref_slot": False}]
+    )
+    def test_invalid(self, kw):
+        """
+        Raise TypeError if the class isn't frozen or instances can't be
+        referenced weakly.
+        """
+        with pytest.raises(TypeError, match="Invalid value for intern"):
+
+            @attr.s(intern=True, **{"frozen": True, **kw})
+            class C:
+                x = attr.ib()
+
+
 class TestInitAlias:
     """
     Tests for Attribute alias handling.
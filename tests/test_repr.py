@@ -0,0 +1,175 @@
+# SPDX-License-Identifier: MIT
+
+"""
+Tests for `attr._repr`.
+"""
+
+import threading
+
+import attr
+
+from attr import _repr
+
+
+@attr.define
+class Node:
+    value: int
+    children: list = attr.Factory(list)
+
+
+@attr.define(repr_limit=attr.ReprLimit(length=50, items=2, depth=2))
+class Bounded:
+    x: object
+
+
+class Counting:
+    """
+    Counts how often it has been repr'ed.
+    """
+
+    count = 0
+
+    def __repr__(self):
+        Counting.count += 1
+        return "Counting()"
+
+
+class TestReprLimit:
+    def test_defaults(self):
+        """
+        The defaults are reasonable for logging.
+        """
+        assert (1000, 10, 4) == attr.ReprLimit()
+
+    def test_inactive(self):
+        """
+        Without a limit, the full repr is returned.
+        """
+        assert (
+            "Node(value=1, children=[0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10])"
+            == repr(Node(1, list(range(11))))
+        )
+
+    def test_items(self):
+        """
+        Containers are cut off after *items* items.
+        """
+        with attr.repr_limit(items=3):
+            assert "Node(value=1, children=[0, 1, 2, ...])" == repr(
+                Node(1, list(range(1_000_000)))
+            )
+
+    def test_depth(self):
+        """
+        Instances and containers that are nested deeper than *depth* are
+        elided.
+        """
+        tree = Node(0, [Node(1, [Node(2, [Node(3)])])])
+
+        with attr.repr_limit(depth=2):
+            assert "Node(value=0, children=[Node(...)])" == repr(tree)
+
+    def test_length(self):
+        """
+        The repr never exceeds *length*.
+        """
+        with attr.repr_limit(length=20) as limit:
+            r = repr(Node(1, ["x" * 100] * 5))
+
+        assert 20 == limit.length
+        assert 20 == len(r)
+        assert r.endswith("...")
+
+    def test_stops_walking(self):
+        """
+        Once the length is used up, remaining items aren't repr'ed at all.
+        """
+        Counting.count = 0
+
+        with attr.repr_limit(length=30, items=1000):
+            repr(Node(1, [Counting() for _ in range(1000)]))
+
+        assert Counting.count < 10
+
+    def test_custom_field_repr(self):
+        """
+        Custom field reprs are cut to the remaining length and charged
+        against it.
+        """
+        Counting.count = 0
+
+        @attr.define
+        class C:
+            x: str = attr.field(repr=lambda v: v * 100)
+            y: list = attr.Factory(lambda: [Counting() for _ in range(100)])
+
+        with attr.repr_limit(length=30, items=1000):
+            r = repr(C("x"))
+
+        assert 30 == len(r)
+        assert r.startswith("C(x=xxxx")
+        assert 0 == Counting.count
+
+    def test_nested_blocks(self):
+        """
+        The innermost block wins and the outer limit is restored on exit.
+        """
+        with attr.repr_limit(items=1):
+            with attr.repr_limit(items=2):
+                assert "Node(value=0, children=[0, 1, ...])" == repr(
+                    Node(0, [0, 1, 2])
+                )
+
+            assert "Node(value=0, children=[0, ...])" == repr(
+                Node(0, [0, 1, 2])
+            )
+
+        assert 0 == _repr.active
+        assert None is _repr.current()
+
+    def test_thread_local(self):
+        """
+        Blocks only affect the thread that entered them.
+        """
+        rv = []
+        node = Node(0, [0, 1, 2])
+
+        with attr.repr_limit(items=1):
+            t = threading.Thread(target=lambda: rv.append(repr(node)))
+            t.start()
+            t.join()
+
+        assert ["Node(value=0, children=[0, 1, 2])"] == rv
+
+    def test_class_option(self):
+        """
+        Classes with repr_limit are always bounded.
+        """
+        assert "Bounded(x=[0, 1, ...])" == repr(Bounded([0, 1, 2]))
+        assert "Bounded(x=[[...]])" == repr(Bounded([[[1]]]))
+
+    def test_class_option_true(self):
+        """
+        repr_limit=True uses the default limits.
+        """
+
+        @attr.define(repr_limit=True)
+        class C:
+            x: list
+
+        assert "C(x=[0, 1, 2, 3, 4, 5, 6, 7, 8, 9, ...])" == repr(
+            C(list(range(100)))
+        )
+
+    def test_custom_field_repr(self):
+        """
+        Fields with custom reprs and repr=False are honored.
+        """
+
+        @attr.define
+        class C:
+            x: int = attr.field(repr=lambda v: "X")
+            y: int = attr.field(repr=False)
+
+        with attr.repr_limit():
+            assert "C(x=X)" == repr(C(1, 2))
@@ -5,13 +5,18 @@ Tests for `attr.validators`.
 """
 
 
+import gc
+import pickle
 import re
+import sys
+import weakref
 
 import pytest
 
 import attr
 
 from attr import _config, fields, has
+from attr._make import _fmt_validation
 from attr import validators as validator_module
 from attr.validators import (
     _subclass_of,
@@ -31,6 +36,7 @@ from attr.validators import (
     not_,
     optional,
     or_,
+    TrackedList,
 )
 
 from .utils import simple_attr
@@ -147,6 +153,103 @@ class TestInstanceOf:
         v = instance_of(int)
         assert ("<instance_of validator for type <class 'int'>>") == repr(v)
 
+    def test_cache(self):
+        """
+        With cache=True, classes whose instances passed are remembered and
+        not checked again.
+        """
+        checked = []
+
+        class Meta(type):
+            def __instancecheck__(cls, instance):
+                checked.append(instance)
+                return isinstance(instance, int)
+
+        v = instance_of(Meta("Ints", (), {}), cache=True)
+        a = simple_attr("test")
+
+        v(None, a, 1)
+        v(None, a, 2)
+
+        assert [1] == checked
+        assert [int] == list(v._valid_classes)
+        assert repr(instance_of(int)) == repr(instance_of(int, cache=True))
+        assert instance_of(int) == instance_of(int, cache=True)
+
+    def test_cache_fail(self):
+        """
+        Failures are neither remembered nor hidden by the cache.
+        """
+        v = instance_of(int, cache=True)
+        a = simple_attr("test")
+
+        for _ in range(2):
+            with pytest.raises(TypeError):
+                v(None, a, "42")
+
+        assert [] == list(v._valid_classes)
+
+    def test_cache_weak(self):
+        """
+        Remembered classes can be garbage-collected.
+        """
+        v = instance_of(object, cache=True)
+
+        class C:
+            pass
+
+        v(None, simple_attr("test"), C())
+        del C
+        gc.collect()
+
+        assert [] == list(v._valid_classes)
+
+    def test_cache_bounded(self, monkeypatch):
+        """
+        Only the most recent classes are remembered.
+        """
+        monkeypatch.setattr(validator_module, "_TYPE_CACHE_SIZE", 2)
+        v = instance_of(object, cache=True)
+
+        for value in (1, "2", 3.0):
+            v(None, simple_attr("test"), value)
+
+        assert [str, float] == list(v._valid_classes)
+
+    def test_cache_proxy(self):
+        """
+        Values whose __class__ lies about their type aren't remembered.
+        """
+
+        class Proxy:
+            __class__ = int
+
+        v = instance_of(int, cache=True)
+        v(None, simple_attr("test"), Proxy())
+
+        assert [] == list(v._valid_classes)
+
+    def test_pickle(self):
+        """
+        Caching validators -- and fields that use them -- can be pickled.  The
+        cache isn't pickled, but the unpickled validator caches, too.
+        """
+        v = instance_of(int, cache=True)
+        a = simple_attr("test", validator=v)
+        v(None, a, 1)
+
+        a2 = pickle.loads(pickle.dumps(a))
+
+        assert v == a2.validator
+        assert [] == list(a2.validator._valid_classes)
+
+        a2.validator(None, a2, 1)
+
+        assert [int] == list(a2.validator._valid_classes)
+        assert (
+            None is pickle.loads(pickle.dumps(instance_of(int)))._valid_classes
+        )
+
 
 class TestMatchesRe:
     """
@@ -242,6 +345,25 @@ class TestMatchesRe:
         """
         matches_re("a", func=func)
 
+    def test_shared(self):
+        """
+        Validators -- and therefore compiled patterns -- are shared for equal
+        arguments.
+        """
+        assert matches_re("a") is matches_re("a", 0, re.fullmatch)
+        assert matches_re("a") is not matches_re("a", re.IGNORECASE)
+        assert matches_re("a") is not matches_re("a", func=re.search)
+
+    def test_inline(self):
+        """
+        Matching is inlined into generated code.
+        """
+        globs = {}
+        check = matches_re("a+")._fmt_inline_check("value", "v", globs)
+
+        assert eval(check, globs, {"value": "aa"})
+        assert not eval(check, globs, {"value": "ab"})
+
     def test_repr(self):
         """
         __repr__ is meaningful.
@@ -300,6 +422,89 @@ class TestAnd:
 
         assert C.__attrs_attrs__[0].validator == C.__attrs_attrs__[1].validator
 
+    def test_flatten_and_dedupe(self):
+        """
+        Nested and_ validators are flattened and equal validators are only
+        kept the first time they appear.
+        """
+        v = and_(
+            instance_of(int),
+            and_(lt(3), always_pass, and_(instance_of(int))),
+            lt(3),
+        )
+
+        assert (instance_of(int), lt(3), always_pass) == v._validators
+
+    def test_compiled(self):
+        """
+        The validators are compiled into a single function on first use that
+        calls them only if their inline checks fail.
+        """
+        calls = []
+
+        def record(_, __, value):
+            calls.append(value)
+
+        v = and_(instance_of(int), record, lt(3))
+        a = simple_attr("test")
+
+        assert None is v._compiled
+
+        v(None, a, 1)
+
+        assert v._compiled is not None
+        assert [1] == calls
+
+        with pytest.raises(TypeError, match="must be <class 'int'>"):
+            v(None, a, "1")
+        with pytest.raises(ValueError, match="must be < 3"):
+            v(None, a, 3)
+
+        assert [1, 3] == calls
+
+    def test_pickle(self):
+        """
+        Compiled validators -- and fields that use them -- can be pickled and
+        are compiled again after unpickling.
+        """
+        v = and_(instance_of(int), lt(3))
+        a = simple_attr("test", validator=v)
+        v(None, a, 1)
+
+        a2 = pickle.loads(pickle.dumps(a))
+
+        assert v == a2.validator
+        assert None is a2.validator._compiled
+
+        with pytest.raises(ValueError, match="must be < 3"):
+            a2.validator(None, a2, 3)
+
+    def test_inline_members(self):
+        """
+        Members of and_ validators are laid out one after another in
+        generated code.
+        """
+        v = and_(instance_of(int), always_pass)
+
+        assert [
+            "if not (isinstance(value, __attr_validator_x_0_type)):",
+            "    __attr_validator_x_0(self, __attr_x, value)",
+            "__attr_validator_x_1(self, __attr_x, value)",
+        ] == _fmt_validation(simple_attr("x", validator=v), "value", {})
+
+    def test_optional_inline(self):
+        """
+        optional() of and_ validators is checked inline if all members can be.
+        """
+        globs = {}
+        check = optional([instance_of(int), lt(3)])._fmt_inline_check(
+            "value", "v", globs
+        )
+
+        assert eval(check, globs, {"value": None})
+        assert eval(check, globs, {"value": 2})
+        assert not eval(check, globs, {"value": 3})
+
 
 @pytest.mark.parametrize(
     "validator",
@@ -466,6 +671,17 @@ def _member_validator(request):
     return request.param
 
 
+def _recorder(seen):
+    """
+    Return a validator that records all values it's called with in *seen*.
+    """
+
+    def record(inst, attr, value):
+        seen.append(value)
+
+    return record
+
+
 class TestDeepIterable:
     """
     Tests for `deep_iterable`.
@@ -622,6 +838,208 @@ class TestDeepIterable:
 
         assert expected_repr == repr(v)
 
+    def test_repr_options(self):
+        """
+        *sample* and *cache* are part of the `__repr__` if set.
+        """
+        v = deep_iterable(instance_of(int), sample=3, cache=True)
+
+        assert repr(v).endswith(" (sampling 3) (cached)>")
+
+    def test_sample(self):
+        """
+        If *sample* is set, only that many members of sized iterables are
+        validated, in their original order.
+        """
+        seen = []
+        v = deep_iterable(_recorder(seen), sample=3)
+
+        v(None, simple_attr("test"), list(range(100)))
+        v(None, simple_attr("test"), {1, 2})
+
+        assert 5 == len(seen)
+        assert sorted(seen[:3]) == seen[:3]
+        assert {1, 2} == set(seen[3:])
+
+    def test_sample_unsized(self):
+        """
+        Unsized iterables are validated completely.
+        """
+        seen = []
+        v = deep_iterable(_recorder(seen), sample=1)
+
+        v(None, simple_attr("test"), iter([1, 2, 3]))
+
+        assert [1, 2, 3] == seen
+
+    @pytest.mark.parametrize("value", [(1, 2), frozenset([1, 2])])
+    def test_cache(self, value):
+        """
+        If *cache* is set, immutable containers are only validated on their
+        first assignment.
+        """
+        seen = []
+        v = deep_iterable(_recorder(seen), cache=True)
+        a = simple_attr("test")
+
+        v(None, a, value)
+        v(None, a, value)
+
+        assert 2 == len(seen)
+
+    def test_cache_mutable(self):
+        """
+        Mutable containers are always validated.
+        """
+        seen = []
+        v = deep_iterable(_recorder(seen), cache=True)
+        value = [1, 2]
+
+        v(None, simple_attr("test"), value)
+        v(None, simple_attr("test"), value)
+
+        assert [1, 2, 1, 2] == seen
+
+    def test_cache_bounded(self, monkeypatch):
+        """
+        Only the most recently validated containers are remembered.
+        """
+        monkeypatch.setattr(validator_module, "_DEEP_CACHE_SIZE", 2)
+        v = deep_iterable(instance_of(int), cache=True)
+        values = [(i,) for i in range(3)]
+
+        for value in values:
+            v(None, simple_attr("test"), value)
+
+        assert [id(values[1]), id(values[2])] == list(v._seen)
+
+    def test_cache_doesnt_keep_alive(self):
+        """
+        Remembered containers aren't kept alive by the cache.
+        """
+        v = deep_iterable(instance_of(int), cache=True)
+        a = simple_attr("test")
+        fs = frozenset(range(10))
+        t = tuple(range(10))
+        refs = sys.getrefcount(t)
+
+        v(None, a, fs)
+        v(None, a, t)
+
+        assert refs == sys.getrefcount(t)
+
+        ref = weakref.ref(fs)
+        del fs
+        gc.collect()
+
+        assert None is ref()
+
+    def test_cache_recognizes_changed_tuples(self):
+        """
+        Tuples that differ from a remembered one in length or in their first
+        or last member are validated even if they have its id.
+        """
+        v = deep_iterable(instance_of(int), cache=True)
+        a = simple_attr("test")
+        t = (1, 2, 3)
+        v(None, a, t)
+
+        for other in [(1, "2", 2, 3), (1, 2, "3"), ("1", 2, 3)]:
+            v._seen[id(other)] = v._seen[id(t)]
+
+            with pytest.raises(TypeError):
+                v(None, a, other)
+
+    def test_pickle(self):
+        """
+        Caching validators can be pickled, but their cache isn't.
+        """
+        v = deep_iterable(instance_of(int), cache=True)
+        v(None, simple_attr("test"), frozenset([1]))
+
+        v2 = pickle.loads(pickle.dumps(v))
+
+        assert v == v2
+        assert {} == v2._seen
+
+    def test_tracked_list(self):
+        """
+        Only members of a `TrackedList` that have been appended since its last
+        validation are validated.
+        """
+        seen = []
+        v = deep_iterable(_recorder(seen))
+        a = simple_attr("test")
+        value = TrackedList([1, 2])
+
+        v(None, a, value)
+        value.append(3)
+        value.extend([4])
+        value += [5]
+        v(None, a, value)
+
+        assert [1, 2, 3, 4, 5] == seen
+
+    @pytest.mark.parametrize(
+        "modify",
+        [
+            lambda tl: tl.__setitem__(0, 3),
+            lambda tl: tl.__delitem__(0),
+            lambda tl: tl.insert(0, 3),
+            lambda tl: tl.pop(),
+            lambda tl: tl.remove(1),
+            lambda tl: tl.sort(),
+            lambda tl: tl.reverse(),
+            lambda tl: tl.clear(),
+        ],
+    )
+    def test_tracked_list_reset(self, modify):
+        """
+        Modifications other than appending make the next validation start
+        from scratch.
+        """
+        seen = []
+        v = deep_iterable(_recorder(seen))
+        a = simple_attr("test")
+        value = TrackedList([1, 2])
+
+        v(None, a, value)
+        modify(value)
+        del seen[:]
+        v(None, a, value)
+
+        assert list(value) == seen
+
+    def test_tracked_list_other_validator(self):
+        """
+        A `TrackedList` that has been validated by a different validator is
+        validated completely.
+        """
+        seen = []
+        a = simple_attr("test")
+        value = TrackedList([1, 2])
+
+        deep_iterable(instance_of(int))(None, a, value)
+        deep_iterable(_recorder(seen))(None, a, value)
+
+        assert [1, 2] == seen
+
+    def test_tracked_list_invalid(self):
+        """
+        Invalid members are caught and don't count as validated.
+        """
+        v = deep_iterable(instance_of(int))
+        a = simple_attr("test")
+        value = TrackedList([1])
+
+        v(None, a, value)
+        value.append("2")
+
+        with pytest.raises(TypeError):
+            v(None, a, value)
+        with pytest.raises(TypeError):
+            v(None, a, value)
+
 
 class TestDeepMapping:
     """
@@ -722,6 +1140,18 @@ class TestDeepMapping:
         )
         assert expected_repr == repr(v)
 
+    def test_sample(self):
+        """
+        If *sample* is set, only that many items are validated.
+        """
+        seen = []
+        v = deep_mapping(_recorder(seen), instance_of(int), sample=3)
+
+        v(None, simple_attr("test"), {str(i): i for i in range(100)})
+
+        assert 3 == len(seen)
+        assert repr(v).endswith(" (sampling 3)>")
+
 
 class TestIsCallable:
     """
@@ -1304,6 +1734,109 @@ class TestOr:
         with pytest.raises(ValueError):
             v(None, simple_attr("test"), 42)
 
+    def test_flatten(self):
+        """
+        Nested or_ validators are flattened.
+        """
+        v = or_(instance_of(int), or_(instance_of(str), always_pass))
+
+        assert (
+            instance_of(int),
+            instance_of(str),
+            always_pass,
+        ) == v.validators
+
+    def test_inline_checks_dont_raise(self):
+        """
+        Built-in validators are checked using a compiled predicate, so other
+        validators aren't called if one of them is satisfied.
+        """
+        calls = []
+
+        def record(_, __, value):
+            calls.append(value)
+            raise ValueError
+
+        v = or_(record, instance_of(int), instance_of(str))
+        a = simple_attr("test")
+
+        v(None, a, 1)
+        v(None, a, "1")
+
+        assert [] == calls
+
+        with pytest.raises(ValueError, match="None of"):
+            v(None, a, 1.0)
+
+        assert [1.0] == calls
+
+    @pytest.mark.parametrize(
+        ("v", "value"),
+        [
+            (or_(lt(5), instance_of(str)), "abc"),
+            (or_(max_len(3), instance_of(int)), 12345),
+            (or_(matches_re("a+"), instance_of(int)), 1),
+        ],
+    )
+    def test_inline_checks_of_wrong_type(self, v, value):
+        """
+        Members whose inline checks raise for values of the wrong type don't
+        prevent other members from accepting them.
+        """
+        v(None, simple_attr("test"), value)
+
+    def test_inline_checks_of_wrong_type_in_init(self):
+        """
+        The same holds if the validator is checked inline in ``__init__``.
+        """
+
+        @attr.s
+        class C:
+            x = attr.ib(validator=or_(lt(5), instance_of(str)))
+            y = attr.ib(validator=or_(max_len(3), instance_of(int)))
+
+        C("abc", 12345)
+        C(1, "ab")
+
+        with pytest.raises(ValueError, match="None of"):
+            C(5, 1)
+
+    def test_adaptive_order(self):
+        """
+        Validators that succeed move to the front, but the error message
+        keeps the original order.
+        """
+
+        def is_dict(_, __, value):
+            if not isinstance(value, dict):
+                raise TypeError
+
+        v = or_(always_fail, instance_of(int), is_dict)
+        a = simple_attr("test")
+
+        v(None, a, {})
+        v(None, a, {})
+
+        assert is_dict is v._order[0]
+        assert (always_fail, instance_of(int), is_dict) == v.validators
+
+    def test_pickle(self):
+        """
+        Compiled validators can be pickled and are compiled again after
+        unpickling.
+        """
+        v = or_(instance_of(int), lt(3), always_pass)
+        a = simple_attr("test", validator=v)
+        v(None, a, "1")
+
+        a2 = pickle.loads(pickle.dumps(a))
+
+        assert v == a2.validator
+        assert None is a2.validator._check
+        assert () == a2.validator._order
+
+        a2.validator(None, a2, "1")
+
     def test_repr(self):
         """
         Returned validator has a useful `__repr__`.
@@ -1313,3 +1846,181 @@ class TestOr:
             "<or validator wrapping (<instance_of validator for type "
             "<class 'int'>>, <instance_of validator for type <class 'str'>>)>"
         ) == repr(v)
+
+
+class TestValidateMany:
+    """
+    Tests for the ``validate_many`` methods of the built-in validators.
+    """
+
+    CASES = [
+        (instance_of(int), [1, True, 3], [1, "2", 3.0]),
+        (matches_re("a+"), ["a", "aa"], ["a", "b", "c"]),
+        (in_([1, 2]), [1, 2, 2], [1, 3, 4]),
+        (in_([1, [2]]), [1, [2]], [1, [3]]),
+        (in_("abc"), ["a", "bc"], ["a", "ac"]),
+        (lt(3), [0, 1, 2], [0, 3, 4]),
+        (le(3), [1, 3], [4, 5]),
+        (ge(3), [3, 4], [2, 1]),
+        (gt(3), [4, 5], [4, 3]),
+        (max_len(2), ["", "ab"], ["a", "abc", "abcd"]),
+        (min_len(2), ["ab", "abc"], ["abc", "a", ""]),
+    ]
+
+    @pytest.mark.parametrize(("v", "valid", "invalid"), CASES)
+    def test_valid(self, v, valid, invalid):
+        """
+        Nothing happens if all values are valid -- no matter whether they're
+        a collection or a one-shot iterator.
+        """
+        a = simple_attr("test")
+
+        v.validate_many(a, valid)
+        v.validate_many(a, iter(valid))
+        v.validate_many(a, [])
+
+    @pytest.mark.parametrize(("v", "valid", "invalid"), CASES)
+    def test_invalid(self, v, valid, invalid):
+        """
+        Raises the same exception as calling the validator with the first
+        invalid value.
+        """
+        a = simple_attr("test")
+        first_invalid = next(i for i in invalid if not _passes(v, a, i))
+
+        with pytest.raises(Exception) as expected:
+            v(None, a, first_invalid)
+
+        for values in (invalid, iter(invalid)):
+            with pytest.raises(expected.type) as e:
+                v.validate_many(a, values)
+
+            assert expected.value.args == e.value.args
+
+    def test_numpy(self):
+        """
+        NumPy arrays of numbers are compared in one go.
+        """
+        np = pytest.importorskip("numpy")
+        a = simple_attr("test")
+
+        lt(10).validate_many(a, np.arange(10))
+
+        with pytest.raises(ValueError, match="'test' must be < 5: 5"):
+            lt(5).validate_many(a, np.arange(10))
+
+
+class TestInlineCheck:
+    """
+    Tests for inlining built-in validators into generated code using
+    `attr._make._fmt_validation`.
+    """
+
+    CASES = [
+        *TestValidateMany.CASES,
+        (optional(instance_of(int)), [None, 1], ["1", None]),
+        (optional(lt(3)), [None, 2], [3]),
+        (in_(frozenset({"a", 1})), ["a", 1, 1.0, True], [[], "b"]),
+        (instance_of(int, cache=True), [1, True, 2], ["1", None]),
+    ]
+
+    def _make_validate(self, v):
+        a = simple_attr("x", validator=v)
+        globs = {}
+        lines = _fmt_validation(a, "value", globs)
+        locs = {}
+        script = "def validate(self, value):\n" + "".join(
+            f"    {line}\n" for line in lines
+        )
+        exec(script, globs, locs)
+
+        return lines, locs["validate"]
+
+    @pytest.mark.parametrize(("v", "valid", "invalid"), CASES)
+    def test_like_call(self, v, valid, invalid):
+        """
+        The inline check accepts the same values and raises the same
+        exceptions as calling the validator.
+        """
+        _, validate = self._make_validate(v)
+        a = simple_attr("x", validator=v)
+
+        for value in valid:
+            validate(None, value)
+
+        for value in invalid:
+            if _passes(v, a, value):
+                continue
+
+            with pytest.raises(Exception) as expected:
+                v(None, a, value)
+            with pytest.raises(expected.type) as e:
+                validate(None, value)
+
+            assert expected.value.args[0] == e.value.args[0]
+
+    @pytest.mark.parametrize(
+        "v",
+        [
+            instance_of(int),
+            optional(instance_of(int)),
+            lt(1),
+            in_([1, "a", None]),
+            max_len(1),
+            min_len(1),
+        ],
+    )
+    def test_inlined(self, v):
+        """
+        The validator is only called if the inline check fails.
+        """
+        lines, _ = self._make_validate(v)
+
+        assert lines[0].startswith("if not (")
+        assert "    __attr_validator_x(self, __attr_x, value)" == lines[1]
+
+    def test_unhashable_in(self):
+        """
+        Unhashable values don't make inline `in_` checks blow up.
+        """
+        _, validate = self._make_validate(in_((1, 2)))
+
+        with pytest.raises(ValueError, match="must be in"):
+            validate(None, [])
+
+    @pytest.mark.parametrize(
+        "v", [always_pass, in_((1, [2])), optional(always_pass)]
+    )
+    def test_not_inlined(self, v):
+        """
+        Other validators are called.
+        """
+        lines, _ = self._make_validate(v)
+
+        assert ["__attr_validator_x(self, __attr_x, value)"] == lines
+
+    def test_empty_and(self):
+        """
+        An empty and_ still leads to a valid block body -- in __init__ and in
+        bulk constructors.
+        """
+        lines, validate = self._make_validate(and_())
+
+        assert ["pass"] == lines
+        assert None is validate(None, 1)
+
+        @attr.s
+        class C:
+            x = attr.ib(validator=and_())
+
+        assert 1 == C(1).x
+        assert [1, 2] == [c.x for c in attr.from_rows(C, [(1,), (2,)])]
+
+
+def _passes(v, a, value):
+    try:
+        v(None, a, value)
+    except (TypeError, ValueError):
+        return False
+
+    return True